@@ -0,0 +1,13 @@
+// MathJax settings shared by every translation (src/page_assets.py).
+// A page with its own TeX macros defines window.articleMacros before this script.
+window.MathJax = {
+  loader: {load: ['[tex]/noerrors']},
+  tex: {
+    inlineMath: [['$', '$'], ['\\(', '\\)']],
+    displayMath: [['$$', '$$'], ['\\[', '\\]']],
+    processEscapes: true,
+    tags: 'ams',
+    packages: {'[+]': ['noerrors']},
+    macros: window.articleMacros || {}
+  }
+};
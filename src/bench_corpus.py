@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Benchmark each build stage over the real translations/ corpus.
+
+Stages timed per file: postprocess_html, cleanup_article, extract_content.
+Stages timed for the whole corpus: build_index, and generate_contents.main
+with a cold manifest (every file extracted) and a warm one (nothing changed).
+generate_contents writes to a temporary directory, so the tree is not touched.
+
+Each stage is timed untraced, then run again under tracemalloc for its peak
+memory. Results can be saved as a baseline; later runs are compared against it
+and any stage whose total time or peak memory grew by more than --threshold
+percent is flagged and makes the run exit with status 1.
+
+Usage:
+    python bench_corpus.py                     # compare against the baseline
+    python bench_corpus.py --save-baseline     # record a new baseline
+    python bench_corpus.py --stage cleanup --limit 100 --threshold 20
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import generate_contents
+import link_graph
+from build_search_index import build_index, extract_content
+from cleanup_articles import cleanup_article
+from config import CONFIG
+from date_index import update_date_index
+from manifest import article_id_from_filename, build_record
+from translate import postprocess_html
+
+BASELINE_VERSION = 1
+
+TRANSLATIONS_DIR = CONFIG.translations_dir
+BASELINE_PATH = CONFIG.cache_dir / 'bench_baseline.json'
+
+
+def load_corpus(translations_dir, limit=None):
+    """Read the translation files into memory as (path, content, stat) tuples."""
+    files = sorted(Path(translations_dir).glob('translation_*.html'))
+    if limit:
+        files = files[:limit]
+    return [(f, f.read_text(encoding='utf-8'), f.stat()) for f in files]
+
+
+def per_file_stage(func):
+    """Wrap func(path, content) into a stage returning per-file timings."""
+    def run(corpus):
+        timings = []
+        for path, content, _ in corpus:
+            start = time.perf_counter()
+            func(path, content)
+            timings.append((time.perf_counter() - start, path.name))
+        return timings
+    return run
+
+
+def corpus_stage(func):
+    """Wrap func(corpus) into a stage timed once for the whole corpus."""
+    def run(corpus):
+        start = time.perf_counter()
+        func(corpus)
+        return [(time.perf_counter() - start, None)]
+    return run
+
+
+def build_stages(corpus, workdir):
+    """Return the benchmarked stages as (name, run(corpus) -> timings) pairs.
+
+    generate_contents and the link context read a copy of the corpus written
+    into workdir; generate_contents also writes its output there.
+    """
+    date_index = update_date_index()
+    manifest = {'articles': {}}
+    for path, content, stat in corpus:
+        manifest['articles'][article_id_from_filename(path.name)] = build_record(path, content, stat)
+
+    workdir = Path(workdir)
+    corpus_dir = workdir / 'translations'
+    corpus_dir.mkdir()
+    for path, content, _ in corpus:
+        (corpus_dir / path.name).write_text(content, encoding='utf-8')
+    # Built once, like postprocess_all does, so the stage times postprocessing
+    # itself; from the corpus's copy and manifest, so it links to the corpus
+    links = link_graph.link_context(corpus_dir, manifest=manifest)
+
+    def generate(manifest_path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_contents.main(corpus_dir, workdir / 'index.html', manifest_path)
+
+    def generate_cold(corpus):
+        manifest_path = workdir / 'manifest_cold.json'
+        manifest_path.unlink(missing_ok=True)
+        generate(manifest_path)
+
+    warm_manifest = workdir / 'manifest_warm.json'
+    generate(warm_manifest)
+
+    return [
+        ('postprocess_html', per_file_stage(
+            lambda path, content: postprocess_html(content, article_id_from_filename(path.name), date_index, links=links))),
+        ('cleanup_article', per_file_stage(lambda path, content: cleanup_article(content))),
+        ('extract_content', per_file_stage(lambda path, content: extract_content(content))),
+        ('build_index', corpus_stage(lambda corpus: build_index(manifest))),
+        ('generate_contents (cold)', corpus_stage(generate_cold)),
+        ('generate_contents (warm)', corpus_stage(lambda corpus: generate(warm_manifest))),
+    ]
+
+
+def run_stage(run, corpus, repeat):
+    """Time a stage, then measure its peak memory under tracemalloc."""
+    best = None
+    for _ in range(repeat):
+        timings = run(corpus)
+        if best is None or sum(t for t, _ in timings) < sum(t for t, _ in best):
+            best = timings
+
+    tracemalloc.start()
+    run(corpus)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_file = sorted(best)
+    total = sum(t for t, _ in per_file)
+    result = {'total': total, 'peak_bytes': peak, 'files': len(per_file)}
+    if per_file[-1][1] is not None:
+        result.update({
+            'mean': statistics.mean(t for t, _ in per_file),
+            'p95': per_file[min(len(per_file) - 1, int(len(per_file) * 0.95))][0],
+            'max': per_file[-1][0],
+            'slowest': per_file[-1][1],
+        })
+    return result
+
+
+def load_baseline(baseline_path):
+    """Load the saved baseline, or None if missing or outdated."""
+    baseline_path = Path(baseline_path)
+    if not baseline_path.exists():
+        return None
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    return baseline if baseline.get('version') == BASELINE_VERSION else None
+
+
+def save_baseline(results, file_count, baseline_path):
+    """Write the results as the new baseline."""
+    baseline_path = Path(baseline_path)
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        'version': BASELINE_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'files': file_count,
+        'stages': results,
+    }
+    with open(baseline_path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+
+
+def percent_change(current, previous):
+    """Relative change from previous to current, in percent."""
+    return (current - previous) / previous * 100 if previous else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--stage', help='Only run stages whose name contains this')
+    parser.add_argument('--limit', type=int, help='Only use the first N files (sorted by name)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage, best is kept (default: 3)')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Flag stages more than this many percent slower or larger than the baseline (default: 10)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help=f'Baseline file (default: {BASELINE_PATH})')
+    parser.add_argument('--save-baseline', action='store_true', help='Save this run as the new baseline')
+    parser.add_argument('--translations', default=TRANSLATIONS_DIR, help='Corpus directory')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.translations, args.limit)
+    if not corpus:
+        print(f"No translation files found in {args.translations}")
+        sys.exit(2)
+    corpus_bytes = sum(len(content.encode('utf-8')) for _, content, _ in corpus)
+    print(f"Benchmarking {len(corpus)} files ({corpus_bytes / 1024 / 1024:.1f} MB), best of {args.repeat}\n")
+
+    workdir = tempfile.TemporaryDirectory(prefix='bench_corpus_')
+    stages = [(name, run) for name, run in build_stages(corpus, workdir.name) if not args.stage or args.stage in name]
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    if baseline and baseline['files'] != len(corpus):
+        print(f"Baseline was recorded on {baseline['files']} files, not comparing\n")
+        baseline = None
+
+    print(f"{'stage':<26} {'total s':>8} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8} {'peak MB':>8} {'time':>7} {'memory':>7}")
+    results = {}
+    regressions = []
+    for name, run in stages:
+        result = run_stage(run, corpus, args.repeat)
+        results[name] = result
+
+        time_cell = memory_cell = ''
+        previous = baseline['stages'].get(name) if baseline else None
+        if previous:
+            time_change = percent_change(result['total'], previous['total'])
+            memory_change = percent_change(result['peak_bytes'], previous['peak_bytes'])
+            time_cell = f'{time_change:+.0f}%'
+            memory_cell = f'{memory_change:+.0f}%'
+            if time_change > args.threshold:
+                regressions.append(f"{name}: {time_change:+.1f}% time ({previous['total']:.3f}s -> {result['total']:.3f}s)")
+            if memory_change > args.threshold:
+                regressions.append(f"{name}: {memory_change:+.1f}% peak memory "
+                                   f"({previous['peak_bytes'] / 1e6:.1f} MB -> {result['peak_bytes'] / 1e6:.1f} MB)")
+
+        def ms(key):
+            return f"{result[key] * 1000:.2f}" if key in result else '-'
+
+        print(f"{name:<26} {result['total']:>8.3f} {ms('mean'):>8} {ms('p95'):>8} {ms('max'):>8} "
+              f"{result['peak_bytes'] / 1e6:>8.1f} {time_cell:>7} {memory_cell:>7}")
+
+    workdir.cleanup()
+
+    print()
+    for name, result in results.items():
+        if 'slowest' in result:
+            print(f"Slowest file for {name}: {result['slowest']} ({result['max'] * 1000:.1f} ms)")
+
+    if args.save_baseline:
+        save_baseline(results, len(corpus), args.baseline)
+        print(f"\nSaved baseline to {args.baseline}")
+    elif baseline is None:
+        print("\nNo baseline to compare against; run with --save-baseline to record one")
+    elif regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:g}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    else:
+        print(f"\nNo regressions above {args.threshold:g}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Worst-case timing for the cleanup and post-processing rules.
+
+Every rule in cleanup_articles.py and the regex steps of translate.py's
+postprocess_html are timed one at a time on adversarial inputs: long runs of
+unterminated <p> and <em> openers, whitespace runs, boilerplate openers with
+no closer, 1 MB single-line documents and random fragment soups. Each input
+is generated at a small and a large size; a rule whose time grows faster than
+--max-exponent between the two (e.g. 2.0 for quadratic) fails the run.
+
+Usage:
+    python bench_rules.py                  # full suite, exit 1 on failure
+    python bench_rules.py --rule share     # only rules whose name contains "share"
+    python bench_rules.py --size 32768 --fuzz 20
+"""
+
+import argparse
+import math
+import random
+import re
+import sys
+import time
+
+import cleanup_articles
+import link_graph
+import translate
+from html_transform import FunctionRule
+
+# Fragments that open the constructs the rules look for, without closing them
+OPENER_FRAGMENTS = [
+    '<p>', '<em>', '<strong>', '<p><em>', '<p><strong>', '<hr>', '<hr/>', '<h2>', '<h1>',
+    '<a href="https://kexue.fm/archives/1">', '<a href="#', '<pre><code>@online{kexuefm-1,',
+    '<script>', '@online{kexuefm-1,', 'Reprinted from', 'Reprinting', 'If you need to cite',
+    'If you have any questions', 'Original Address', 'Su Jianlin. (Jan. 01, 2020). "',
+    'By 苏剑林 | ', 'By Su Jianlin | ', '<p>By 苏剑林 | Jan 1, 2020', 'Published ',
+    'Frequently Asked Questions', 'share', 'Reference for citation', '\\\\text{', '\\nolimits',
+    'href="https://kexue.fm/archives/', '<footer', 'Retrieved from',
+]
+
+# Everything else a translated article is made of
+FILLER_FRAGMENTS = [
+    ' ', '\n', '\n\n', '  ', 'word ', 'text. ', '$x<y$ ', '</p>', '</em>', '</strong>',
+    '</a>', '</code></pre>', '</h2>', '</script>', '|', ':', '"', ')', '(',
+]
+
+
+def repeat_to(unit, size):
+    """Repeat unit until the result is size characters long."""
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def soup(rng, size, fragments):
+    """Concatenate random fragments until the result is size characters long."""
+    parts = []
+    length = 0
+    while length < size:
+        part = rng.choice(fragments)
+        parts.append(part)
+        length += len(part)
+    return ''.join(parts)[:size]
+
+
+# name -> function(size, rng) returning an adversarial document
+GENERATORS = {
+    'unclosed-p': lambda size, rng: repeat_to('<p>', size),
+    'unclosed-p-text': lambda size, rng: repeat_to('<p>By Su Jianlin ', size),
+    'unclosed-em': lambda size, rng: repeat_to('<em>', size),
+    'unclosed-em-strong': lambda size, rng: repeat_to('<p><em><strong>Reprinting ', size),
+    'spaces': lambda size, rng: repeat_to(' ', size),
+    'newlines': lambda size, rng: repeat_to('\n', size),
+    'mixed-whitespace': lambda size, rng: repeat_to(' \n\t', size),
+    'hr-whitespace': lambda size, rng: '<hr>' + repeat_to(' \n', size - 4),
+    'single-line': lambda size, rng: soup(rng, size, [f for f in OPENER_FRAGMENTS + FILLER_FRAGMENTS if '\n' not in f]),
+    'openers': lambda size, rng: soup(rng, size, OPENER_FRAGMENTS),
+}
+
+
+def collect_rules():
+    """Return every rule as an object with .name and .apply(content)."""
+    rules = list(cleanup_articles.CLEANUP_RULES)
+    rules.append(FunctionRule('back-button', cleanup_articles.add_back_button))
+    rules.extend(translate.CITATION_RULES)
+    for i, (pattern, _) in enumerate(translate.AUTHOR_DATE_PATTERNS, 1):
+        compiled = re.compile(pattern, re.DOTALL)
+        rules.append(FunctionRule(f'author-date-{i}', lambda content, p=compiled: p.search(content) and content))
+    # The translated IDs are read once, so the rule doesn't time globbing the translations
+    translated = link_graph.translated_ids()
+    rules.append(FunctionRule('internal-links',
+                              lambda content: translate.rewrite_internal_links(content, translated=translated)))
+    # Empty date index and link context, so only the rewriting itself is timed
+    links = {'graph': {'articles': {}}, 'translated': set(), 'backlinks': {}, 'titles': {}}
+    rules.append(FunctionRule('title-link',
+                              lambda content: translate.postprocess_html(content, '1', {'articles': {}}, links=links)))
+    return rules
+
+
+def time_rule(rule, content, repeat):
+    """Best wall time of rule.apply(content) over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rule.apply(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def growth_exponent(small_time, large_time, ratio):
+    """Exponent k such that time grows like size**k between the two sizes."""
+    return math.log(max(large_time, 1e-9) / max(small_time, 1e-9)) / math.log(ratio)
+
+
+def measure(rule, generate, seed, size, ratio, repeat):
+    """Time rule on the generated input at size and size * ratio.
+
+    Both inputs come from the same seed, so the large one extends the small one.
+    """
+    small_doc = generate(size, random.Random(seed))
+    large_doc = generate(size * ratio, random.Random(seed))
+    return time_rule(rule, small_doc, repeat), time_rule(rule, large_doc, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--rule', help='Only time rules whose name contains this')
+    parser.add_argument('--size', type=int, default=8192, help='Small input size in characters (default: 8192)')
+    parser.add_argument('--ratio', type=int, default=4, help='Large size / small size (default: 4)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement, best is kept (default: 3)')
+    parser.add_argument('--fuzz', type=int, default=5, help='Random fragment soups per rule (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--max-exponent', type=float, default=1.5,
+                        help='Fail if time grows faster than size**this (default: 1.5)')
+    parser.add_argument('--min-time', type=float, default=0.0001,
+                        help='Ignore growth when the small input takes less than this many seconds, '
+                             'e.g. because a cheap pre-filter rejected it (default: 0.0001)')
+    parser.add_argument('--megabyte-budget', type=float, default=1.0,
+                        help='Fail if a rule takes longer than this many seconds on a 1 MB single-line document (default: 1.0)')
+    args = parser.parse_args()
+
+    rules = [r for r in collect_rules() if not args.rule or args.rule in r.name]
+    if not rules:
+        print(f"No rule matches {args.rule!r}")
+        sys.exit(2)
+
+    generators = dict(GENERATORS)
+    for i in range(args.fuzz):
+        generators[f'fuzz-{i}'] = lambda size, rng: soup(rng, size, OPENER_FRAGMENTS + FILLER_FRAGMENTS)
+
+    small, large = args.size, args.size * args.ratio
+    megabyte = GENERATORS['single-line'](1 << 20, random.Random(args.seed))
+
+    print(f"Timing {len(rules)} rules on {len(generators)} inputs ({small} -> {large} chars)\n")
+    print(f"{'rule':<32} {'worst input':<20} {'small ms':>9} {'large ms':>9} {'exp':>5} {'1 MB ms':>9}")
+
+    failures = []
+    for rule in rules:
+        worst = None
+        for name, generate in generators.items():
+            seed = f'{args.seed}-{name}'
+            small_time, large_time = measure(rule, generate, seed, small, args.ratio, args.repeat)
+            exponent = growth_exponent(small_time, large_time, args.ratio)
+            if small_time < args.min_time:
+                exponent = min(exponent, 1.0)
+            if exponent > args.max_exponent:
+                # Confirm one size step up, past timing blips and pre-filters
+                # that only reject the small input
+                small_time, large_time = measure(rule, generate, seed, large, args.ratio, args.repeat)
+                exponent = growth_exponent(small_time, large_time, args.ratio)
+            if worst is None or exponent > worst[1]:
+                worst = (name, exponent, small_time, large_time)
+            if exponent > args.max_exponent:
+                break
+
+        name, exponent, small_time, large_time = worst
+        failed = exponent > args.max_exponent
+        if failed:
+            # A superlinear rule could run for hours on 1 MB
+            megabyte_cell = 'skipped'
+            failures.append(f"{rule.name}: time grows like size^{exponent:.2f} on {name}")
+        else:
+            megabyte_time = time_rule(rule, megabyte, 1)
+            megabyte_cell = f'{megabyte_time * 1000:.1f}'
+            if megabyte_time > args.megabyte_budget:
+                failed = True
+                failures.append(f"{rule.name}: {megabyte_time:.2f}s on a 1 MB single-line document")
+
+        flag = '  FAIL' if failed else ''
+        print(f"{rule.name:<32} {name:<20} {small_time * 1000:>9.2f} {large_time * 1000:>9.2f} "
+              f"{exponent:>5.2f} {megabyte_cell:>9}{flag}")
+
+    print()
+    if failures:
+        print(f"{len(failures)} rule(s) failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("All rules scale linearly")
+
+
+if __name__ == '__main__':
+    main()
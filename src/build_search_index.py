@@ -1,35 +1,137 @@
 #!/usr/bin/env python3
-"""Build a search index from all translation files."""
+"""Build a search index from all translation files.
 
+The index is inverted: every normalized token of an article's title and full
+text maps to the articles containing it, so the contents page looks up each
+query term directly instead of scanning every article. Page chrome (the back
+link, the author line and the citation footer) is left out.
+
+The index is written to search/ as a small manifest plus shards, so the page
+only downloads what a query needs, and nothing until the search box is used.
+manifest.json holds::
+
+    {"version": 6,
+     "docs": [article_id, ...],
+     "lengths": [[title_tokens, text_tokens, math_tokens], ...],
+     "bm25": BM25 parameters,
+     "shards": [[first_term, filename], ...]}
+
+The terms are sorted (by UTF-16 code unit, the order JavaScript compares
+strings in) and split into contiguous runs of about SHARD_BYTES; a shard holds
+every term from its first term up to the next shard's first term. Shard
+filenames contain a hash of their content, so unchanged shards keep their
+name and stay cached. Shards are binary, so the page reads them straight into
+typed arrays with no JSON or base64 to decode. Each is a sequence of
+sections, every section a varint byte length followed by the bytes; a shard
+(NNN.<hash>.bin) has two::
+
+    dict: front-coded terms, UTF-8
+    postings: varints
+
+In the dictionary each term is written as one base-36 digit giving the length
+of the prefix it shares with the previous term, then the rest of the term, and
+terms are separated by spaces. The postings hold, for each term in the
+same order, a varint count (the term's document frequency) followed by, per
+article, a varint ``(doc_number - previous_doc_number - 1) * 8 + flags``,
+with flag 1 for a match in the title, 2 in the prose text and 4 in the math,
+then the term's frequency in each matching field as one more varint per flag.
+
+Math regions ($...$, $$...$$, \\(...\\), \\[...\\], \\begin{env}...\\end{env})
+are taken out of the text and indexed as their own field: only LaTeX command
+names (``\\nabla`` as ``nabla``), environment names and the words inside
+\\text{}, \\mathop{} and the like, so variables and layout commands add no
+noise to either field.
+
+The page ranks results with BM25F from these statistics: per query term,
+each field's frequency is normalized by the field's length relative to its
+average and weighted (the title boosted), the sum is saturated with k1, and
+the result is multiplied by the term's inverse document frequency.
+
+Tokens are NFKD-normalized, stripped of combining marks, lowercased runs of
+letters and digits; the page's tokenize() in generate_contents.py must stay in
+step with tokenize() here.
+
+The original Chinese articles in cache/raw are indexed too, so a post can be
+found by its Chinese title or terms. Chinese has no spaces, so every run of
+CJK characters is split into overlapping bigrams (a one-character run is kept
+as is), and the page splits a query the same way. This index uses the same
+document numbers and shard format, with title and text fields, but has its
+own small manifest named in manifest.json::
+
+    "cjk": "cjk.<hash>.json"   ->   {"lengths": [[title, text], ...],
+                                     "bm25": ..., "shards": [...]}
+
+whose shards are named cjk.NNN.<hash>.bin. None of it is downloaded unless a
+query contains CJK characters.
+
+Two more files named in manifest.json serve autocomplete and typo tolerance
+without touching the shards:
+
+- ``"titles"``: the sorted terms of all titles and, per term, the articles
+  whose title contains it (dict and postings sections, as in a shard), so the titles
+  matching a half-typed query are found by binary search over a prefix
+  range; fetched with the manifest
+- ``"fuzzy"``: fetched the first time a query term matches nothing, the
+  vocabulary worth correcting to (terms of at least
+  FUZZY_MIN_LENGTH characters in at least FUZZY_MIN_DF articles) and a
+  trigram index over it: the sorted trigrams of every ``^term$`` and, per
+  trigram, the numbers of the vocabulary terms containing it (terms, grams
+  and postings sections, the first two front-coded). A query term
+  with no match is replaced by the vocabulary terms sharing enough trigrams
+  with it that are within a small edit distance
+
+Their postings are lists of numbers, each a varint count followed by the
+varint gaps ``number - previous_number - 1``.
+"""
+
+import hashlib
 import json
-import os
 import re
+import unicodedata
+from collections import Counter
 from html.parser import HTMLParser
 from pathlib import Path
 
+from config import CONFIG
+from profiling import profile_from_argv
+
+# "By 苏剑林 | February 27, 2024", the first paragraph after the title
+AUTHOR_LINE_PATTERN = re.compile(r'By [^|$]{1,40}\|\s*[A-Z][a-z]+\.? \d{1,2}, \d{4}')
+
 
 class TextExtractor(HTMLParser):
-    """Extract text content from HTML, skipping script/style tags."""
+    """Extract text content from HTML, skipping script/style tags and page chrome."""
 
     def __init__(self):
         super().__init__()
         self.text_parts = []
-        self.skip_tags = {'script', 'style', 'head'}
+        self.skip_tags = {'script', 'style', 'head', 'nav', 'footer'}
         self.current_skip = 0
         self.title = None
         self.in_h1 = False
+        self.author_checked = False
+        self.paragraph_start = None
 
     def handle_starttag(self, tag, attrs):
         if tag in self.skip_tags:
             self.current_skip += 1
         if tag == 'h1':
             self.in_h1 = True
+        if tag == 'p' and self.title is not None and not self.in_h1 and not self.author_checked:
+            self.paragraph_start = len(self.text_parts)
 
     def handle_endtag(self, tag):
         if tag in self.skip_tags:
-            self.current_skip -= 1
+            # A stray closing tag (e.g. </footer> with no <footer>) must not cancel the next one
+            self.current_skip = max(self.current_skip - 1, 0)
         if tag == 'h1':
             self.in_h1 = False
+        if tag == 'p' and self.paragraph_start is not None:
+            # Drop the author line if that is what the first paragraph is
+            if AUTHOR_LINE_PATTERN.fullmatch(' '.join(self.text_parts[self.paragraph_start:])):
+                del self.text_parts[self.paragraph_start:]
+            self.paragraph_start = None
+            self.author_checked = True
 
     def handle_data(self, data):
         if self.current_skip == 0:
@@ -50,40 +152,426 @@ def extract_content(html_content):
     return parser.title, parser.get_text()
 
 
-def build_index(translations_dir, exclude_files=None):
-    """Build search index from all translation files."""
-    index = []
-    translations_path = Path(translations_dir)
+INDEX_VERSION = 6
+
+# Target byte size of one binary .bin shard (term bytes plus encoded postings)
+SHARD_BYTES = 8 * 1024
+
+# BM25F parameters, shipped in the manifest so the page needs no copy:
+# k1 saturates term frequency; each field has a weight (the title boost) and
+# b, how much the field's length normalizes its term frequencies. Field i
+# sets flag bit 1 << i in the postings.
+BM25 = {
+    'k1': 1.2,
+    'fields': [
+        {'name': 'title', 'weight': 5.0, 'b': 0.3},
+        {'name': 'text', 'weight': 1.0, 'b': 0.75},
+        {'name': 'math', 'weight': 0.5, 'b': 0.75},
+    ],
+}
+FIELD_BITS = len(BM25['fields'])
+
+# BM25F parameters of the Chinese index: the title, when the raw page has
+# one, and the article text
+CJK_BM25 = {
+    'k1': 1.2,
+    'fields': [
+        {'name': 'title', 'weight': 5.0, 'b': 0.3},
+        {'name': 'text', 'weight': 1.0, 'b': 0.75},
+    ],
+}
+CJK_FIELD_BITS = len(CJK_BM25['fields'])
+
+# Shorter or rarer terms are not offered as typo corrections: a short word is
+# a few edits away from too many others, and most one-article terms are noise
+FUZZY_MIN_LENGTH = 4
+FUZZY_MIN_DF = 2
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+BASE36 = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7f]')
+
+
+def drop_mark(match):
+    char = match.group()
+    return '' if unicodedata.category(char).startswith('M') else char
+
+
+def normalize(text):
+    """Lowercase text and strip accents (NFKD, then drop combining marks)."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    # Only the rare non-ASCII characters need a category lookup
+    return NON_ASCII_PATTERN.sub(drop_mark, decomposed).lower()
+
+
+def tokenize(text):
+    """Split text into normalized tokens: runs of letters and digits."""
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+# Han ideographs, kana and hangul; the page's CJK_PATTERN must match the same
+CJK_PATTERN = re.compile('[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\U00020000-\U0002ffff]+')
+
+# "# [配置不同的学习率，LoRA还能再涨一点？](https://kexue.fm/archives/10001)"
+RAW_TITLE_PATTERN = re.compile(r'^# \[(.+)\]\(https?://kexue\.fm/archives/\d+\)\s*$', re.MULTILINE)
+# The article ends at its reprint notice; comments and site chrome follow
+RAW_END_MARKER = '转载到请包括本文地址'
+
+
+def cjk_tokens(text):
+    """Split the CJK runs in text into overlapping bigrams.
+
+    A one-character run is kept as a unigram, so single-character words can
+    still be found by prefix. Everything that is not CJK is ignored.
+    """
+    tokens = []
+    # normalize() would look up every character's category; the only
+    # combining marks NFKD produces here are the kana voicing marks
+    decomposed = unicodedata.normalize('NFKD', text).replace('\u3099', '').replace('\u309a', '')
+    for run in CJK_PATTERN.findall(decomposed):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend([run[i:i + 2] for i in range(len(run) - 1)])
+    return tokens
+
+
+def extract_raw_content(raw_content):
+    """Extract the Chinese title and article text from a cached raw page.
+
+    Firecrawl pages carry the whole site; the article runs from its
+    "# [title](url)" heading to the reprint notice. Exa pages hold only the
+    article text, without a title, so the title is None for them.
+    """
+    end = raw_content.find(RAW_END_MARKER)
+    if end >= 0:
+        raw_content = raw_content[:end]
+    match = RAW_TITLE_PATTERN.search(raw_content)
+    if match is None:
+        return None, raw_content
+    return match.group(1), raw_content[match.end():]
+
+
+# Openers of math regions, longest first; \begin{env} captures the environment
+MATH_OPENER_PATTERN = re.compile(r'\$\$|\\\[|\\\(|\\begin\{([A-Za-z]+\*?)\}|(?<!\\)\$')
+MATH_CLOSERS = {'$$': '$$', '\\[': '\\]', '\\(': '\\)', '$': '$'}
+
+# Commands whose argument is words (\text{softmax}, \mathop{argmax}, ...)
+MATH_WORD_PATTERN = re.compile(r'\\(?:text\w*|math(?:rm|op|it|bf|sf|tt)|operatorname\*?)\s*\{([^{}]*)\}')
+MATH_COMMAND_PATTERN = re.compile(r'\\([A-Za-z]+)')
+MATH_ENVIRONMENT_PATTERN = re.compile(r'\\begin\s*\{([A-Za-z]+)')
+
+# Layout commands that say nothing about an article's content
+MATH_STOP_COMMANDS = {'begin', 'end', 'left', 'right', 'big', 'bigg', 'quad', 'qquad', 'label', 'tag'}
+
+
+def split_math(text):
+    """Split text into prose and math regions.
+
+    Math is whatever MathJax typesets: $...$, $$...$$, \\(...\\), \\[...\\] and
+    \\begin{env}...\\end{env}. Returns (prose, regions), where prose has a space
+    in place of each region and each region keeps its environment's \\begin.
+    An opener without a closer is left in the prose.
+    """
+    prose = []
+    regions = []
+    position = last = 0
+    # Closers known to be missing from the rest of the text, so an
+    # unterminated opener is only searched for once
+    missing = set()
+    while True:
+        match = MATH_OPENER_PATTERN.search(text, position)
+        if match is None:
+            break
+        opener = match.group()
+        closer = MATH_CLOSERS.get(opener) or f'\\end{{{match.group(1)}}}'
+        end = -1 if closer in missing else text.find(closer, match.end())
+        if end < 0:
+            missing.add(closer)
+            position = match.end()
+            continue
+        prose.append(text[last:match.start()])
+        region_start = match.start() if match.group(1) else match.end()
+        regions.append(text[region_start:end])
+        position = last = end + len(closer)
+    prose.append(text[last:])
+    return ' '.join(prose), regions
+
+
+def math_tokens(region):
+    """Index tokens of one math region: command names, environment names and
+    the words in text-like commands, without one-letter variables."""
+    tokens = [name for name in MATH_COMMAND_PATTERN.findall(region) if name not in MATH_STOP_COMMANDS]
+    tokens.extend(MATH_ENVIRONMENT_PATTERN.findall(region))
+    for words in MATH_WORD_PATTERN.findall(region):
+        tokens.extend(tokenize(words))
+    return [token for token in tokenize(' '.join(tokens)) if len(token) > 1]
+
+
+def write_varint(out, value):
+    """Append value to the bytearray out as a little-endian base-128 varint."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def front_code(terms):
+    """Front-code sorted terms into one space-separated string."""
+    coded = []
+    previous = ''
+    for term in terms:
+        shared = 0
+        limit = min(len(previous), len(term), len(BASE36) - 1)
+        while shared < limit and previous[shared] == term[shared]:
+            shared += 1
+        coded.append(BASE36[shared] + term[shared:])
+        previous = term
+    return ' '.join(coded)
+
+
+def encode_numbers(numbers):
+    """Pack a sorted list of numbers as a varint count and varint gaps."""
+    out = bytearray()
+    write_varint(out, len(numbers))
+    previous = -1
+    for number in numbers:
+        write_varint(out, number - previous - 1)
+        previous = number
+    return bytes(out)
+
+
+def encode_postings(postings, field_bits=FIELD_BITS):
+    """Pack one term's (doc_number, field_frequencies) list as delta-encoded varints."""
+    out = bytearray()
+    write_varint(out, len(postings))
+    previous = -1
+    for doc, frequencies in postings:
+        flags = sum(1 << i for i, tf in enumerate(frequencies) if tf)
+        write_varint(out, ((doc - previous - 1) << field_bits) + flags)
+        for tf in frequencies:
+            if tf:
+                write_varint(out, tf)
+        previous = doc
+    return bytes(out)
+
+
+def build_index(manifest, exclude_files=None):
+    """Build the inverted search index from the article manifest.
+
+    Returns a dict with the indexed article IDs, each article's field
+    lengths in tokens, the sorted terms and each term's
+    (doc_number, field_frequencies) postings.
+    """
+    from manifest import manifest_articles
+
+    docs = []
+    lengths = []
+    postings = {}
     exclude_files = set(exclude_files or [])
 
-    for html_file in sorted(translations_path.glob('translation_*.html')):
-        if html_file.name in exclude_files:
+    for record in sorted(manifest_articles(manifest), key=lambda r: r['file']):
+        if record['file'] in exclude_files:
             continue
-        try:
-            content = html_file.read_text(encoding='utf-8')
-            title, text = extract_content(content)
+        title = record['search_title']
+        text = record['search_text']
+
+        if title:
+            doc = len(docs)
+            docs.append(record['id'])
+            prose, regions = split_math(text)
+            fields = [
+                tokenize(title),
+                tokenize(prose),
+                [token for region in regions for token in math_tokens(region)],
+            ]
+            lengths.append([len(tokens) for tokens in fields])
+            counts = [Counter(tokens) for tokens in fields]
+            for token in set().union(*counts):
+                postings.setdefault(token, []).append((doc, tuple(c[token] for c in counts)))
+
+    return {'docs': docs, 'lengths': lengths, 'terms': sort_terms(postings), 'postings': postings}
+
+
+def build_cjk_index(docs, raw_dir=None):
+    """Build the Chinese index from the raw articles of the indexed docs.
+
+    Document numbers are positions in docs, as in the English index; an
+    article with no raw file gets zero lengths and no postings.
+    """
+    raw_dir = Path(raw_dir or CONFIG.raw_dir)
+    lengths = []
+    postings = {}
+
+    for doc, article_id in enumerate(docs):
+        raw_file = raw_dir / f'{article_id}.txt'
+        if not raw_file.exists():
+            lengths.append([0, 0])
+            continue
+        title, text = extract_raw_content(raw_file.read_text(encoding='utf-8'))
+        fields = [cjk_tokens(title or ''), cjk_tokens(text)]
+        lengths.append([len(tokens) for tokens in fields])
+        title_counts, text_counts = Counter(fields[0]), Counter(fields[1])
+        for token in title_counts.keys() | text_counts.keys():
+            postings.setdefault(token, []).append((doc, (title_counts[token], text_counts[token])))
+
+    return {'lengths': lengths, 'terms': sort_terms(postings), 'postings': postings}
+
+
+def sort_terms(postings):
+    """Sort terms the way JavaScript compares strings: by UTF-16 code unit."""
+    return sorted(postings, key=lambda term: term.encode('utf-16-be'))
+
+
+def trigrams(term):
+    """The distinct trigrams of a term, padded as ^term$."""
+    padded = f'^{term}$'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def pack_lists(lists):
+    """Encode number lists back to back."""
+    return b''.join(encode_numbers(numbers) for numbers in lists)
 
-            if title:
-                # Truncate content to reasonable size for search
-                # Keep first ~1200 chars of text for searching
-                search_text = text[:1200] if len(text) > 1200 else text
 
-                index.append({
-                    'file': html_file.name,
-                    'title': title,
-                    'content': search_text
-                })
-        except Exception as e:
-            print(f"Error processing {html_file}: {e}")
+def encode_sections(*sections):
+    """Join byte strings, each prefixed with its varint length."""
+    out = bytearray()
+    for section in sections:
+        write_varint(out, len(section))
+        out += section
+    return bytes(out)
 
-    return index
 
+def build_title_table(index):
+    """Serialize the title terms and the articles whose title has each one."""
+    terms = [term for term in index['terms'] if any(frequencies[0] for _, frequencies in index['postings'][term])]
+    lists = [[doc for doc, frequencies in index['postings'][term] if frequencies[0]] for term in terms]
+    return encode_sections(front_code(terms).encode('utf-8'), pack_lists(lists))
 
-def main():
-    script_dir = Path(__file__).parent
-    root_dir = script_dir.parent
-    translations_dir = root_dir / 'translations'
-    output_file = root_dir / 'search-index.js'
+
+def build_fuzzy_index(index):
+    """Serialize the correction vocabulary and its trigram index."""
+    vocabulary = [
+        term for term in index['terms']
+        if len(term) >= FUZZY_MIN_LENGTH and len(index['postings'][term]) >= FUZZY_MIN_DF and not term.isdigit()
+    ]
+    grams = {}
+    for number, term in enumerate(vocabulary):
+        for gram in trigrams(term):
+            grams.setdefault(gram, []).append(number)
+    gram_list = sort_terms(grams)
+    return encode_sections(
+        front_code(vocabulary).encode('utf-8'),
+        front_code(gram_list).encode('utf-8'),
+        pack_lists([grams[gram] for gram in gram_list]),
+    )
+
+
+def encode_shard(terms, encoded):
+    """Serialize a run of terms and their encoded postings as a binary shard."""
+    return encode_sections(front_code(terms).encode('utf-8'), b''.join(encoded))
+
+
+def encode_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def content_name(stem, data, suffix='.bin'):
+    """Name a file after a hash of its content, so it can be cached forever."""
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:10]}{suffix}'
+
+
+def shard_terms(index, files, field_bits=FIELD_BITS, shard_bytes=SHARD_BYTES, prefix=''):
+    """Split an index's terms into shards of about shard_bytes each.
+
+    The shards are added to files (filename -> bytes); returns the
+    [first_term, filename] list for the manifest.
+    """
+    shards = []
+
+    def flush(terms, encoded):
+        data = encode_shard(terms, encoded)
+        name = content_name(f'{prefix}{len(shards):03d}', data)
+        shards.append([terms[0], name])
+        files[name] = data
+
+    terms, encoded, size = [], [], 0
+    for term in index['terms']:
+        data = encode_postings(index['postings'][term], field_bits)
+        cost = len(term.encode('utf-8')) + 2 + len(data)
+        if terms and size + cost > shard_bytes:
+            flush(terms, encoded)
+            terms, encoded, size = [], [], 0
+        terms.append(term)
+        encoded.append(data)
+        size += cost
+    if terms:
+        flush(terms, encoded)
+    return shards
+
+
+def shard_index(index, shard_bytes=SHARD_BYTES):
+    """Split the index, and its Chinese index if any, into shards.
+
+    Returns the manifest and a dict of filename -> bytes for every other
+    file: the shards, the Chinese index's manifest, the title table and the
+    trigram index.
+    """
+    files = {}
+    manifest = {
+        'version': INDEX_VERSION,
+        'docs': index['docs'],
+        'lengths': index['lengths'],
+        'bm25': BM25,
+        'shards': shard_terms(index, files, FIELD_BITS, shard_bytes),
+    }
+    if 'cjk' in index:
+        cjk_manifest = encode_json({
+            'lengths': index['cjk']['lengths'],
+            'bm25': CJK_BM25,
+            'shards': shard_terms(index['cjk'], files, CJK_FIELD_BITS, shard_bytes, prefix='cjk.'),
+        })
+        manifest['cjk'] = content_name('cjk', cjk_manifest, '.json')
+        files[manifest['cjk']] = cjk_manifest
+    for key, data in [('titles', build_title_table(index)), ('fuzzy', build_fuzzy_index(index))]:
+        manifest[key] = content_name(key, data)
+        files[manifest[key]] = data
+    return manifest, files
+
+
+def write_index(index, output_dir, shard_bytes=SHARD_BYTES):
+    """Write manifest.json and the shards, removing shards no longer referenced."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest, files = shard_index(index, shard_bytes)
+
+    for name, data in files.items():
+        path = output_dir / name
+        if not path.exists():
+            path.write_bytes(data)
+    for path in [*output_dir.glob('*.json'), *output_dir.glob('*.bin')]:
+        if path.name != 'manifest.json' and path.name not in files:
+            path.unlink()
+
+    # Written last, so a reader never sees a manifest pointing at missing shards
+    manifest_path = output_dir / 'manifest.json'
+    tmp_path = manifest_path.with_suffix('.tmp')
+    tmp_path.write_bytes(encode_json(manifest))
+    tmp_path.replace(manifest_path)
+    return manifest, files
+
+
+def main(translations_dir=None, output_dir=None, raw_dir=None):
+    """Write the sharded search index (search/ at the repo root by default).
+
+    Returns the number of articles indexed.
+    """
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
+    output_dir = Path(output_dir or CONFIG.search_dir)
 
     # Exclude 2009 and 2014 articles
     exclude = [
@@ -91,21 +579,29 @@ def main():
         'translation_4170.html', 'translation_3171.html', 'translation_3154.html', 'translation_3150.html',  # 2014
     ]
 
-    print(f"Building search index from {translations_dir}...")
-    index = build_index(translations_dir, exclude_files=exclude)
+    from manifest import update_manifest
 
-    # Write as a JS file with a variable assignment
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('window.SEARCH_INDEX = ')
-        json.dump(index, f, ensure_ascii=False)
-        f.write(';\n')
+    print(f"Building search index from {translations_dir}...")
+    manifest = update_manifest(translations_dir)
+    index = build_index(manifest, exclude_files=exclude)
+    index['cjk'] = build_cjk_index(index['docs'], raw_dir)
+    search_manifest, files = write_index(index, output_dir)
 
-    print(f"Created {output_file} with {len(index)} articles")
+    print(f"Created {output_dir} with {len(index['docs'])} articles and {len(index['terms'])} terms")
+    cjk_docs = sum(1 for lengths in index['cjk']['lengths'] if lengths[1])
+    print(f"Chinese index: {cjk_docs} raw articles, {len(index['cjk']['terms'])} bigrams")
 
     # Print size info
-    size_kb = output_file.stat().st_size / 1024
-    print(f"Index size: {size_kb:.1f} KB")
+    manifest_kb = (output_dir / 'manifest.json').stat().st_size / 1024
+    print(f"Manifest: {manifest_kb:.1f} KB")
+    for label, shards in [('Shards', search_manifest['shards']),
+                          ('Chinese shards', json.loads(files[search_manifest['cjk']])['shards'])]:
+        shard_kb = sorted(len(files[name]) / 1024 for _, name in shards)
+        print(f"{label}: {len(shard_kb)}, {sum(shard_kb):.1f} KB total, "
+              f"median {shard_kb[len(shard_kb) // 2]:.1f} KB, max {shard_kb[-1]:.1f} KB")
+    return len(index['docs'])
 
 
 if __name__ == '__main__':
+    profile_from_argv('build_search_index')
     main()
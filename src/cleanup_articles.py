@@ -4,263 +4,298 @@
 import re
 from pathlib import Path
 
+from html_transform import (DelimitedRule, FunctionRule, LazySpanRule, RegexRule, find_at_line_start,
+                            split_raw_elements)
+from config import CONFIG
+from profiling import profile_from_argv
 
-def add_back_button(content: str) -> str:
-    """Add a back button to the index page if not already present."""
-    back_button_html = '''<nav style="margin-bottom: 1.5em;">
-    <a href="../index.html" style="display: inline-flex; align-items: center; color: #555; text-decoration: none; font-size: 0.95em;">
-        <span style="margin-right: 0.3em;">&larr;</span> Back to Index
-    </a>
-</nav>
-
-'''
-    # Check if back button already exists
-    if 'Back to Index' in content:
-        return content
-
-    # Find the h1 tag and insert back button before it (allowing for leading whitespace)
-    h1_match = re.search(r'^(\s*)<h1>', content, re.MULTILINE)
-    if h1_match:
-        insert_pos = h1_match.start()
-        indent = h1_match.group(1)  # Preserve the indentation
-        content = content[:insert_pos] + indent + back_button_html.strip() + '\n\n' + content[insert_pos:]
 
-    return content
+def fix_text_outside_scripts(content: str) -> str:
+    """Fix double-escaped \\text commands outside <script> tags."""
+    # Split content by script tags, only fix non-script parts
+    parts = split_raw_elements(content, 'script', '<script>')
+    fixed_parts = []
+    for part in parts:
+        if part.startswith('<script>'):
+            fixed_parts.append(part)  # Leave script content unchanged
+        else:
+            fixed_parts.append(re.sub(r'\\\\text\{', r'\\text{', part))
+    return ''.join(fixed_parts)
 
 
-def cleanup_article(content: str) -> str:
-    """Clean up various non-standard elements from an article."""
+# Rules of the form PREFIX .*? SUFFIX (re.DOTALL) are LazySpanRules, which pair
+# openers with closers so that a missing closer cannot cause quadratic backtracking.
 
-    # ========== HEADING CLEANUP ==========
+# ========== HEADING CLEANUP ==========
 
+HEADING_RULES = [
     # 1. Remove hashtag anchor links from headings (multiple formats)
+    # (?<!\s) starts the match at the beginning of a whitespace run, where it
+    # would start anyway, instead of rescanning the run from every position
     # Format: <a href="...#...">#</a>
-    content = re.sub(r'\s*<a\s+href="[^"]*#[^"]*">#</a>', '', content)
+    RegexRule('heading-anchor', r'(?<!\s)\s*<a\s+href="[^"]*#[^"]*">#</a>'),
     # Format: <a id="..." href="#...">#</a>
-    content = re.sub(r'\s*<a\s+id="[^"]*"\s+href="#[^"]*">#</a>', '', content)
+    RegexRule('heading-anchor-id', r'(?<!\s)\s*<a\s+id="[^"]*"\s+href="#[^"]*">#</a>'),
     # Format: <a name="..." href="#...">#</a>
-    content = re.sub(r'\s*<a\s+name="[^"]*"\s+href="#[^"]*">#</a>', '', content)
+    RegexRule('heading-anchor-name', r'(?<!\s)\s*<a\s+name="[^"]*"\s+href="#[^"]*">#</a>'),
     # Format: <a href="https://kexue.fm/archives/XXXX#...">#</a>
-    content = re.sub(r'\s*<a\s+href="https?://kexue\.fm/archives/\d+#[^"]*">#</a>', '', content)
+    RegexRule('heading-anchor-kexue', r'(?<!\s)\s*<a\s+href="https?://kexue\.fm/archives/\d+#[^"]*">#</a>'),
 
     # 2. Remove Chinese IDs from heading tags but keep the heading
     # Pattern: <h2 id="本文小结"> -> <h2>
-    content = re.sub(r'(<h[1-6])\s+id="[^"]*">', r'\1>', content)
-
-    # ========== REPRINT/REPOST NOTICES ==========
-
-    # 3. Remove "Reprinted/Reposted with/from address" lines (various formats)
-    reprint_patterns = [
-        # <p><em><strong>Reprinted with the address:</strong> <a>...</a></em></p>
-        r'<p>\s*<em>\s*<strong>\s*Reprinted?\s+(?:with|from|at)?\s*(?:the\s+)?(?:original\s+)?address[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*</p>\s*',
-        # <p><i><strong>Reprinted from:</strong>...</i></p>
-        r'<p>\s*<i>\s*<strong>\s*Reprinted?\s+(?:from|at)[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</i>\s*</p>\s*',
-        # <p><em><strong>Reprinted from:</strong>...</em></p>
-        r'<p>\s*<em>\s*<strong>\s*Reprinted?\s+(?:from|at)[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*</p>\s*',
-        # <p><i><b>Reprint Address: </b>...</i></p>
-        r'<p>\s*<i>\s*<b>\s*Reprint(?:ed)?\s+Address[:\s]*</b>\s*<a[^>]*>[^<]*</a>\s*</i>\s*</p>\s*',
-        # <em><strong>Reprinting: Please include...</strong>...</em>
-        r'<em>\s*<strong>\s*Reprinting[:\s]+Please[^<]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*(?:<br\s*/?>)?\s*',
-        # <em><strong>When reprinting/reposting, please include...</strong>...</em>
-        r'<em>\s*<strong>\s*When\s+re(?:print|post)ing,?\s+please\s+include[^<]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*(?:<br\s*/?>)?\s*',
-        # <em><strong>Reprinted with the original address:</strong>...</em> (not in <p>)
-        r'<em>\s*<strong>\s*Reprinted?\s+(?:with|from|at)?\s*(?:the\s+)?(?:original\s+)?address[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*',
-        # <em><strong>Reprinted please include...</strong>...</em>
-        r'<em>\s*<strong>\s*Reprinted?\s+(?:please\s+)?include[^<]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*(?:<br\s*/?>)?\s*',
-        # <em><strong>Reprinted from:</strong> [markdown link]</em>
-        r'<em>\s*<strong>\s*Reprinted?\s+(?:from|at)[:\s]*</strong>\s*\[[^\]]*\]\([^)]*\)\s*</em>\s*(?:<br\s*/?>)?\s*',
-        # <strong>Please include the original address when reposting:</strong>...
-        r'<strong>\s*Please\s+include[^<]*(?:when\s+)?re(?:print|post)ing[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*(?:<br\s*/?>)?\s*',
-        # Reprinted to please include this article address:...
-        r'Reprinted?\s+to\s+please\s+include[^<]*<a[^>]*>[^<]*</a>\s*(?:<br\s*/?>)?\s*',
-        # <p>Reprinted from: ...</p>
-        r'<p>\s*Reprinted?\s+(?:from|at)[:\s]*<a[^>]*>[^<]*</a>\s*</p>\s*',
-    ]
-    for pattern in reprint_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.DOTALL)
-
-    # ========== FAQ REFERENCES ==========
-
-    # 4. Remove "For more detailed reprinting/reposting/reproduction matters, please refer to: FAQ" lines
-    # These are boilerplate links to the site's FAQ about reprinting policy
-    faq_patterns = [
-        # Any paragraph containing "FAQ" and linking to kexue.fm FAQ
-        r'<p>\s*(?:<[ieb]>|<em>|<strong>)*\s*(?:For\s+(?:more\s+)?detail[^<]*|Reference\s+for\s+reprint[^<]*|Reprinting\s+rules[^<]*)[^<]*(?:</[ieb]>|</em>|</strong>)*\s*(?:<[ieb]>|<em>|<strong>)*[^<]*(?:</[ieb]>|</em>|</strong>)*\s*<a[^>]*(?:6508|faq)[^>]*>[^<]*</a>\s*(?:</[ieb]>|</em>|</strong>)*\s*</p>\s*',
-        # Without <p> wrapper
-        r'(?:<[ieb]>|<em>|<strong>)+\s*For\s+(?:more\s+)?detail[^<]*(?:</[ieb]>|</em>|</strong>)*\s*<a[^>]*(?:6508|faq)[^>]*>[^<]*</a>\s*(?:</[ieb]>|</em>|</strong>)*\s*(?:<br\s*/?>)?\s*',
-        # Simpler: any line with "refer to" and FAQ link
-        r'(?:please\s+)?refer\s+to[:\s]*<a[^>]*(?:6508|faq\.html)[^>]*>[^<]*FAQ[^<]*</a>\s*(?:</[ieb]>|</em>|</strong>)*\.?\s*(?:</p>)?\s*',
-        # Standalone: For more details/information on reposting...
-        r'For\s+more\s+(?:detailed?\s+)?(?:information\s+on\s+)?(?:reproduction|reprinting|reposting|reprint)\s+(?:matters)?[^<]*<a[^>]*>[^<]*</a>\s*(?:<br\s*/?>)?\s*',
-        # <i><b>Reference for reprint:</b>...</i>
-        r'<i>\s*<b>\s*Reference\s+for\s+reprint[:\s]*</b>\s*<a[^>]*>[^<]*</a>\s*</i>\s*',
-        # For detailed reprinting matters, please refer to: <a>FAQ</a>
-        r'For\s+(?:more\s+)?detail(?:ed)?\s+(?:reprinting|reposting|reproduction)\s+(?:matters|guidelines)?[,\s]*(?:please\s+)?refer\s+to[:\s]*<a[^>]*>[^<]*FAQ[^<]*</a>\s*',
-        # <em><strong>Detailed Reprinting Guidelines:</strong>...</em>
-        r'<em>\s*<strong>\s*Detail(?:ed)?\s+(?:Reprinting|Reposting)\s+Guidelines?[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*',
-        # Multi-line: Reprint address:...<br>For more details...
-        r'<p>\s*Reprint\s+address[:\s]*<a[^>]*>[^<]*</a>\s*<br\s*/?>\s*For\s+more\s+details[^<]*<a[^>]*>[^<]*</a>\s*</p>\s*',
-    ]
-    for pattern in faq_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.DOTALL)
-
-    # ========== CITATION REQUESTS ==========
-
-    # 5. Remove "If you need to cite this article" sections
-    cite_patterns = [
-        # <p><strong>If you need to cite this article, please refer to:</strong></p>
-        r'<p>\s*<strong>\s*If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*</strong>\s*</p>\s*',
-        # <strong>If you need to cite this article...</strong>
-        r'<strong>\s*If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*</strong>\s*(?:<br\s*/?>)?\s*',
-        # If you need to cite this article, please refer to:
-        r'If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*(?:<br\s*/?>)?\s*',
-        # <p>If you need to cite this article...</p>
-        r'<p>\s*If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*</p>\s*',
-    ]
-    for pattern in cite_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-
-    # ========== SHARE/DONATE REQUESTS ==========
-
-    # 5b. Remove "If you find this article helpful, share/donate" paragraphs
-    share_patterns = [
-        # <p><strong>If you find this article helpful...share...donate...</strong></p>
-        r'<p>\s*<strong>\s*If\s+you\s+find\s+this\s+article\s+helpful.*?</strong>\s*</p>\s*',
-    ]
-    for pattern in share_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.DOTALL)
-
+    RegexRule('heading-id', r'(<h[1-6])\s+id="[^"]*">', r'\1>'),
+]
+
+# ========== REPRINT/REPOST NOTICES ==========
+
+# 3. Remove "Reprinted/Reposted with/from address" lines (various formats)
+REPRINT_RULES = [
+    # <p><em><strong>Reprinted with the address:</strong> <a>...</a></em></p>
+    RegexRule('reprint-1', r'<p>\s*<em>\s*<strong>\s*Reprinted?\s+(?:with|from|at)?\s*(?:the\s+)?(?:original\s+)?address[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <p><i><strong>Reprinted from:</strong>...</i></p>
+    RegexRule('reprint-2', r'<p>\s*<i>\s*<strong>\s*Reprinted?\s+(?:from|at)[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</i>\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <p><em><strong>Reprinted from:</strong>...</em></p>
+    RegexRule('reprint-3', r'<p>\s*<em>\s*<strong>\s*Reprinted?\s+(?:from|at)[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <p><i><b>Reprint Address: </b>...</i></p>
+    RegexRule('reprint-4', r'<p>\s*<i>\s*<b>\s*Reprint(?:ed)?\s+Address[:\s]*</b>\s*<a[^>]*>[^<]*</a>\s*</i>\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <em><strong>Reprinting: Please include...</strong>...</em>
+    RegexRule('reprint-5', r'<em>\s*<strong>\s*Reprinting[:\s]+Please[^<]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <em><strong>When reprinting/reposting, please include...</strong>...</em>
+    RegexRule('reprint-6', r'<em>\s*<strong>\s*When\s+re(?:print|post)ing,?\s+please\s+include[^<]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <em><strong>Reprinted with the original address:</strong>...</em> (not in <p>)
+    RegexRule('reprint-7', r'<em>\s*<strong>\s*Reprinted?\s+(?:with|from|at)?\s*(?:the\s+)?(?:original\s+)?address[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <em><strong>Reprinted please include...</strong>...</em>
+    RegexRule('reprint-8', r'<em>\s*<strong>\s*Reprinted?\s+(?:please\s+)?include[^<]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <em><strong>Reprinted from:</strong> [markdown link]</em>
+    RegexRule('reprint-9', r'<em>\s*<strong>\s*Reprinted?\s+(?:from|at)[:\s]*</strong>\s*\[[^\]]*\]\([^)]*\)\s*</em>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <strong>Please include the original address when reposting:</strong>...
+    RegexRule('reprint-10', r'<strong>\s*Please\s+include[^<]*(?:when\s+)?re(?:print|post)ing[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # Reprinted to please include this article address:...
+    RegexRule('reprint-11', r'Reprinted?\s+to\s+please\s+include[^<]*<a[^>]*>[^<]*</a>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <p>Reprinted from: ...</p>
+    RegexRule('reprint-12', r'<p>\s*Reprinted?\s+(?:from|at)[:\s]*<a[^>]*>[^<]*</a>\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+]
+
+# ========== FAQ REFERENCES ==========
+
+# 4. Remove "For more detailed reprinting/reposting/reproduction matters, please refer to: FAQ" lines
+# These are boilerplate links to the site's FAQ about reprinting policy
+FAQ_RULES = [
+    # Any paragraph containing "FAQ" and linking to kexue.fm FAQ
+    RegexRule('faq-1', r'<p>\s*(?:<[ieb]>|<em>|<strong>)*\s*(?:For\s+(?:more\s+)?detail[^<]*|Reference\s+for\s+reprint[^<]*|Reprinting\s+rules[^<]*)[^<]*(?:</[ieb]>|</em>|</strong>)*\s*(?:<[ieb]>|<em>|<strong>)*[^<]*(?:</[ieb]>|</em>|</strong>)*\s*<a[^>]*(?:6508|faq)[^>]*>[^<]*</a>\s*(?:</[ieb]>|</em>|</strong>)*\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # Without <p> wrapper (the lookbehinds start the match only at the first tag of a run)
+    RegexRule('faq-2', r'(?<!<[ieb]>)(?<!<em>)(?<!<strong>)(?:<[ieb]>|<em>|<strong>)+\s*For\s+(?:more\s+)?detail[^<]*(?:</[ieb]>|</em>|</strong>)*\s*<a[^>]*(?:6508|faq)[^>]*>[^<]*</a>\s*(?:</[ieb]>|</em>|</strong>)*\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # Simpler: any line with "refer to" and FAQ link
+    RegexRule('faq-3', r'(?:please\s+)?refer\s+to[:\s]*<a[^>]*(?:6508|faq\.html)[^>]*>[^<]*FAQ[^<]*</a>\s*(?:</[ieb]>|</em>|</strong>)*\.?\s*(?:</p>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # Standalone: For more details/information on reposting...
+    RegexRule('faq-4', r'For\s+more\s+(?:detailed?\s+)?(?:information\s+on\s+)?(?:reproduction|reprinting|reposting|reprint)\s+(?:matters)?[^<]*<a[^>]*>[^<]*</a>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <i><b>Reference for reprint:</b>...</i>
+    RegexRule('faq-5', r'<i>\s*<b>\s*Reference\s+for\s+reprint[:\s]*</b>\s*<a[^>]*>[^<]*</a>\s*</i>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # For detailed reprinting matters, please refer to: <a>FAQ</a>
+    RegexRule('faq-6', r'For\s+(?:more\s+)?detail(?:ed)?\s+(?:reprinting|reposting|reproduction)\s+(?:matters|guidelines)?[,\s]*(?:please\s+)?refer\s+to[:\s]*<a[^>]*>[^<]*FAQ[^<]*</a>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # <em><strong>Detailed Reprinting Guidelines:</strong>...</em>
+    RegexRule('faq-7', r'<em>\s*<strong>\s*Detail(?:ed)?\s+(?:Reprinting|Reposting)\s+Guidelines?[:\s]*</strong>\s*<a[^>]*>[^<]*</a>\s*</em>\s*', flags=re.IGNORECASE | re.DOTALL),
+    # Multi-line: Reprint address:...<br>For more details...
+    RegexRule('faq-8', r'<p>\s*Reprint\s+address[:\s]*<a[^>]*>[^<]*</a>\s*<br\s*/?>\s*For\s+more\s+details[^<]*<a[^>]*>[^<]*</a>\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+]
+
+# ========== CITATION REQUESTS ==========
+
+# 5. Remove "If you need to cite this article" sections
+CITE_RULES = [
+    # <p><strong>If you need to cite this article, please refer to:</strong></p>
+    RegexRule('cite-1', r'<p>\s*<strong>\s*If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*</strong>\s*</p>\s*', flags=re.IGNORECASE),
+    # <strong>If you need to cite this article...</strong>
+    RegexRule('cite-2', r'<strong>\s*If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*</strong>\s*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE),
+    # If you need to cite this article, please refer to:
+    RegexRule('cite-3', r'If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*(?:<br\s*/?>)?\s*', flags=re.IGNORECASE),
+    # <p>If you need to cite this article...</p>
+    RegexRule('cite-4', r'<p>\s*If\s+you\s+need\s+to\s+cite\s+this\s+article[^<]*</p>\s*', flags=re.IGNORECASE),
+]
+
+# ========== SHARE/DONATE REQUESTS ==========
+
+# 5b. Remove "If you find this article helpful, share/donate" paragraphs
+# <p><strong>If you find this article helpful...share...donate...</strong></p>
+SHARE_RULES = [
+    LazySpanRule(
+        'share',
+        anchor=r'<p',
+        prefix=r'<p>\s*<strong>\s*If\s+you\s+find\s+this\s+article\s+helpful',
+        closer=r'</strong',
+        suffix=r'</strong>\s*</p>\s*',
+        flags=re.IGNORECASE,
+    ),
+]
+
+CITATION_PARAGRAPH_RULES = [
     # 6. Remove citation paragraphs (Su Jianlin. (date). "title"...)
-    content = re.sub(
-        r'<p>\s*Su\s+Jianlin\.\s*\([^)]+\)\.\s*"[^"]+"\s*(?:\[Blog\s+post\])?\.\s*(?:Retrieved\s+from\s*)?(?:<a[^>]*>[^<]*</a>|https?://[^\s<]+)\s*</p>\s*',
-        '',
-        content,
-        flags=re.IGNORECASE | re.DOTALL
-    )
-
+    RegexRule('citation-paragraph', r'<p>\s*Su\s+Jianlin\.\s*\([^)]+\)\.\s*"[^"]+"\s*(?:\[Blog\s+post\])?\.\s*(?:Retrieved\s+from\s*)?(?:<a[^>]*>[^<]*</a>|https?://[^\s<]+)\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
     # 6b. Remove Chinese citation paragraphs (苏剑林. (date). 《title》...)
-    content = re.sub(
-        r'<p>\s*苏剑林\.\s*\([^)]+\)\.\s*《[^》]+》\s*(?:\[Blog\s+post\])?\.\s*(?:Retrieved\s+from\s*)?(?:<a[^>]*>[^<]*</a>|https?://[^\s<]+)\s*</p>\s*',
-        '',
-        content,
-        flags=re.IGNORECASE | re.DOTALL
-    )
+    RegexRule('citation-paragraph-zh', r'<p>\s*苏剑林\.\s*\([^)]+\)\.\s*《[^》]+》\s*(?:\[Blog\s+post\])?\.\s*(?:Retrieved\s+from\s*)?(?:<a[^>]*>[^<]*</a>|https?://[^\s<]+)\s*</p>\s*', flags=re.IGNORECASE | re.DOTALL),
+]
 
-    # ========== BIBTEX BLOCKS ==========
+# ========== BIBTEX BLOCKS ==========
 
+BIBTEX_RULES = [
     # 7. Remove BibTeX code blocks
-    content = re.sub(
-        r'<pre><code>\s*@(?:online|article|misc)\s*\{[^}]*\}[^<]*</code></pre>\s*',
-        '',
-        content,
-        flags=re.DOTALL
-    )
+    DelimitedRule('bibtex-block', r'<pre><code>\s*@(?:online|article|misc)\s*\{', '}', r'[^<]*</code></pre>\s*'),
     # Also plain BibTeX without pre/code
-    content = re.sub(
-        r'@(?:online|article|misc)\s*\{\s*kexuefm-\d+\s*,[^}]+\}\s*',
-        '',
-        content,
-        flags=re.DOTALL
-    )
-
-    # ========== ORIGINAL ADDRESS ==========
-
-    # 8. Remove "Original Address" sections (various formats)
-    original_patterns = [
-        # <hr />\n<p><em><strong>Original Address:</strong>...</em></p>\n<hr>
-        r'<hr\s*/?\s*>\s*\n?\s*<p><em><strong>Original Address:</strong>.*?</em></p>\s*\n?\s*<hr\s*/?\s*>',
-        # <p><em><strong>Original Address:</strong>...</em></p>
-        r'<p>\s*<em>\s*<strong>\s*Original\s+Address[:\s]*</strong>.*?</em>\s*</p>\s*',
-        # <p>Original Address: ...</p>
-        r'<p>\s*Original\s+Address[:\s]*<a[^>]*>.*?</a>\s*</p>\s*',
-        # <em>Original Address: ...</em> (standalone)
-        r'^\s*<em>\s*Original\s+Address[:\s]*<a[^>]*>.*?</a>\s*</em>\s*$',
-        # Original Address: ... (standalone line)
-        r'^\s*Original\s+Address[:\s]*<a[^>]*>.*?</a>\s*$',
-    ]
-    for pattern in original_patterns:
-        content = re.sub(pattern, '', content, flags=re.MULTILINE | re.DOTALL | re.IGNORECASE)
-
-    # ========== COMMENT SECTION REFERENCES ==========
-
-    # 9. Remove "If you have any doubts/suggestions, please continue the discussion in the comments section" lines
-    comment_patterns = [
-        r'<p>\s*<strong>\s*If\s+you\s+have\s+any\s+(?:doubts?|questions?|suggestions?)[^<]*(?:comments?\s+section|discussion)[^<]*</strong>\s*</p>\s*',
-        r'<p>\s*If\s+you\s+have\s+any\s+(?:doubts?|questions?|suggestions?)[^<]*(?:comments?\s+section|discussion)[^<]*</p>\s*',
-        r'<strong>\s*If\s+you\s+have\s+any\s+(?:doubts?|questions?|suggestions?)[^<]*(?:comments?\s+section|discussion)[^<]*</strong>\s*',
-    ]
-    for pattern in comment_patterns:
-        content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-
-    # ========== REFERENCE FOR CITATION ==========
-
+    DelimitedRule('bibtex-plain', r'@(?:online|article|misc)\s*\{\s*kexuefm-\d+\s*,', '}', r'\s*', min_gap=1),
+]
+
+# ========== ORIGINAL ADDRESS ==========
+
+# 8. Remove "Original Address" sections (various formats)
+ORIGINAL_ADDRESS_RULES = [
+    # <hr />\n<p><em><strong>Original Address:</strong>...</em></p>\n<hr>
+    LazySpanRule(
+        'original-address-hr',
+        anchor=r'<hr',
+        prefix=r'<hr\s*(?:/\s*)?>\s*<p><em><strong>Original Address:</strong>',
+        closer=r'</em',
+        suffix=r'</em></p>\s*<hr\s*(?:/\s*)?>',
+        flags=re.MULTILINE | re.IGNORECASE,
+    ),
+    # <p><em><strong>Original Address:</strong>...</em></p>
+    LazySpanRule(
+        'original-address-em-p',
+        anchor=r'<p',
+        prefix=r'<p>\s*<em>\s*<strong>\s*Original\s+Address[:\s]*</strong>',
+        closer=r'</em',
+        suffix=r'</em>\s*</p>\s*',
+        flags=re.MULTILINE | re.IGNORECASE,
+    ),
+    # <p>Original Address: ...</p>
+    LazySpanRule(
+        'original-address-p',
+        anchor=r'<p',
+        prefix=r'<p>\s*Original\s+Address[:\s]*<a[^>]*>',
+        closer=r'</a',
+        suffix=r'</a>\s*</p>\s*',
+        flags=re.MULTILINE | re.IGNORECASE,
+    ),
+    # <em>Original Address: ...</em> (standalone line)
+    LazySpanRule(
+        'original-address-em',
+        anchor=r'<em',
+        prefix=r'<em>\s*Original\s+Address[:\s]*<a[^>]*>',
+        closer=r'</a',
+        suffix=r'</a>\s*</em>\s*$',
+        flags=re.MULTILINE | re.IGNORECASE,
+        line_start=True,
+    ),
+    # Original Address: ... (standalone line)
+    LazySpanRule(
+        'original-address-line',
+        anchor=r'Original\s+Address',
+        prefix=r'Original\s+Address[:\s]*<a[^>]*>',
+        closer=r'</a',
+        suffix=r'</a>\s*$',
+        flags=re.MULTILINE | re.IGNORECASE,
+        line_start=True,
+    ),
+]
+
+# ========== COMMENT SECTION REFERENCES ==========
+
+# 9. Remove "If you have any doubts/suggestions, please continue the discussion in the comments section" lines
+COMMENT_RULES = [
+    RegexRule('comment-1', r'<p>\s*<strong>\s*If\s+you\s+have\s+any\s+(?:doubts?|questions?|suggestions?)[^<]*(?:comments?\s+section|discussion)[^<]*</strong>\s*</p>\s*', flags=re.IGNORECASE),
+    RegexRule('comment-2', r'<p>\s*If\s+you\s+have\s+any\s+(?:doubts?|questions?|suggestions?)[^<]*(?:comments?\s+section|discussion)[^<]*</p>\s*', flags=re.IGNORECASE),
+    RegexRule('comment-3', r'<strong>\s*If\s+you\s+have\s+any\s+(?:doubts?|questions?|suggestions?)[^<]*(?:comments?\s+section|discussion)[^<]*</strong>\s*', flags=re.IGNORECASE),
+]
+
+# ========== REFERENCE FOR CITATION ==========
+
+REFERENCE_RULES = [
     # 10. Remove "Reference for citation:" blocks
-    content = re.sub(
-        r'<p>\s*<strong>\s*Reference\s+for\s+citation[:\s]*</strong>\s*</p>\s*',
-        '',
-        content,
-        flags=re.IGNORECASE
-    )
+    RegexRule('reference-for-citation', r'<p>\s*<strong>\s*Reference\s+for\s+citation[:\s]*</strong>\s*</p>\s*', flags=re.IGNORECASE),
+]
 
-    # ========== CLEANUP ==========
+# ========== CLEANUP ==========
 
+WHITESPACE_RULES = [
     # 11. Clean up any double <hr> tags that might result
-    content = re.sub(r'(<hr\s*/?\s*>)\s*\n?\s*(<hr\s*/?\s*>)', r'\1', content)
-
+    RegexRule('double-hr', r'(<hr\s*(?:/\s*)?>)\s*(<hr\s*(?:/\s*)?>)', r'\1'),
     # 12. Remove orphaned <hr> before footer
-    content = re.sub(r'<hr\s*/?\s*>\s*\n?\s*(<hr>\s*\n?\s*<footer)', r'\1', content)
-
+    RegexRule('orphan-hr', r'<hr\s*(?:/\s*)?>\s*(<hr>\s*<footer)', r'\1'),
     # 13. Remove empty paragraphs
-    content = re.sub(r'<p>\s*</p>\s*', '', content)
-
+    RegexRule('empty-paragraph', r'<p>\s*</p>\s*'),
     # 14. Remove duplicate author/date lines (By 苏剑林 | DATE)
-    content = re.sub(
-        r'(<p>By 苏剑林 \| [^<]+</p>)\s*(?:<p>By 苏剑林 \| [^<]+</p>\s*)+',
-        r'\1\n\n',
-        content
-    )
-
+    RegexRule('duplicate-author', r'(<p>By 苏剑林 \| [^<]+</p>)\s*(?:<p>By 苏剑林 \| [^<]+</p>\s*)+', r'\1\n\n'),
     # 14b. Remove duplicate translated author/date lines after the canonical one.
-    content = re.sub(
-        r'(<p>By 苏剑林 \| [^<]+</p>)\s*(?:<p>By (?:Jianlin Su|Su Jianlin) \| [^<]+</p>\s*)+',
-        r'\1\n\n',
-        content
-    )
-
+    RegexRule('duplicate-author-translated', r'(<p>By 苏剑林 \| [^<]+</p>)\s*(?:<p>By (?:Jianlin Su|Su Jianlin) \| [^<]+</p>\s*)+', r'\1\n\n'),
     # 15. Remove excessive blank lines (more than 2 consecutive)
-    content = re.sub(r'\n{4,}', '\n\n\n', content)
+    RegexRule('blank-lines', r'\n{4,}', '\n\n\n'),
+    # 16. Clean up whitespace before footer (starting at the first newline of a run)
+    RegexRule('footer-whitespace', r'(?<!\n)\n{3,}(<hr>\s*\n\s*<footer)', r'\n\n\1'),
+]
 
-    # 16. Clean up whitespace before footer
-    content = re.sub(r'\n{3,}(<hr>\s*\n\s*<footer)', r'\n\n\1', content)
-
-    # ========== LATEX FIXES ==========
+# ========== LATEX FIXES ==========
 
+LATEX_RULES = [
     # 17. Fix double-escaped \text commands (\\text -> \text) but NOT inside <script> tags
-    # Split content by script tags, only fix non-script parts
-    def fix_text_outside_scripts(content):
-        parts = re.split(r'(<script>.*?</script>)', content, flags=re.DOTALL)
-        fixed_parts = []
-        for part in parts:
-            if part.startswith('<script>'):
-                fixed_parts.append(part)  # Leave script content unchanged
-            else:
-                fixed_parts.append(re.sub(r'\\\\text\{', r'\\text{', part))
-        return ''.join(fixed_parts)
-
-    content = fix_text_outside_scripts(content)
-
+    FunctionRule('text-outside-scripts', fix_text_outside_scripts),
     # 18. Remove \nolimits from custom macros (not supported by MathJax macros)
     # Pattern: \macro\nolimits_ -> \macro_
-    content = re.sub(r'\\([a-zA-Z]+)\\nolimits([_^])', r'\\\1\2', content)
+    RegexRule('nolimits-macro', r'\\([a-zA-Z]+)\\nolimits([_^])', r'\\\1\2'),
     # Pattern: }\nolimits_ -> }_ (for \mathop{...}\nolimits_)
-    content = re.sub(r'\}\\nolimits([_^])', r'}\1', content)
+    RegexRule('nolimits-brace', r'\}\\nolimits([_^])', r'}\1'),
+]
+
+CLEANUP_RULES = (
+    HEADING_RULES
+    + REPRINT_RULES
+    + FAQ_RULES
+    + CITE_RULES
+    + SHARE_RULES
+    + CITATION_PARAGRAPH_RULES
+    + BIBTEX_RULES
+    + ORIGINAL_ADDRESS_RULES
+    + COMMENT_RULES
+    + REFERENCE_RULES
+    + WHITESPACE_RULES
+    + LATEX_RULES
+)
+
+
+def add_back_button(content: str) -> str:
+    """Add a back button to the index page if not already present."""
+    back_button_html = '''<nav style="margin-bottom: 1.5em;">
+    <a href="../index.html" style="display: inline-flex; align-items: center; color: #555; text-decoration: none; font-size: 0.95em;">
+        <span style="margin-right: 0.3em;">&larr;</span> Back to Index
+    </a>
+</nav>
+
+'''
+    # Check if back button already exists
+    if 'Back to Index' in content:
+        return content
+
+    # Find the h1 tag and insert back button before it (allowing for leading whitespace)
+    h1_match = find_at_line_start(content, '<h1>')
+    if h1_match:
+        insert_pos, h1_pos = h1_match
+        indent = content[insert_pos:h1_pos]  # Preserve the indentation
+        content = content[:insert_pos] + indent + back_button_html.strip() + '\n\n' + content[insert_pos:]
 
     return content
 
 
-def main():
-    root_dir = Path(__file__).parent.parent
-    translations_dir = root_dir / 'translations'
+def cleanup_article(content: str) -> str:
+    """Clean up various non-standard elements from an article."""
+    for rule in CLEANUP_RULES:
+        content = rule.apply(content)
+    return content
+
+
+def main(translations_dir=None):
+    """Clean up every translation file in place.
+
+    Returns the number of files changed.
+    """
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
 
     fixed_count = 0
     for html_file in sorted(translations_dir.glob('translation_*.html')):
@@ -274,7 +309,9 @@ def main():
             print(f"Fixed: {html_file.name}")
 
     print(f"\nTotal files fixed: {fixed_count}")
+    return fixed_count
 
 
 if __name__ == '__main__':
+    profile_from_argv('cleanup_articles')
     main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Paths shared by the pipeline scripts.
+
+Every path is resolved from the location of this file, so the scripts behave
+the same whatever the current working directory is.
+"""
+
+from pathlib import Path
+
+
+class Config:
+    """Locations of the repository, the cache and the generated site files.
+
+    Args:
+        root_dir: Repository root (translations/, assets/, index.html, public/, .env).
+        cache_dir: Cache directory (raw/, metadata, run logs, profiles).
+    """
+
+    def __init__(self, root_dir=None, cache_dir=None):
+        script_dir = Path(__file__).resolve().parent
+        self.root_dir = Path(root_dir or script_dir.parent)
+        self.cache_dir = Path(cache_dir or script_dir / 'cache')
+
+    @property
+    def raw_dir(self):
+        return self.cache_dir / 'raw'
+
+    @property
+    def translations_dir(self):
+        return self.root_dir / 'translations'
+
+    @property
+    def index_path(self):
+        return self.root_dir / 'index.html'
+
+    @property
+    def search_dir(self):
+        return self.root_dir / 'search'
+
+    @property
+    def assets_dir(self):
+        return self.root_dir / 'assets'
+
+    @property
+    def publish_dir(self):
+        return self.root_dir / 'public'
+
+    @property
+    def env_path(self):
+        return self.root_dir / '.env'
+
+
+CONFIG = Config()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Optional SQLite store of the whole corpus, with full-text search.
+
+The files stay the source of truth: cache/raw/<id>.txt, translations/
+translation_<id>.html and the JSON and text files of cache/ (metadata.json,
+urls.json, ...). ``import`` copies them into cache/corpus.db; like the date
+index, a file is only read again when its size or mtime changed, so
+re-importing before a query costs one stat per file. ``export`` writes the
+same files back, byte for byte and with their mtimes, so the layout can be
+rebuilt from the database alone.
+
+Tables:
+
+- raw(id, text, chars, bytes, mtime_ns): the cached Chinese pages
+- translations(id, title, html, bytes, mtime_ns)
+- files(name, content, mtime_ns): the other cache files, verbatim
+- stats(name, value): article counts and total characters, kept current by
+  triggers, so totals are one primary-key lookup instead of reading every
+  file
+- raw_fts: FTS5 over the raw text with the trigram tokenizer, which finds
+  any Chinese substring of three or more characters
+- translations_fts: FTS5 over the translations' title and text, as the
+  search index extracts them
+
+translate.py uses the store when cache/corpus.db exists: token totals come
+from stats after sync_raw, which reads only the raw files that changed.
+translate-all still checks for each translation file, since a full sync
+re-reads every translation changed since the last one.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+from config import CONFIG
+
+DB_PATH = CONFIG.cache_dir / 'corpus.db'
+DB_VERSION = 1
+
+# Cache files stored verbatim, besides raw/
+CACHE_FILES = ['metadata.json', 'urls.json', 'firecrawl_results.json', 'translation_progress.json',
+               'content_index.txt', 'failed_articles.txt']
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS raw (
+    id INTEGER PRIMARY KEY, text TEXT NOT NULL, chars INTEGER NOT NULL,
+    bytes INTEGER NOT NULL, mtime_ns INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS translations (
+    id INTEGER PRIMARY KEY, title TEXT, html TEXT NOT NULL,
+    bytes INTEGER NOT NULL, mtime_ns INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY, content TEXT NOT NULL, mtime_ns INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO stats VALUES ('raw_count', 0), ('raw_chars', 0), ('translation_count', 0);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS raw_fts USING fts5(
+    text, content='raw', content_rowid='id', tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS translations_fts USING fts5(title, text);
+
+CREATE TRIGGER IF NOT EXISTS raw_insert AFTER INSERT ON raw BEGIN
+    UPDATE stats SET value = value + 1 WHERE name = 'raw_count';
+    UPDATE stats SET value = value + new.chars WHERE name = 'raw_chars';
+    INSERT INTO raw_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS raw_delete AFTER DELETE ON raw BEGIN
+    UPDATE stats SET value = value - 1 WHERE name = 'raw_count';
+    UPDATE stats SET value = value - old.chars WHERE name = 'raw_chars';
+    INSERT INTO raw_fts(raw_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS raw_update AFTER UPDATE ON raw BEGIN
+    UPDATE stats SET value = value - old.chars + new.chars WHERE name = 'raw_chars';
+    INSERT INTO raw_fts(raw_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO raw_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS translation_insert AFTER INSERT ON translations BEGIN
+    UPDATE stats SET value = value + 1 WHERE name = 'translation_count';
+END;
+CREATE TRIGGER IF NOT EXISTS translation_delete AFTER DELETE ON translations BEGIN
+    UPDATE stats SET value = value - 1 WHERE name = 'translation_count';
+    DELETE FROM translations_fts WHERE rowid = old.id;
+END;
+'''
+
+
+def exists(db_path=DB_PATH):
+    """Whether the optional store has been created."""
+    return Path(db_path).exists()
+
+
+def connect(db_path=DB_PATH):
+    """Open the store, creating the schema (or recreating an outdated one)."""
+    db_path = Path(db_path)
+    conn = sqlite3.connect(db_path)
+    version = conn.execute('PRAGMA user_version').fetchone()[0]
+    if version not in (0, DB_VERSION):
+        conn.close()
+        db_path.unlink()
+        conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    conn.execute(f'PRAGMA user_version = {DB_VERSION}')
+    return conn
+
+
+def changed_files(conn, table, paths):
+    """Yield (id, path, stat) for files whose size or mtime differ from the table."""
+    known = {row[0]: row[1:] for row in conn.execute(f'SELECT id, bytes, mtime_ns FROM {table}')}
+    for article_id, path in paths.items():
+        stat = path.stat()
+        if known.get(article_id) != (stat.st_size, stat.st_mtime_ns):
+            yield article_id, path, stat
+
+
+def remove_missing(conn, table, ids):
+    """Delete the rows whose file is gone; returns how many."""
+    missing = [(i,) for (i,) in conn.execute(f'SELECT id FROM {table}') if i not in ids]
+    conn.executemany(f'DELETE FROM {table} WHERE id = ?', missing)
+    return len(missing)
+
+
+def sync_raw(conn, raw_dir=None):
+    """Import new and changed raw files and drop deleted ones.
+
+    Enough for the raw totals in stats(); translations are not read.
+    Returns the number of rows written or deleted.
+    """
+    raw_dir = Path(raw_dir or CONFIG.raw_dir)
+    count = 0
+    with conn:
+        raw_paths = {int(p.stem): p for p in raw_dir.glob('*.txt') if p.stem.isdigit()}
+        for article_id, path, stat in changed_files(conn, 'raw', raw_paths):
+            text = path.read_bytes().decode('utf-8')
+            conn.execute('INSERT INTO raw VALUES (?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET '
+                         'text = excluded.text, chars = excluded.chars, bytes = excluded.bytes, '
+                         'mtime_ns = excluded.mtime_ns',
+                         (article_id, text, len(text), stat.st_size, stat.st_mtime_ns))
+            count += 1
+        count += remove_missing(conn, 'raw', raw_paths)
+    return count
+
+
+def sync(conn, raw_dir=None, translations_dir=None, cache_dir=None, verbose=False):
+    """Import new and changed files into the store and drop deleted ones.
+
+    Returns the number of rows written or deleted.
+    """
+    from build_search_index import extract_content
+
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
+    cache_dir = Path(cache_dir or CONFIG.cache_dir)
+    count = sync_raw(conn, raw_dir)
+
+    with conn:
+        translation_paths = {int(p.stem.split('_')[1]): p for p in translations_dir.glob('translation_*.html')
+                             if p.stem.split('_')[1].isdigit()}
+        for article_id, path, stat in changed_files(conn, 'translations', translation_paths):
+            html = path.read_bytes().decode('utf-8')
+            title, text = extract_content(html)
+            conn.execute('INSERT INTO translations VALUES (?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET '
+                         'title = excluded.title, html = excluded.html, bytes = excluded.bytes, '
+                         'mtime_ns = excluded.mtime_ns',
+                         (article_id, title, html, stat.st_size, stat.st_mtime_ns))
+            conn.execute('DELETE FROM translations_fts WHERE rowid = ?', (article_id,))
+            conn.execute('INSERT INTO translations_fts(rowid, title, text) VALUES (?, ?, ?)',
+                         (article_id, title or '', text))
+            count += 1
+        count += remove_missing(conn, 'translations', translation_paths)
+
+        stored = {name: mtime for name, mtime in conn.execute('SELECT name, mtime_ns FROM files')}
+        for name in CACHE_FILES:
+            path = cache_dir / name
+            if not path.exists():
+                if name in stored:
+                    conn.execute('DELETE FROM files WHERE name = ?', (name,))
+                    count += 1
+            elif stored.get(name) != path.stat().st_mtime_ns:
+                conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?)',
+                             (name, path.read_bytes().decode('utf-8'), path.stat().st_mtime_ns))
+                count += 1
+
+    if verbose:
+        print(f"Corpus store: {count} rows updated")
+    return count
+
+
+def export(conn, raw_dir=None, translations_dir=None, cache_dir=None):
+    """Write every stored file back to the file layout, with its mtime.
+
+    Returns the number of files written.
+    """
+    raw_dir = Path(raw_dir or CONFIG.raw_dir)
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
+    cache_dir = Path(cache_dir or CONFIG.cache_dir)
+    written = 0
+
+    def write(path, content, mtime_ns):
+        nonlocal written
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode('utf-8'))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        written += 1
+
+    for article_id, text, mtime_ns in conn.execute('SELECT id, text, mtime_ns FROM raw'):
+        write(raw_dir / f'{article_id}.txt', text, mtime_ns)
+    for article_id, html, mtime_ns in conn.execute('SELECT id, html, mtime_ns FROM translations'):
+        write(translations_dir / f'translation_{article_id}.html', html, mtime_ns)
+    for name, content, mtime_ns in conn.execute('SELECT name, content, mtime_ns FROM files'):
+        write(cache_dir / name, content, mtime_ns)
+    return written
+
+
+def stats(conn):
+    """Article counts and total raw characters, from the trigger-maintained table."""
+    return dict(conn.execute('SELECT name, value FROM stats'))
+
+
+def untranslated_ids(conn):
+    """IDs of cached articles with no translation, newest first."""
+    return [row[0] for row in conn.execute(
+        'SELECT id FROM raw WHERE id NOT IN (SELECT id FROM translations) ORDER BY id DESC')]
+
+
+def raw_text(conn, article_id):
+    """The cached raw text of one article, or None."""
+    row = conn.execute('SELECT text FROM raw WHERE id = ?', (int(article_id),)).fetchone()
+    return row[0] if row else None
+
+
+def search(conn, query, limit=10):
+    """Full-text search of translations and raw pages.
+
+    Returns (id, title, snippet) rows: translations ranked by bm25 first,
+    then raw pages matching a Chinese query.
+    """
+    # Every word quoted, so punctuation in the query is not FTS5 syntax
+    phrase = ' '.join('"' + word.replace('"', '""') + '"' for word in query.split())
+    if not phrase:
+        return []
+    rows = conn.execute(
+        "SELECT rowid, title, snippet(translations_fts, 1, '[', ']', '...', 12) FROM translations_fts "
+        'WHERE translations_fts MATCH ? ORDER BY bm25(translations_fts, 5.0, 1.0) LIMIT ?',
+        (phrase, limit)).fetchall()
+    # The trigram tokenizer cannot match words shorter than three characters
+    if len(rows) < limit and min(len(word) for word in query.split()) >= 3:
+        seen = {row[0] for row in rows}
+        for article_id, snippet in conn.execute(
+                "SELECT rowid, snippet(raw_fts, 0, '[', ']', '...', 12) FROM raw_fts "
+                'WHERE raw_fts MATCH ? ORDER BY rank LIMIT ?', (phrase, limit)):
+            if article_id not in seen and len(rows) < limit:
+                title = conn.execute('SELECT title FROM translations WHERE id = ?', (article_id,)).fetchone()
+                rows.append((article_id, title[0] if title else None, snippet))
+    return rows
+
+
+def run(action, query='', to=None, limit=10):
+    """Run one store command: import, export, stats or search."""
+    import time
+
+    if action != 'import' and not exists():
+        print(f"No corpus store at {DB_PATH}; run the import first")
+        return
+    conn = connect()
+    start = time.perf_counter()
+    if action == 'import':
+        count = sync(conn)
+        print(f"Imported {count} changed files into {DB_PATH} in {time.perf_counter() - start:.2f}s")
+    elif action == 'export':
+        if to:
+            root = Path(to)
+            count = export(conn, root / 'raw', root / 'translations', root)
+        else:
+            count = export(conn)
+        print(f"Exported {count} files in {time.perf_counter() - start:.2f}s")
+    elif action == 'stats':
+        sync(conn)
+        totals = stats(conn)
+        print(f"{totals['raw_count']} cached articles ({totals['raw_chars']:,} chars), "
+              f"{totals['translation_count']} translations, "
+              f"{len(untranslated_ids(conn))} cached articles without a translation")
+    else:
+        sync(conn)
+        rows = search(conn, query, limit)
+        for article_id, title, snippet in rows:
+            print(f"{article_id}  {title or '(no translation)'}\n    {snippet}")
+        print(f"{len(rows)} results in {(time.perf_counter() - start) * 1000:.1f} ms")
+    conn.close()
+
+
+def add_arguments(parser):
+    """The store command's arguments, shared with translate.py's db command."""
+    parser.add_argument('action', choices=['import', 'export', 'stats', 'search'])
+    parser.add_argument('query', nargs='*', help="Words to search for (search)")
+    parser.add_argument('--to', help="Export into this directory (raw/, translations/ and the cache files) "
+                                     "instead of the configured locations")
+    parser.add_argument('--limit', type=int, default=10, help="Results to show (search)")
+    return parser
+
+
+if __name__ == '__main__':
+    import argparse
+
+    args = add_arguments(argparse.ArgumentParser(
+        description="Optional SQLite store of the corpus, with full-text search.")).parse_args()
+    run(args.action, ' '.join(args.query), args.to, args.limit)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Index publication dates found in the raw cache.
+
+Each raw article ends with a citation like ``苏剑林. (Jan. 06, 2022)`` or
+``苏剑林. (2022-01-06)``. This module scans the raw cache once, records the
+date and which format matched per article ID, and only re-reads raw files
+whose size or mtime changed since the last run.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+from config import CONFIG
+
+DATE_INDEX_VERSION = 1
+
+RAW_DIR = CONFIG.raw_dir
+DATE_INDEX_PATH = CONFIG.cache_dir / 'raw_dates.json'
+
+# (format name, pattern, parser) tried in order
+DATE_FORMATS = [
+    # Abbreviated month: 苏剑林. (Jan. 06, 2022)
+    ('abbrev',
+     re.compile(r'苏剑林\.\s*\(([A-Z][a-z]{2,3})\.?\s*(\d{1,2}),?\s*(\d{4})\)'),
+     lambda m: datetime.strptime(f"{m.group(1)[:3]} {m.group(2)} {m.group(3)}", "%b %d %Y")),
+    # ISO: 苏剑林. (2022-01-06)
+    ('iso',
+     re.compile(r'苏剑林\.\s*\((\d{4})-(\d{2})-(\d{2})\)'),
+     lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))),
+]
+
+
+def extract_raw_date(raw_content):
+    """Find the publication date in raw article text.
+
+    Returns (datetime, format name), or (None, None) if no format matched.
+    """
+    for name, pattern, parse in DATE_FORMATS:
+        match = pattern.search(raw_content)
+        if match:
+            try:
+                return parse(match), name
+            except ValueError:
+                continue
+    return None, None
+
+
+def load_date_index(index_path=DATE_INDEX_PATH):
+    """Load the date index, returning an empty one if missing or outdated."""
+    index_path = Path(index_path)
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == DATE_INDEX_VERSION:
+            return index
+    return {'version': DATE_INDEX_VERSION, 'articles': {}}
+
+
+def save_date_index(index, index_path=DATE_INDEX_PATH):
+    """Write the date index atomically."""
+    index_path = Path(index_path)
+    tmp_path = index_path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    tmp_path.replace(index_path)
+
+
+def update_date_index(raw_dir=RAW_DIR, index_path=DATE_INDEX_PATH):
+    """Bring the date index up to date with the raw cache.
+
+    Only raw files whose size or mtime changed are read. Returns the index dict,
+    whose 'articles' map ID -> {'date', 'format', 'bytes', 'mtime_ns'}.
+    """
+    index = load_date_index(index_path)
+    entries = index['articles']
+    seen = set()
+    changed = False
+
+    for raw_file in Path(raw_dir).glob('*.txt'):
+        article_id = raw_file.stem
+        seen.add(article_id)
+        stat = raw_file.stat()
+        entry = entries.get(article_id)
+        if entry and entry['bytes'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            continue
+
+        date, fmt = extract_raw_date(raw_file.read_text(encoding='utf-8'))
+        entries[article_id] = {
+            'date': date.strftime('%Y-%m-%d') if date else None,
+            'format': fmt,
+            'bytes': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        changed = True
+
+    for article_id in [a for a in entries if a not in seen]:
+        del entries[article_id]
+        changed = True
+
+    if changed:
+        save_date_index(index, index_path)
+
+    return index
+
+
+def lookup_date(index, article_id):
+    """Return the publication datetime for an article, or None."""
+    entry = index['articles'].get(str(article_id))
+    if not entry or not entry['date']:
+        return None
+    return datetime.strptime(entry['date'], '%Y-%m-%d')
+
+
+def missing_dates(index):
+    """Return the IDs of raw articles with no recognizable date."""
+    return sorted((a for a, e in index['articles'].items() if not e['date']), key=int)
+
+
+def main():
+    index = update_date_index()
+    entries = index['articles']
+    formats = {}
+    for entry in entries.values():
+        formats[entry['format']] = formats.get(entry['format'], 0) + 1
+
+    print(f"Date index at {DATE_INDEX_PATH} covers {len(entries)} raw articles")
+    for fmt, count in sorted(formats.items(), key=lambda x: str(x[0])):
+        print(f"  {fmt or 'no date'}: {count}")
+
+    missing = missing_dates(index)
+    if missing:
+        print(f"Articles with no date ({len(missing)}): {missing}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,59 +1,40 @@
 #!/usr/bin/env python3
 """Generate a contents page for all translated articles."""
 
-import os
-import re
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
-def extract_info(filepath):
-    """Extract title and date from a translation file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Extract title from <h1><a href="...">TITLE</a></h1>
-    title_match = re.search(r'<h1><a href="[^"]+">([^<]+)</a></h1>', content)
-    title = title_match.group(1) if title_match else None
-
-    # Extract date - handle both "By 苏剑林 | DATE" and "By Su Jianlin | DATE"
-    date_match = re.search(r'By (?:苏剑林|Su Jianlin) \| ([A-Za-z]+\.? \d+, \d+)', content)
-    date_str = date_match.group(1) if date_match else None
-
-    date = None
-    if date_str:
-        # Try various date formats
-        for fmt in ["%B %d, %Y", "%b %d, %Y", "%b. %d, %Y"]:
-            try:
-                date = datetime.strptime(date_str, fmt)
-                break
-            except ValueError:
-                continue
-
-    return title, date, date_str
-
-def main():
-    root_dir = Path(__file__).parent.parent
-    translations_dir = root_dir / "translations"
+from config import CONFIG
+from manifest import MANIFEST_PATH, update_manifest, manifest_articles
+from profiling import profile_from_argv
+
+def main(translations_dir=None, output_path=None, manifest_path=MANIFEST_PATH):
+    """Write the contents page (index.html at the repo root by default).
+
+    Returns the number of articles listed.
+    """
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
     articles = []
     missing = []
 
-    for filepath in translations_dir.glob("translation_*.html"):
-        title, date, date_str = extract_info(filepath)
-        if title and date:
+    # Titles and dates come from the manifest; only changed files are re-read
+    manifest = update_manifest(translations_dir, manifest_path)
+    for record in manifest_articles(manifest):
+        if record['title'] and record['date']:
             articles.append({
-                'filename': filepath.name,
-                'title': title,
-                'date': date,
-                'date_str': date_str
+                'filename': record['file'],
+                'title': record['title'],
+                'date': datetime.strptime(record['date'], '%Y-%m-%d'),
+                'date_str': record['date_str']
             })
         else:
-            missing.append(filepath.name)
+            missing.append(record['file'])
 
     # Sort by date, most recent first
     articles.sort(key=lambda x: x['date'], reverse=True)
 
     # Group by year, excluding 2009 and 2014
-    from collections import defaultdict
     excluded_years = {2009, 2014}
     by_year = defaultdict(list)
     for article in articles:
@@ -121,7 +102,8 @@ def main():
             top: 0;
             z-index: 10;
         }
-        ul {
+        ul,
+        .search-list {
             list-style: none;
             padding: 0;
             margin: 0;
@@ -211,6 +193,7 @@ def main():
         /* Search */
         .search-container {
             margin-bottom: 1.5em;
+            position: relative;
         }
         .search-box {
             width: 100%;
@@ -230,6 +213,23 @@ def main():
         .search-box::placeholder {
             color: #9ca3af;
         }
+        .search-suggestions {
+            position: absolute;
+            left: 0;
+            right: 0;
+            z-index: 20;
+            margin-top: 0.25em;
+            background: #fff;
+            border: 1px solid #d1d5db;
+            border-radius: 8px;
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
+        }
+        .search-suggestions li {
+            padding: 0.5em 1em;
+        }
+        .search-suggestions li.active {
+            background: #eff6ff;
+        }
         .search-results {
             font-size: 0.85em;
             color: #6b7280;
@@ -253,10 +253,12 @@ def main():
 
     <div class="search-container">
         <input type="text" class="search-box" id="search" placeholder="Search articles..." autocomplete="off">
+        <ul class="search-suggestions hidden" id="search-suggestions" role="listbox"></ul>
         <div class="search-results" id="search-results"></div>
     </div>
 
     <nav class="year-nav" id="year-nav"></nav>
+    <ol class="search-list hidden" id="search-list"></ol>
 
 '''
 
@@ -269,12 +271,516 @@ def main():
         html += '    </ul>\n'
 
     html += '''
-    <script src="search-index.js"></script>
+    <script type="text/worker" id="search-worker">
+    // Search worker: fetches and decodes the index and answers queries, so
+    // none of that work runs on the page's main thread
+    (function() {
+        // Same normalization as tokenize() in build_search_index.py
+        function tokenize(text) {
+            return text.normalize('NFKD').replace(/\\p{M}/gu, '').toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || [];
+        }
+
+        // Runs of CJK characters, matching CJK_PATTERN in build_search_index.py
+        const CJK_PATTERN = /[\\u3040-\\u30ff\\u3400-\\u4dbf\\u4e00-\\u9fff\\uac00-\\ud7af\\uf900-\\ufaff\\u{20000}-\\u{2ffff}]+/gu;
+
+        // Query terms, each {term, cjk}: CJK runs become overlapping bigrams
+        // (or a single character) for the Chinese index, the rest of each
+        // token is looked up in the English index
+        function queryTerms(query) {
+            const terms = [];
+            for (const token of tokenize(query)) {
+                let last = 0;
+                for (const match of token.matchAll(CJK_PATTERN)) {
+                    if (match.index > last) terms.push({ term: token.slice(last, match.index), cjk: false });
+                    const chars = Array.from(match[0]);
+                    if (chars.length === 1) terms.push({ term: chars[0], cjk: true });
+                    for (let i = 0; i + 1 < chars.length; i++) {
+                        terms.push({ term: chars[i] + chars[i + 1], cjk: true });
+                    }
+                    last = match.index + match[0].length;
+                }
+                if (last < token.length) terms.push({ term: token.slice(last), cjk: false });
+            }
+            return terms;
+        }
+
+        // The sharded index (format described in build_search_index.py) is
+        // fetched on demand: the manifest when the search box is first
+        // focused, each shard the first time a query needs it. URLs are
+        // absolute, since the worker's own URL is a blob: URL
+        let searchDir = null;
+        let manifestPromise = null;
+        let cjkPromise = null;
+        const shardPromises = new Map();
+
+        function fetchJson(url, options) {
+            return fetch(url, options).then(response => {
+                if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+                return response.json();
+            });
+        }
+
+        // Binary index files are read in place: every section is a view on
+        // the fetched buffer
+        function fetchSections(url) {
+            return fetch(url).then(response => {
+                if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+                return response.arrayBuffer();
+            }).then(buffer => {
+                const reader = { blob: new Uint8Array(buffer), position: 0 };
+                const sections = [];
+                while (reader.position < reader.blob.length) {
+                    const length = readVarint(reader);
+                    sections.push(reader.blob.subarray(reader.position, reader.position + length));
+                    reader.position += length;
+                }
+                return sections;
+            });
+        }
+
+        function loadManifest() {
+            if (!manifestPromise) {
+                manifestPromise = fetchJson(searchDir + 'manifest.json', { cache: 'no-cache' }).then(initFields);
+                // Try again on the next query if it failed
+                manifestPromise.catch(() => { manifestPromise = null; });
+            }
+            return manifestPromise;
+        }
+
+        // The Chinese index, only fetched for a query with CJK characters; it
+        // numbers articles like the English one, so it shares its docs
+        function loadCjkIndex(manifest) {
+            if (!cjkPromise) {
+                cjkPromise = fetchJson(searchDir + manifest.cjk).then(cjk => initFields({ ...cjk, docs: manifest.docs }));
+                cjkPromise.catch(() => { cjkPromise = null; });
+            }
+            return cjkPromise;
+        }
+
+        const utf8 = new TextDecoder();
+
+        function decodeTerms(dict) {
+            const terms = [];
+            let previous = '';
+            for (const coded of utf8.decode(dict).split(' ')) {
+                previous = previous.slice(0, parseInt(coded[0], 36)) + coded.slice(1);
+                terms.push(previous);
+            }
+            return terms;
+        }
+
+        function decodeShard([dict, postings], index) {
+            const terms = decodeTerms(dict);
+            const shard = { terms, blob: postings, offsets: new Map(), position: 0 };
+            // Byte offset of each term's postings, found by skipping through the blob once
+            for (const term of terms) {
+                shard.offsets.set(term, shard.position);
+                for (let n = readVarint(shard); n > 0; n--) {
+                    for (let flags = readVarint(shard) & index.fieldMask; flags; flags &= flags - 1) readVarint(shard);
+                }
+            }
+            return shard;
+        }
+
+        function readVarint(shard) {
+            let value = 0, shift = 0, byte;
+            do {
+                byte = shard.blob[shard.position++];
+                value += (byte & 0x7f) * 2 ** shift;
+                shift += 7;
+            } while (byte & 0x80);
+            return value;
+        }
+
+        function loadShard(name, index) {
+            if (!shardPromises.has(name)) {
+                const promise = fetchSections(searchDir + name).then(sections => decodeShard(sections, index));
+                promise.catch(() => shardPromises.delete(name));
+                shardPromises.set(name, promise);
+            }
+            return shardPromises.get(name);
+        }
+
+        // Names of the shards that can hold term, or any term starting with it
+        function shardsFor(shards, term, isPrefix) {
+            let lo = 0, hi = shards.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (shards[mid][0] <= term) lo = mid + 1; else hi = mid;
+            }
+            const names = [];
+            let i = Math.max(lo - 1, 0);
+            if (lo > 0 || isPrefix) names.push(shards[i][1]);
+            while (isPrefix && ++i < shards.length && shards[i][0].startsWith(term)) {
+                names.push(shards[i][1]);
+            }
+            return names;
+        }
+
+
+        // Fields (title, text, math) each set one flag bit in a posting;
+        // their average lengths are computed once an index is loaded
+        function initFields(index) {
+            const fields = index.bm25.fields;
+            index.fieldCount = fields.length;
+            index.fieldMask = (1 << fields.length) - 1;
+            index.fieldStats = fields.map((field, i) => ({
+                weight: field.weight,
+                b: field.b,
+                average: index.lengths.reduce((sum, l) => sum + l[i], 0) / index.lengths.length || 1,
+            }));
+            return index;
+        }
+
+        // BM25F score of one term in one article, from its per-field frequencies
+        function bm25f(index, doc, frequencies, documentFrequency) {
+            const lengths = index.lengths[doc];
+            let tf = 0;
+            index.fieldStats.forEach((field, i) => {
+                if (frequencies[i]) {
+                    tf += field.weight * frequencies[i] / (1 - field.b + field.b * lengths[i] / field.average);
+                }
+            });
+            const total = index.docs.length;
+            const idf = Math.log(1 + (total - documentFrequency + 0.5) / (documentFrequency + 0.5));
+            const k1 = index.bm25.k1;
+            return idf * tf * (k1 + 1) / (tf + k1);
+        }
+
+        // Map of doc number -> score for a term. A prefix is scored as one
+        // term: the frequencies of all terms starting with it are added up,
+        // so a rare completion cannot outrank the common ones. Given a set of
+        // candidates, only those articles are scored, though the document
+        // frequency still counts every article with the term
+        async function lookup(index, term, isPrefix, candidates = null) {
+            const shards = await Promise.all(shardsFor(index.shards, term, isPrefix).map(name => loadShard(name, index)));
+            const frequencies = new Map();
+            const matched = candidates ? new Set() : null;
+            for (const shard of shards) {
+                const matching = isPrefix ? shard.terms.filter(t => t.startsWith(term))
+                                          : shard.offsets.has(term) ? [term] : [];
+                for (const t of matching) {
+                    shard.position = shard.offsets.get(t);
+                    let doc = -1;
+                    for (let n = readVarint(shard); n > 0; n--) {
+                        const posting = readVarint(shard);
+                        doc += Math.floor(posting / (index.fieldMask + 1)) + 1;
+                        if (matched) {
+                            matched.add(doc);
+                            if (!candidates.has(doc)) {
+                                for (let flags = posting & index.fieldMask; flags; flags &= flags - 1) readVarint(shard);
+                                continue;
+                            }
+                        }
+                        const counts = frequencies.get(doc) || new Array(index.fieldCount).fill(0);
+                        for (let i = 0; i < index.fieldCount; i++) {
+                            if (posting & (1 << i)) counts[i] += readVarint(shard);
+                        }
+                        frequencies.set(doc, counts);
+                    }
+                }
+            }
+            const documentFrequency = matched ? matched.size : frequencies.size;
+            const docs = new Map();
+            for (const [doc, counts] of frequencies) {
+                docs.set(doc, bm25f(index, doc, counts, documentFrequency));
+            }
+            return docs;
+        }
+
+        // Number lists (title table, trigram index): the keys, and the byte
+        // offset of each key's list in the blob
+        function decodeLists(keys, postings) {
+            const table = { keys, blob: postings, offsets: [], position: 0 };
+            for (let i = 0; i < keys.length; i++) {
+                table.offsets.push(table.position);
+                for (let n = readVarint(table); n > 0; n--) readVarint(table);
+            }
+            return table;
+        }
+
+        function readList(table, i) {
+            table.position = table.offsets[i];
+            const numbers = [];
+            let number = -1;
+            for (let n = readVarint(table); n > 0; n--) {
+                number += readVarint(table) + 1;
+                numbers.push(number);
+            }
+            return numbers;
+        }
+
+        // First position in sorted keys whose key is >= key
+        function lowerBound(keys, key) {
+            let lo = 0, hi = keys.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (keys[mid] < key) lo = mid + 1; else hi = mid;
+            }
+            return lo;
+        }
+
+        let titlesPromise = null;
+        function loadTitles(manifest) {
+            if (!titlesPromise) {
+                titlesPromise = fetchSections(searchDir + manifest.titles).then(([dict, postings]) => decodeLists(decodeTerms(dict), postings));
+                titlesPromise.catch(() => { titlesPromise = null; });
+            }
+            return titlesPromise;
+        }
+
+        // Articles whose title has term, or a term starting with it
+        function titleDocs(titles, term, isPrefix) {
+            const docs = new Set();
+            for (let i = lowerBound(titles.keys, term); i < titles.keys.length; i++) {
+                const key = titles.keys[i];
+                if (isPrefix ? !key.startsWith(term) : key !== term) break;
+                readList(titles, i).forEach(doc => docs.add(doc));
+            }
+            return docs;
+        }
+
+
+        // IDs of up to eight articles whose title contains every query term,
+        // the last one as a prefix; titles with the fewest words, the closest
+        // matches, first
+        async function suggest(query) {
+            const terms = queryTerms(query).filter(t => !t.cjk).map(t => t.term);
+            const partial = !/\\s$/.test(query);
+            if (terms.length === 0) return [];
+            const manifest = await loadManifest();
+            const titles = await loadTitles(manifest);
+            let docs = null;
+            terms.forEach((term, i) => {
+                const matching = titleDocs(titles, term, partial && i === terms.length - 1);
+                docs = docs ? new Set([...docs].filter(doc => matching.has(doc))) : matching;
+            });
+            return [...docs]
+                .sort((a, b) => manifest.lengths[a][0] - manifest.lengths[b][0] || a - b)
+                .slice(0, 8)
+                .map(doc => manifest.docs[doc]);
+        }
+
+        // Typo tolerance: the trigram index over the vocabulary worth
+        // correcting to, fetched the first time a term matches nothing
+        let fuzzyPromise = null;
+        function loadFuzzy(manifest) {
+            if (!fuzzyPromise) {
+                fuzzyPromise = fetchSections(searchDir + manifest.fuzzy).then(([terms, grams, postings]) => {
+                    const fuzzy = decodeLists(decodeTerms(grams), postings);
+                    fuzzy.vocabulary = decodeTerms(terms);
+                    fuzzy.gramIndex = new Map(fuzzy.keys.map((gram, i) => [gram, i]));
+                    return fuzzy;
+                });
+                fuzzyPromise.catch(() => { fuzzyPromise = null; });
+            }
+            return fuzzyPromise;
+        }
+
+        // Same as trigrams() in build_search_index.py
+        function trigrams(term) {
+            const padded = Array.from('^' + term + '$');
+            const grams = new Set();
+            for (let i = 0; i + 2 < padded.length; i++) grams.add(padded.slice(i, i + 3).join(''));
+            return grams;
+        }
+
+        // Edit distance counting insertions, deletions, substitutions and
+        // swaps of adjacent characters, or max + 1 once it exceeds max
+        function editDistance(a, b, max) {
+            if (Math.abs(a.length - b.length) > max) return max + 1;
+            let before = null, previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+            for (let i = 1; i <= a.length; i++) {
+                const row = [i];
+                let best = i;
+                for (let j = 1; j <= b.length; j++) {
+                    const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+                    let d = Math.min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + cost);
+                    if (before && i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+                        d = Math.min(d, before[j - 2] + 1);
+                    }
+                    row.push(d);
+                    best = Math.min(best, d);
+                }
+                if (best > max) return max + 1;
+                before = previous;
+                previous = row;
+            }
+            return previous[b.length];
+        }
+
+        // Vocabulary terms closest to a term that matched nothing: each edit
+        // changes at most three trigrams, so a term within maxEdits shares
+        // all but 3 * maxEdits of them, and only those are compared in full
+        async function corrections(manifest, term) {
+            const length = Array.from(term).length;
+            const maxEdits = length < 4 ? 0 : length < 8 ? 1 : 2;
+            if (maxEdits === 0) return [];
+            const fuzzy = await loadFuzzy(manifest);
+            const grams = trigrams(term);
+            const shared = new Map();
+            for (const gram of grams) {
+                const i = fuzzy.gramIndex.get(gram);
+                if (i === undefined) continue;
+                for (const number of readList(fuzzy, i)) shared.set(number, (shared.get(number) || 0) + 1);
+            }
+            const needed = Math.max(1, grams.size - 3 * maxEdits);
+            const candidates = [];
+            for (const [number, count] of shared) {
+                if (count < needed) continue;
+                const candidate = fuzzy.vocabulary[number];
+                const distance = editDistance(term, candidate, maxEdits);
+                if (distance <= maxEdits) candidates.push({ candidate, distance, count });
+            }
+            candidates.sort((a, b) => a.distance - b.distance || b.count - a.count);
+            return candidates
+                .filter(c => c.distance === candidates[0].distance)
+                .slice(0, 3)
+                .map(c => c.candidate);
+        }
+
+
+        // Ranked results of recent queries, least recently used first, keyed
+        // by the normalized terms so "Muon" and "muon" share an entry
+        const RESULT_CACHE_SIZE = 50;
+        const resultCache = new Map();
+
+        function cachedResults(key) {
+            const entry = resultCache.get(key);
+            if (entry) {
+                resultCache.delete(key);
+                resultCache.set(key, entry);
+            }
+            return entry;
+        }
+
+        function cacheResults(key, entry) {
+            resultCache.set(key, entry);
+            if (resultCache.size > RESULT_CACHE_SIZE) resultCache.delete(resultCache.keys().next().value);
+        }
+
+        // The last query answered without typo corrections, and its articles
+        let lastQuery = null;
+
+        // Whether every article matching the new query also matched an earlier
+        // one: the earlier terms come first and unchanged, except that a last
+        // term matched as a prefix may have been typed further
+        function narrows(earlier, terms, partial) {
+            if (!earlier || earlier.terms.length > terms.length) return false;
+            return earlier.terms.every((before, i) => {
+                const now = terms[i];
+                if (now.cjk !== before.cjk) return false;
+                if (earlier.partial && i === earlier.terms.length - 1) return now.term.startsWith(before.term);
+                return now.term === before.term && !(partial && i === terms.length - 1);
+            });
+        }
+
+        // Ranked results for the terms. With candidates (the articles of a
+        // query this one narrows), only those are scored and no term is
+        // corrected, since a term missing from them may still occur elsewhere
+        async function runQuery(manifest, terms, partial, candidates) {
+            const cjk = terms.some(t => t.cjk) ? await loadCjkIndex(manifest) : null;
+            const matches = await Promise.all(terms.map(({ term, cjk: isCjk }, i) =>
+                lookup(isCjk ? cjk : manifest, term, partial && i === terms.length - 1, candidates)));
+            let corrected = null;
+            // Replace a term that matches nothing by its closest spellings,
+            // scoring each article by the best of them
+            await Promise.all(terms.map(async ({ term, cjk: isCjk }, i) => {
+                if (candidates || isCjk || matches[i].size > 0) return;
+                const replacements = await corrections(manifest, term);
+                if (replacements.length === 0) return;
+                const merged = new Map();
+                for (const docs of await Promise.all(replacements.map(r => lookup(manifest, r, false)))) {
+                    for (const [doc, score] of docs) merged.set(doc, Math.max(score, merged.get(doc) || 0));
+                }
+                matches[i] = merged;
+                corrected = corrected || terms.map(t => t.term);
+                corrected[i] = replacements[0];
+            }));
+
+            // Intersect, starting from the rarest term
+            matches.sort((a, b) => a.size - b.size);
+            const results = [];
+            const docs = new Set();
+            for (const doc of matches[0].keys()) {
+                let score = 0;
+                for (const scores of matches) {
+                    if (!scores.has(doc)) { score = -1; break; }
+                    score += scores.get(doc);
+                }
+                if (score >= 0) {
+                    results.push({ id: manifest.docs[doc], score });
+                    docs.add(doc);
+                }
+            }
+
+            // Most relevant first
+            results.sort((a, b) => b.score - a.score);
+            return { results, docs, correction: corrected && corrected.join(' ') };
+        }
+
+
+        // Ranked results for a query, or null if it has no terms
+        async function search(query) {
+            const terms = queryTerms(query);
+            if (terms.length === 0) return null;
+
+            // The last term may still be being typed, so it matches as a prefix
+            const partial = !/\\s$/.test(query);
+            const key = JSON.stringify([terms, partial]);
+            let entry = cachedResults(key);
+            if (!entry) {
+                const manifest = await loadManifest();
+                // Extending the last query only needs its articles rescored
+                const candidates = narrows(lastQuery, terms, partial) ? lastQuery.docs : null;
+                entry = await runQuery(manifest, terms, partial, candidates);
+                if (candidates && entry.results.length === 0) {
+                    entry = await runQuery(manifest, terms, partial, null);
+                }
+                cacheResults(key, entry);
+            }
+            if (!entry.correction) lastQuery = { terms, partial, docs: entry.docs };
+            return entry;
+        }
+
+        // Replies carry article IDs and scores as typed arrays whose buffers
+        // are transferred, not copied, to the page
+        self.onmessage = async ({ data }) => {
+            if (data.type === 'init') {
+                searchDir = data.searchDir;
+                return;
+            }
+            if (data.type === 'prefetch') {
+                loadManifest().then(loadTitles).catch(() => {});
+                return;
+            }
+            try {
+                if (data.type === 'search') {
+                    const entry = await search(data.query);
+                    if (!entry) {
+                        self.postMessage({ type: 'search', id: data.id, empty: true });
+                        return;
+                    }
+                    const ids = Uint32Array.from(entry.results, result => result.id);
+                    const scores = Float64Array.from(entry.results, result => result.score);
+                    self.postMessage({ type: 'search', id: data.id, ids, scores, correction: entry.correction },
+                                     [ids.buffer, scores.buffer]);
+                } else if (data.type === 'suggest') {
+                    const ids = Uint32Array.from(await suggest(data.query));
+                    self.postMessage({ type: 'suggest', id: data.id, ids }, [ids.buffer]);
+                }
+            } catch (error) {
+                self.postMessage({ type: data.type, id: data.id, error: true });
+            }
+        };
+    })();
+    </script>
     <script>
     (function() {
-        const searchIndex = window.SEARCH_INDEX || [];
         const searchInput = document.getElementById('search');
         const searchResults = document.getElementById('search-results');
+        const searchList = document.getElementById('search-list');
+        const suggestionList = document.getElementById('search-suggestions');
         const yearNav = document.getElementById('year-nav');
         const yearSections = document.querySelectorAll('h2[id^="y"]');
         const allLists = document.querySelectorAll('body > ul');
@@ -294,113 +800,157 @@ def main():
             fileToItem.set(filename, a.parentElement);
         });
 
+        // Search runs in a worker (the text/worker script above), so fetching
+        // and decoding the index never holds up scrolling or typing
+        const workerSource = document.getElementById('search-worker').textContent;
+        const worker = new Worker(URL.createObjectURL(new Blob([workerSource], { type: 'text/javascript' })));
+        worker.postMessage({ type: 'init', searchDir: new URL('search/', location.href).href });
+
+        // Incremented by every search and reset, so stale replies are dropped
+        let generation = 0;
+        let pendingQuery = '';
+
         function search(query) {
-            if (!query.trim()) {
-                resetView();
+            pendingQuery = query;
+            worker.postMessage({ type: 'search', id: ++generation, query });
+        }
+
+        worker.onmessage = ({ data }) => {
+            if (data.type === 'suggest') {
+                if (data.id === suggestionGeneration) displaySuggestions(data.error ? [] : data.ids);
                 return;
             }
+            if (data.id !== generation) return;
+            if (data.error) {
+                searchResults.textContent = 'Search is unavailable right now';
+            } else if (data.empty) {
+                resetView();
+            } else {
+                displayResults(data.ids, pendingQuery, data.correction);
+            }
+        };
 
-            const terms = query.toLowerCase().split(/\\s+/).filter(t => t.length > 0);
-            const results = [];
+        let suggestionGeneration = 0;
+        let activeSuggestion = -1;
 
-            for (const item of searchIndex) {
-                const titleLower = item.title.toLowerCase();
-                const contentLower = item.content.toLowerCase();
-                const combined = titleLower + ' ' + contentLower;
-
-                // Check if all terms match
-                const allMatch = terms.every(term => combined.includes(term));
-                if (allMatch) {
-                    // Score: title matches are weighted higher
-                    let score = 0;
-                    for (const term of terms) {
-                        if (titleLower.includes(term)) score += 10;
-                        if (contentLower.includes(term)) score += 1;
-                    }
-                    results.push({ ...item, score });
-                }
-            }
+        function showSuggestions(query) {
+            worker.postMessage({ type: 'suggest', id: ++suggestionGeneration, query });
+        }
 
-            // Sort by score descending
-            results.sort((a, b) => b.score - a.score);
+        function displaySuggestions(ids) {
+            const items = Array.from(ids, id => fileToItem.get(`translation_${id}.html`)).filter(Boolean);
+            activeSuggestion = -1;
+            suggestionList.replaceChildren(...items.map(li => {
+                const item = document.createElement('li');
+                item.setAttribute('role', 'option');
+                item.appendChild(li.querySelector('a').cloneNode(true));
+                return item;
+            }));
+            suggestionList.classList.toggle('hidden', items.length === 0);
+        }
+
+        function hideSuggestions() {
+            suggestionGeneration++;
+            activeSuggestion = -1;
+            suggestionList.classList.add('hidden');
+            suggestionList.replaceChildren();
+        }
 
-            displayResults(results, query);
+        function moveSuggestion(step) {
+            const items = suggestionList.children;
+            if (items.length === 0) return;
+            if (activeSuggestion >= 0) items[activeSuggestion].classList.remove('active');
+            activeSuggestion = (activeSuggestion + step + items.length + 1) % (items.length + 1) - 1;
+            if (activeSuggestion >= 0) items[activeSuggestion].classList.add('active');
         }
 
-        function displayResults(results, query) {
+        function displayResults(ids, query, correction) {
             // Hide year nav and all sections
             yearNav.classList.add('hidden');
             yearSections.forEach(h => h.classList.add('hidden'));
             allLists.forEach(ul => ul.classList.add('hidden'));
 
-            // Hide all list items first
-            fileToItem.forEach(li => li.classList.add('hidden'));
-
-            if (results.length === 0) {
+            if (ids.length === 0) {
                 searchResults.textContent = `No results for "${query}"`;
+                searchList.classList.add('hidden');
                 return;
             }
 
-            searchResults.textContent = `${results.length} result${results.length === 1 ? '' : 's'}`;
-
-            // Show matching items and their parent lists
-            const visibleLists = new Set();
-            for (const result of results) {
-                const li = fileToItem.get(result.file);
-                if (li) {
-                    li.classList.remove('hidden');
-                    const parentUl = li.parentElement;
-                    if (parentUl) {
-                        parentUl.classList.remove('hidden');
-                        visibleLists.add(parentUl);
-                    }
-                }
+            searchResults.textContent = `${ids.length} result${ids.length === 1 ? '' : 's'}`
+                + (correction ? ` for "${correction}"` : '');
+
+            // List copies of the matching items, most relevant first, with
+            // the year from their section added to the date
+            const items = [];
+            for (const id of ids) {
+                const li = fileToItem.get(`translation_${id}.html`);
+                if (!li) continue;
+                const copy = li.cloneNode(true);
+                const date = copy.querySelector('.date');
+                const heading = li.parentElement.previousElementSibling;
+                if (date && heading) date.textContent += `, ${heading.textContent}`;
+                items.push(copy);
             }
-
-            // Show year headers for visible lists
-            visibleLists.forEach(ul => {
-                const prevH2 = ul.previousElementSibling;
-                if (prevH2 && prevH2.tagName === 'H2') {
-                    prevH2.classList.remove('hidden');
-                }
-            });
+            searchList.replaceChildren(...items);
+            searchList.classList.remove('hidden');
         }
 
         function resetView() {
+            generation++;
             searchResults.textContent = '';
+            searchList.classList.add('hidden');
+            searchList.replaceChildren();
             yearNav.classList.remove('hidden');
             yearSections.forEach(h => h.classList.remove('hidden'));
             allLists.forEach(ul => ul.classList.remove('hidden'));
-            fileToItem.forEach(li => li.classList.remove('hidden'));
         }
 
-        // Debounce search
+        // Start loading the index as soon as the visitor shows interest in searching
+        searchInput.addEventListener('focus', () => worker.postMessage({ type: 'prefetch' }), { once: true });
+
+        // Suggest titles on every keystroke; debounce the full search
         let debounceTimer;
         searchInput.addEventListener('input', (e) => {
+            showSuggestions(e.target.value);
             clearTimeout(debounceTimer);
             debounceTimer = setTimeout(() => search(e.target.value), 150);
         });
 
-        // Clear on Escape
+        // Arrow keys pick a suggestion and Enter opens it; Escape closes the
+        // suggestions, then clears the search
         searchInput.addEventListener('keydown', (e) => {
-            if (e.key === 'Escape') {
+            if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+                e.preventDefault();
+                moveSuggestion(e.key === 'ArrowDown' ? 1 : -1);
+            } else if (e.key === 'Enter' && activeSuggestion >= 0) {
+                window.location.href = suggestionList.children[activeSuggestion].querySelector('a').href;
+            } else if (e.key === 'Escape') {
+                if (!suggestionList.classList.contains('hidden')) {
+                    hideSuggestions();
+                    return;
+                }
                 searchInput.value = '';
                 resetView();
             }
         });
+        searchInput.addEventListener('blur', hideSuggestions);
+        // Keep the focus in the box while a suggestion is clicked
+        suggestionList.addEventListener('mousedown', (e) => e.preventDefault());
     })();
     </script>
 </body>
 </html>
 '''
 
-    output_path = root_dir / "index.html"
+    output_path = Path(output_path or CONFIG.index_path)
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(html)
 
     print(f"Generated index.html with {len(articles)} articles")
     if missing:
         print(f"Missing from index ({len(missing)} files - no title/date): {sorted(missing)}")
+    return len(articles)
 
 if __name__ == "__main__":
+    profile_from_argv('generate_contents')
     main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Linear-time HTML transforms.
+
+Several cleanup rules have the shape ``PREFIX .*? SUFFIX`` compiled with
+re.DOTALL. A regex engine retries the lazy ``.*?`` from every place PREFIX
+matches, so a document with many openers and no closer costs O(n^2). Here
+every candidate closer is located in a single pass over the text, and each
+opener is paired with the first closer after it by binary search. The removed
+spans are the same ones re.sub removes.
+"""
+
+import bisect
+import re
+
+
+def _line_start(content, pos, floor):
+    """Earliest offset a ``^\\s*`` match ending at pos could start, or None.
+
+    Walks back over the whitespace before pos (not past floor) and returns the
+    first line start in that run, mirroring re.MULTILINE ``^``.
+    """
+    run_start = pos
+    while run_start > floor and content[run_start - 1].isspace():
+        run_start -= 1
+    if run_start == 0 or content[run_start - 1] == '\n':
+        return run_start
+    newline = content.find('\n', run_start, pos)
+    return None if newline == -1 else newline + 1
+
+
+class RegexRule:
+    """A plain ``re.sub`` rule, with the same interface as LazySpanRule."""
+
+    def __init__(self, name, pattern, repl='', flags=0):
+        self.name = name
+        self.pattern = re.compile(pattern, flags)
+        self.repl = repl
+
+    def apply(self, content):
+        return self.pattern.sub(self.repl, content)
+
+
+class FunctionRule:
+    """A rule implemented by an arbitrary content -> content function."""
+
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+
+    def apply(self, content):
+        return self.func(content)
+
+
+class LazySpanRule:
+    """Remove ``PREFIX .*? SUFFIX`` spans in linear time.
+
+    Equivalent to ``re.sub(PREFIX + '.*?' + SUFFIX, '', content,
+    flags=flags | re.DOTALL)``. Candidates are found in the raw text, not in
+    parsed HTML, so an opener or closer inside a comment or an attribute
+    value counts just as it does for the regex.
+
+    Args:
+        name: Short label used in benchmarks and reports.
+        anchor: Regex for the text every PREFIX match starts with (e.g.
+            ``<p``); it must not be able to match overlapping itself.
+        prefix: Regex matched at each anchor (no unbounded ``.``).
+        closer: Regex for the text every SUFFIX match starts with (e.g.
+            ``</strong``), under the same condition.
+        suffix: Regex matched at each closer.
+        flags: re flags shared by all four patterns (DOTALL is implied).
+        line_start: The rule is ``^\\s*PREFIX...`` under re.MULTILINE; the
+            match is extended back over the whitespace before the anchor to
+            the first line start.
+    """
+
+    def __init__(self, name, anchor, prefix, closer, suffix, flags=0, line_start=False):
+        self.name = name
+        self.anchor = re.compile(anchor, flags)
+        self.prefix = re.compile(prefix, flags)
+        self.closer = re.compile(closer, flags)
+        self.suffix = re.compile(suffix, flags)
+        self.line_start = line_start
+
+    def spans(self, content):
+        """Return the non-overlapping [start, end) spans this rule removes."""
+        # PREFIX has no unbounded parts, so this search is a cheap linear filter
+        if not self.prefix.search(content):
+            return []
+
+        # Every closer where SUFFIX matches, found in one pass
+        closers = []
+        closer_ends = []
+        for candidate in self.closer.finditer(content):
+            match = self.suffix.match(content, candidate.start())
+            if match:
+                closers.append(candidate.start())
+                closer_ends.append(match.end())
+
+        spans = []
+        pos = 0
+        for candidate in self.anchor.finditer(content):
+            anchor = candidate.start()
+            if anchor < pos:
+                continue
+            start = anchor
+            if self.line_start:
+                start = _line_start(content, anchor, pos)
+                if start is None:
+                    continue
+            match = self.prefix.match(content, anchor)
+            if not match:
+                continue
+            i = bisect.bisect_left(closers, match.end())
+            if i == len(closers):
+                continue
+            spans.append((start, closer_ends[i]))
+            pos = closer_ends[i]
+        return spans
+
+    def apply(self, content):
+        """Return content with every matching span removed."""
+        return remove_spans(content, self.spans(content))
+
+
+def remove_spans(content, spans):
+    """Remove sorted, non-overlapping [start, end) spans from content."""
+    if not spans:
+        return content
+    parts = []
+    pos = 0
+    for start, end in spans:
+        parts.append(content[pos:start])
+        pos = end
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
+class DelimitedRule:
+    """Remove ``PREFIX [^C]* C SUFFIX`` matches, where C is a single character.
+
+    Equivalent to ``re.sub(PREFIX + '[^C]*' + C + SUFFIX, '', content,
+    flags=flags)`` (``[^C]+`` when min_gap is 1). A regex engine scans from
+    every PREFIX match to the next C, so many openers sharing one C cost
+    O(n^2). Every opener before a given C reaches the same C and tries the
+    same SUFFIX after it, so once SUFFIX fails there those openers are skipped.
+
+    PREFIX must not contain C and SUFFIX must not be able to start with C.
+    """
+
+    def __init__(self, name, prefix, stop, suffix, flags=0, min_gap=0):
+        self.name = name
+        self.prefix = re.compile(prefix, flags)
+        self.stop = stop
+        self.suffix = re.compile(suffix, flags)
+        self.min_gap = min_gap
+
+    def spans(self, content):
+        """Return the non-overlapping [start, end) spans this rule removes."""
+        spans = []
+        pos = 0
+        while True:
+            match = self.prefix.search(content, pos)
+            if not match:
+                return spans
+            stop = content.find(self.stop, match.end())
+            if stop == -1:
+                return spans
+            if stop - match.end() < self.min_gap:
+                pos = match.start() + 1
+                continue
+            suffix = self.suffix.match(content, stop + 1)
+            if not suffix:
+                pos = stop + 1
+                continue
+            spans.append((match.start(), suffix.end()))
+            pos = suffix.end()
+
+    def apply(self, content):
+        """Return content with every match removed."""
+        return remove_spans(content, self.spans(content))
+
+
+def find_at_line_start(content, text):
+    """Find the first ``text`` preceded only by whitespace on its line.
+
+    Equivalent to ``re.search('^(\\s*)' + re.escape(text), content,
+    re.MULTILINE)`` without rescanning a whitespace run from each of its line
+    starts. Returns (match start, text start), or None.
+    """
+    pos = content.find(text)
+    while pos != -1:
+        start = _line_start(content, pos, 0)
+        if start is not None:
+            return start, pos
+        pos = content.find(text, pos + 1)
+    return None
+
+
+def split_raw_elements(content, tag, open_text):
+    """Split content around ``open_text ... </tag>`` elements.
+
+    Equivalent to ``re.split(f'({open_text}.*?</{tag}>)', content,
+    flags=re.DOTALL)``: returns alternating outside/element parts, starting
+    and ending with an outside part. Both delimiters are literals, so each
+    opener is paired with the next closer by plain string search; once no
+    closer is left the scan stops instead of retrying every later opener.
+    """
+    close_text = f'</{tag}>'
+    parts = []
+    pos = 0
+    while True:
+        start = content.find(open_text, pos)
+        if start == -1:
+            break
+        closer = content.find(close_text, start + len(open_text))
+        if closer == -1:
+            break
+        end = closer + len(close_text)
+        parts.append(content[pos:start])
+        parts.append(content[start:end])
+        pos = end
+    parts.append(content[pos:])
+    return parts
+
+
+# The citation footer postprocessing adds to every translation
+_FOOTER = re.compile(r'\n[ \t]*<hr\s*/?>\s*<footer')
+_UNCLOSED_TAG = re.compile(r'<[^<>]*$')
+
+
+def set_page_block(content, css_class, block, before=()):
+    """Replace the ``<nav class="css_class">`` block, or add it above the footer.
+
+    A new block goes right before the first ``<nav class="...">`` of the
+    classes in ``before``, else before the citation footer, else at the end.
+    An empty block only removes the old one. Blocks are whole lines ending in
+    ``</nav>\\n``.
+    """
+    pattern = re.compile(rf'<nav class="{css_class}".*?</nav>\n', re.DOTALL)
+    content = pattern.sub('', content, count=1)
+    if not block:
+        return content
+    for other in before:
+        position = content.find(f'<nav class="{other}"')
+        if position >= 0:
+            return content[:position] + block + content[position:]
+    footer = _FOOTER.search(content)
+    if not footer:
+        return content.rstrip('\n') + '\n' + block
+    head = content[:footer.start()]
+    if _UNCLOSED_TAG.search(head):
+        # A truncated '</p' would swallow the <nav> tag as an attribute
+        head += '>'
+    return head + '\n' + block + content[footer.start() + 1:]
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Index the links between kexue.fm articles in the raw cache.
+
+Every article body (the part extract_raw_content keeps, without the site's
+sidebar of recent posts and comments) is scanned once for links to other
+``kexue.fm/archives/<id>`` pages. The outgoing links are stored per article
+ID, and like the date index only raw files whose size or mtime changed are
+read again.
+
+Postprocessing uses the graph three ways: links to articles that have no
+translation keep pointing at kexue.fm, each translation lists the translated
+articles that cite it under "Referenced by", and translate_all starts with
+the most cited articles.
+"""
+
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+from build_search_index import extract_raw_content
+from config import CONFIG
+
+LINK_GRAPH_VERSION = 1
+
+RAW_DIR = CONFIG.raw_dir
+LINK_GRAPH_PATH = CONFIG.cache_dir / 'link_graph.json'
+
+ARTICLE_LINK_PATTERN = re.compile(r'kexue\.fm/archives/(\d+)')
+TRANSLATION_FILE_PATTERN = re.compile(r'translation_(\d+)\.html$')
+
+
+def extract_raw_links(raw_content, article_id):
+    """Return the sorted IDs of the articles a raw article's body links to."""
+    _, body = extract_raw_content(raw_content)
+    links = {int(m.group(1)) for m in ARTICLE_LINK_PATTERN.finditer(body)}
+    links.discard(int(article_id))
+    return sorted(links)
+
+
+def load_link_graph(index_path=LINK_GRAPH_PATH):
+    """Load the link graph, returning an empty one if missing or outdated."""
+    index_path = Path(index_path)
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            graph = json.load(f)
+        if graph.get('version') == LINK_GRAPH_VERSION:
+            return graph
+    return {'version': LINK_GRAPH_VERSION, 'articles': {}}
+
+
+def save_link_graph(graph, index_path=LINK_GRAPH_PATH):
+    """Write the link graph atomically."""
+    index_path = Path(index_path)
+    tmp_path = index_path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(graph, f, indent=1, sort_keys=True)
+    tmp_path.replace(index_path)
+
+
+def update_link_graph(raw_dir=RAW_DIR, index_path=LINK_GRAPH_PATH):
+    """Bring the link graph up to date with the raw cache.
+
+    Only raw files whose size or mtime changed are read. Returns the graph
+    dict, whose 'articles' map ID -> {'links', 'bytes', 'mtime_ns'}.
+    """
+    graph = load_link_graph(index_path)
+    entries = graph['articles']
+    seen = set()
+    changed = False
+
+    for raw_file in Path(raw_dir).glob('*.txt'):
+        article_id = raw_file.stem
+        seen.add(article_id)
+        stat = raw_file.stat()
+        entry = entries.get(article_id)
+        if entry and entry['bytes'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            continue
+
+        entries[article_id] = {
+            'links': extract_raw_links(raw_file.read_text(encoding='utf-8'), article_id),
+            'bytes': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        changed = True
+
+    for article_id in [a for a in entries if a not in seen]:
+        del entries[article_id]
+        changed = True
+
+    if changed:
+        save_link_graph(graph, index_path)
+
+    return graph
+
+
+def outgoing_links(graph, article_id):
+    """Return the IDs an article links to (empty if it is not cached)."""
+    entry = graph['articles'].get(str(article_id))
+    return entry['links'] if entry else []
+
+
+def backlinks(graph):
+    """Map each linked article ID to the sorted IDs of the articles linking to it."""
+    sources = {}
+    for article_id, entry in graph['articles'].items():
+        for target in entry['links']:
+            sources.setdefault(target, []).append(int(article_id))
+    return {target: sorted(ids) for target, ids in sources.items()}
+
+
+def in_degrees(graph):
+    """Count the cached articles linking to each article ID."""
+    return Counter(target for entry in graph['articles'].values() for target in entry['links'])
+
+
+def translated_ids(translations_dir=None):
+    """Return the IDs that have a translation file."""
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
+    matches = (TRANSLATION_FILE_PATTERN.search(p.name) for p in translations_dir.glob('translation_*.html'))
+    return {int(m.group(1)) for m in matches if m}
+
+
+def link_context(translations_dir=None, graph=None, manifest=None):
+    """Everything postprocessing needs to fix links and add backlinks.
+
+    Returns {'graph', 'translated', 'backlinks', 'titles'}, where titles holds
+    the English title of each translation (from the manifest). Pass manifest
+    to take the titles from it instead of refreshing the manifest file.
+    """
+    from manifest import manifest_articles, update_manifest
+
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
+    if graph is None:
+        graph = update_link_graph()
+    if manifest is None:
+        manifest = update_manifest(translations_dir)
+    titles = {int(r['id']): r['title'] for r in manifest_articles(manifest) if r['title']}
+    return {
+        'graph': graph,
+        'translated': translated_ids(translations_dir),
+        'backlinks': backlinks(graph),
+        'titles': titles,
+    }
+
+
+def main():
+    graph = update_link_graph()
+    entries = graph['articles']
+    translated = translated_ids()
+    degrees = in_degrees(graph)
+    edges = sum(degrees.values())
+    dangling = sum(count for target, count in degrees.items() if target not in translated)
+
+    print(f"Link graph at {LINK_GRAPH_PATH} covers {len(entries)} raw articles")
+    print(f"  {edges} links to {len(degrees)} articles, {dangling} of them to untranslated articles")
+    untranslated = [(count, target) for target, count in degrees.items() if target not in translated]
+    if untranslated:
+        top = sorted(untranslated, reverse=True)[:10]
+        print("Most cited untranslated articles: " + ', '.join(f"{target} ({count})" for count, target in top))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Maintain a manifest of article metadata for the contents page and search index.
+
+The manifest records, for every translation file, its title, publication date,
+size, content hash and extracted search text. It is refreshed by comparing file
+size and mtime, so only articles that actually changed are re-read and
+re-extracted; everything downstream renders from the manifest alone.
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+from build_search_index import extract_content
+from config import CONFIG
+
+MANIFEST_VERSION = 2
+
+MANIFEST_PATH = CONFIG.cache_dir / 'manifest.json'
+TRANSLATIONS_DIR = CONFIG.translations_dir
+
+
+def extract_info(content):
+    """Extract title and date from the HTML of a translation file."""
+    # Extract title from <h1><a href="...">TITLE</a></h1>
+    title_match = re.search(r'<h1><a href="[^"]+">([^<]+)</a></h1>', content)
+    title = title_match.group(1) if title_match else None
+
+    # Extract date - handle both "By 苏剑林 | DATE" and "By Su Jianlin | DATE"
+    date_match = re.search(r'By (?:苏剑林|Su Jianlin) \| ([A-Za-z]+\.? \d+, \d+)', content)
+    date_str = date_match.group(1) if date_match else None
+
+    date = None
+    if date_str:
+        # Try various date formats
+        for fmt in ["%B %d, %Y", "%b %d, %Y", "%b. %d, %Y"]:
+            try:
+                date = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                continue
+
+    return title, date, date_str
+
+
+def article_id_from_filename(filename):
+    """Return the article ID for a name like translation_11033.html."""
+    return filename[len('translation_'):-len('.html')]
+
+
+def build_record(html_file, content, stat):
+    """Build the manifest record for a single translation file."""
+    title, date, date_str = extract_info(content)
+    search_title, search_text = extract_content(content)
+    return {
+        'id': article_id_from_filename(html_file.name),
+        'file': html_file.name,
+        'title': title,
+        'date': date.strftime('%Y-%m-%d') if date else None,
+        'date_str': date_str,
+        'year': date.year if date else None,
+        'bytes': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        'search_title': search_title,
+        'search_text': search_text,
+    }
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """Load the manifest, returning an empty one if missing or outdated."""
+    manifest_path = Path(manifest_path)
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    return {'version': MANIFEST_VERSION, 'articles': {}}
+
+
+def save_manifest(manifest, manifest_path=MANIFEST_PATH):
+    """Write the manifest atomically."""
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    tmp_path.replace(manifest_path)
+
+
+def update_manifest(translations_dir=TRANSLATIONS_DIR, manifest_path=MANIFEST_PATH, verbose=True):
+    """Bring the manifest up to date with the translation files on disk.
+
+    Files whose size and mtime match their record are not opened. Files that
+    were touched but whose content hash is unchanged only get their mtime
+    refreshed. Records for deleted files are dropped. The manifest is only
+    written back if one of these changed a record.
+
+    Returns the manifest dict.
+    """
+    manifest = load_manifest(manifest_path)
+    records = manifest['articles']
+    seen = set()
+    updated = []
+    dirty = False
+
+    for html_file in sorted(Path(translations_dir).glob('translation_*.html')):
+        article_id = article_id_from_filename(html_file.name)
+        seen.add(article_id)
+        stat = html_file.stat()
+        record = records.get(article_id)
+        if record and record['bytes'] == stat.st_size and record['mtime_ns'] == stat.st_mtime_ns:
+            continue
+
+        content = html_file.read_text(encoding='utf-8')
+        if record and record['sha256'] == hashlib.sha256(content.encode('utf-8')).hexdigest():
+            record['mtime_ns'] = stat.st_mtime_ns
+            dirty = True
+            continue
+
+        records[article_id] = build_record(html_file, content, stat)
+        updated.append(article_id)
+
+    removed = [article_id for article_id in records if article_id not in seen]
+    for article_id in removed:
+        del records[article_id]
+
+    if dirty or updated or removed:
+        save_manifest(manifest, manifest_path)
+    if verbose and (updated or removed):
+        print(f"Manifest: {len(updated)} updated, {len(removed)} removed, {len(records)} total")
+
+    return manifest
+
+
+def manifest_articles(manifest):
+    """Return manifest records sorted by article ID, newest first."""
+    return sorted(manifest['articles'].values(), key=lambda r: int(r['id']), reverse=True)
+
+
+def main():
+    manifest = update_manifest()
+    print(f"Manifest at {MANIFEST_PATH} covers {len(manifest['articles'])} articles")
+
+
+if __name__ == '__main__':
+    main()
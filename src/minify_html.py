@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Minify the HTML pages for publishing.
+
+The generated pages keep the indentation and blank lines of their templates
+and of the model's output, comments, and inline styles written out with
+spaces (the back button, the citation footer). minify() removes what the
+browser ignores:
+
+- comments (except ``<!--[if ...]>``)
+- whitespace runs in text, collapsed to one character: a newline if the run
+  had one, else a space, so no word boundary is lost
+- whitespace between attributes, and around ``:`` and ``;`` in style
+  attributes
+
+<pre>, <code>, <textarea>, <script> and <style> elements are copied
+unchanged, and so is every piece of math in the text (``$...$``,
+``$$...$$``, ``\\(...\\)``, ``\\[...\\]``, ``\\begin{env}...\\end{env}``):
+whitespace in TeX is not always insignificant, e.g. a newline ends a ``%``
+comment.
+
+verify() checks that a page and its minified copy render the same: the same
+elements and attributes, the same text once whitespace runs are collapsed,
+and the same math source character for character. minify_page() returns the
+original page if they differ.
+"""
+
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from config import CONFIG
+from profiling import profile_from_argv
+
+# Elements whose content is copied as is; verify() compares their text exactly
+RAW_ELEMENTS = ('pre', 'code', 'textarea', 'script', 'style')
+
+# Markup is a comment (<!--...-->), a declaration (<!...>) or a tag. Comments
+# and declarations are found by next_markup, which searches for their closer
+# at most once, so an unclosed one doesn't rescan the rest of the page.
+TAG_PATTERN = re.compile(r'</?([a-zA-Z][-.:\w]*)(?:[\s/][^<>]*)?>')
+# HTML whitespace; \s would also match non-breaking spaces, which are text
+WHITESPACE_PATTERN = re.compile(r'[ \t\n\r\f]+')
+# Math is $$...$$, \[...\], \(...\), \begin{env}...\end{env} or $...$; math_spans
+# finds it. A single $ ends at the next unescaped $, so only the other
+# openers can scan to the end of the text, and their closers are searched
+# for at most once.
+MATH_OPENER_PATTERN = re.compile(r'\$|\\[\[(]|\\begin\{([a-zA-Z]+\*?)\}')
+MATH_CLOSERS = {'$$': '$$', '\\[': '\\]', '\\(': '\\)'}
+INLINE_MATH_PATTERN = re.compile(r'(?<!\\)\$(?:[^$\\]|\\.)+?\$', re.DOTALL)
+ATTRIBUTE_PATTERN = re.compile(r'("[^"]*"|\'[^\']*\')|[ \t\n\r\f]+')
+STYLE_ATTRIBUTE_PATTERN = re.compile(r'(\sstyle=")([^"\'()]*)"', re.IGNORECASE)
+
+
+def collapse_whitespace(text):
+    return WHITESPACE_PATTERN.sub(lambda m: '\n' if '\n' in m.group(0) else ' ', text)
+
+
+def math_spans(text):
+    """Yield the (start, end) of each piece of math in text, in order."""
+    # Closers known to be missing from the rest of the text, so an
+    # unterminated opener is only searched for once
+    missing = set()
+    pos = 0
+    while True:
+        match = MATH_OPENER_PATTERN.search(text, pos)
+        if match is None:
+            return
+        start = match.start()
+        opener = text[start:start + 2]
+        if match.group(1):
+            closer, skip = f'\\end{{{match.group(1)}}}', len(match.group(0))
+        else:
+            # $$...$$, \[...\] and \(...\) hold at least one character
+            closer, skip = MATH_CLOSERS.get(opener), 3
+        end = -1
+        if closer and closer not in missing:
+            end = text.find(closer, start + skip)
+            if end < 0:
+                missing.add(closer)
+            else:
+                end += len(closer)
+        if end < 0 and text[start] == '$':
+            inline = INLINE_MATH_PATTERN.match(text, start)
+            end = inline.end() if inline else -1
+        if end < 0:
+            pos = start + 1
+            continue
+        yield start, end
+        pos = end
+
+
+def minify_text(text):
+    """Collapse the whitespace of a text run, leaving its math untouched."""
+    parts = []
+    pos = 0
+    for start, end in math_spans(text):
+        parts.append(collapse_whitespace(text[pos:start]))
+        parts.append(text[start:end])
+        pos = end
+    parts.append(collapse_whitespace(text[pos:]))
+    return ''.join(parts)
+
+
+def minify_style(match):
+    declarations = [d.strip() for d in match.group(2).split(';')]
+    declarations = [re.sub(r'\s*:\s*', ':', d, count=1) for d in declarations if d]
+    return f'{match.group(1)}{";".join(declarations)}"'
+
+
+def minify_tag(tag):
+    """Collapse the whitespace between attributes; quoted values keep theirs."""
+    tag = ATTRIBUTE_PATTERN.sub(lambda m: m.group(1) or ' ', tag)
+    tag = re.sub(r' >$', '>', tag)
+    return STYLE_ATTRIBUTE_PATTERN.sub(minify_style, tag)
+
+
+def next_markup(html, pos, missing):
+    """Return (start, end, tag name or None) of the first markup at or after pos, or None.
+
+    missing holds the closers known to be absent from the rest of html; it
+    is shared by the calls for one page.
+    """
+    while True:
+        start = html.find('<', pos)
+        if start < 0:
+            return None
+        if html.startswith('<!', start):
+            closer, skip = ('-->', 4) if html.startswith('<!--', start) else ('>', 2)
+            end = -1 if closer in missing else html.find(closer, start + skip)
+            if end >= 0:
+                return start, end + len(closer), None
+            missing.add(closer)
+        else:
+            tag = TAG_PATTERN.match(html, start)
+            if tag:
+                return start, tag.end(), tag.group(1)
+        pos = start + 1
+
+
+def minify(html):
+    """Return html with comments and insignificant whitespace removed."""
+    out = []
+    pos = 0
+    missing = set()
+    while True:
+        match = next_markup(html, pos, missing)
+        if not match:
+            out.append(minify_text(html[pos:]))
+            break
+        start, end, name = match
+        out.append(minify_text(html[pos:start]))
+        markup = html[start:end]
+        pos = end
+        if markup.startswith('<!--'):
+            if markup.startswith('<!--[if'):
+                out.append(markup)
+            continue
+        out.append(minify_tag(markup) if name else markup)
+        name = (name or '').lower()
+        if name in RAW_ELEMENTS and not markup.startswith('</'):
+            closer = re.compile(rf'</{name}\s*>', re.IGNORECASE).search(html, pos)
+            end = closer.start() if closer else len(html)
+            out.append(html[pos:end])
+            pos = end
+    return ''.join(out)
+
+
+class RenderedContent(HTMLParser):
+    """What a page shows: its elements, its text and its math."""
+
+    def __init__(self, html):
+        super().__init__(convert_charrefs=True)
+        self.elements = []
+        self.text = []
+        self.verbatim = 0
+        self.feed(html)
+        self.close()
+
+    def handle_starttag(self, tag, attrs):
+        attrs = [(name, re.sub(r'\s+', '', value).rstrip(';') if name == 'style' and value else value)
+                 for name, value in attrs]
+        self.elements.append((tag, attrs))
+        if tag in RAW_ELEMENTS:
+            self.verbatim += 1
+
+    def handle_endtag(self, tag):
+        self.elements.append(('/' + tag, None))
+        if tag in RAW_ELEMENTS and self.verbatim:
+            self.verbatim -= 1
+
+    def handle_data(self, data):
+        # Verbatim text is kept apart so that it is compared exactly
+        self.text.append(('verbatim', data) if self.verbatim else data)
+
+    def summary(self):
+        """(elements, text with whitespace collapsed, verbatim text, math sources)."""
+        # A NUL stands in for each verbatim part, so the whitespace around it still counts
+        flowing = ''.join(part if isinstance(part, str) else '\0' for part in self.text)
+        verbatim = [part[1] for part in self.text if not isinstance(part, str)]
+        math = [flowing[start:end] for start, end in math_spans(flowing)]
+        return self.elements, WHITESPACE_PATTERN.sub(' ', flowing).strip(), verbatim, math
+
+
+def verify(html, minified):
+    """True if minified renders the same elements, text and math as html."""
+    return RenderedContent(html).summary() == RenderedContent(minified).summary()
+
+
+def minify_page(html):
+    """Return (the minified page, True), or (html, False) if it would not render the same."""
+    minified = minify(html)
+    if verify(html, minified):
+        return minified, True
+    return html, False
+
+
+def main(paths=None):
+    """Report how much minification saves on index.html and the translations (files are not changed)."""
+    if paths:
+        paths = [Path(p) for p in paths]
+    else:
+        paths = [CONFIG.index_path, *sorted(CONFIG.translations_dir.glob('translation_*.html'))]
+    before = after = 0
+    for path in paths:
+        html = path.read_text(encoding='utf-8')
+        minified, ok = minify_page(html)
+        if not ok:
+            print(f"  {path.name}: minified copy renders differently, kept as is")
+        before += len(html.encode('utf-8'))
+        after += len(minified.encode('utf-8'))
+    print(f"Minified {len(paths)} pages: {before / 1024:,.0f} KB -> {after / 1024:,.0f} KB "
+          f"({(before - after) / 1024:,.0f} KB, {(before - after) / max(before, 1):.1%} saved)")
+
+
+if __name__ == '__main__':
+    profile_from_argv('minify_html')
+    main(sys.argv[1:])
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Make the translations use the shared stylesheet and MathJax config.
+
+Translations used to start with the whole stylesheet in a <style> block and
+with a MathJax config the model wrote for each article, in a dozen slightly
+different forms (extra packages, a renderAction for <script type="math/tex">
+that no page needs, a MathJax 2 config, a polyfill.io script, a <head> of its
+own). The same ~5 KB was downloaded again with every page.
+
+use_shared_assets replaces all of that with one head:
+
+    <meta charset="utf-8">
+    <link rel="stylesheet" href="../assets/article.css">
+    <script src="../assets/mathjax-config.js"></script>
+    <script id="MathJax-script" async src="...mathjax@3/es5/tex-mml-chtml.js"></script>
+
+The TeX macros some configs define are the only per-article setting that
+matters; they are kept in a small inline script as window.articleMacros,
+which assets/mathjax-config.js passes on to MathJax. A <style> block is only
+replaced if it has the same rules as assets/article.css, so a page with
+styles of its own keeps them. The rewrite is idempotent and is the last
+step of postprocessing; ``python page_assets.py`` runs it alone over all
+translations and reports the bytes saved.
+"""
+
+import re
+from pathlib import Path
+
+from config import CONFIG
+from profiling import profile_from_argv
+
+STYLESHEET = 'article.css'
+MATHJAX_CONFIG = 'mathjax-config.js'
+MATHJAX_URL = 'https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js'
+
+# <script> and <style> elements are found by elements(), which is linear
+ELEMENT_OPEN = {tag: re.compile(rf'<{tag}\b([^>]*)>', re.IGNORECASE) for tag in ('script', 'style')}
+ELEMENT_CLOSE = {tag: re.compile(rf'</{tag}>', re.IGNORECASE) for tag in ('script', 'style')}
+# The head this module writes, plus the document wrappers some translations have.
+# Leading [ \t]* only starts at the head of a run, so a long run of spaces is not
+# rescanned from each of its positions.
+HEAD_PATTERNS = [
+    re.compile(r'(?<![ \t])[ \t]*<meta\s+charset=[^>]*>[ \t]*\n?', re.IGNORECASE),
+    re.compile(rf'(?<![ \t])[ \t]*<link\s+rel="stylesheet"\s+href="[^"]*/{re.escape(STYLESHEET)}">[ \t]*\n?'),
+    re.compile(r'(?<![ \t])[ \t]*<!DOCTYPE\s+html>[ \t]*\n?', re.IGNORECASE),
+    re.compile(r'(?<![ \t])[ \t]*</?(?:html|body)\b[^>]*>[ \t]*\n?', re.IGNORECASE),
+    re.compile(r'(?<![ \t])[ \t]*<head>\s*</head>[ \t]*\n?', re.IGNORECASE),
+]
+# An inline script that sets the MathJax config, as window.MathJax = or MathJax =
+MATHJAX_ASSIGNMENT = re.compile(r'(?:\bwindow\.|(?<![\w.$]))MathJax\s*=(?!=)')
+MACROS_START = re.compile(r'(?:\bmacros\s*:|window\.articleMacros\s*=)\s*\{')
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+JS_LINE_COMMENT = re.compile(r'^\s*//.*$', re.MULTILINE)
+
+
+def elements(html, tag):
+    """Yield (start, end, attrs, body) for each <tag>...</tag> element, in order.
+
+    The span takes in the spaces before the element and the spaces and newline
+    after it. Like split_raw_elements, the scan stops at the first opener with
+    no closer after it instead of retrying every later opener.
+    """
+    pos = 0
+    while True:
+        opener = ELEMENT_OPEN[tag].search(html, pos)
+        if not opener:
+            return
+        closer = ELEMENT_CLOSE[tag].search(html, opener.end())
+        if not closer:
+            return
+        start = opener.start()
+        while start > pos and html[start - 1] in ' \t':
+            start -= 1
+        end = closer.end()
+        while end < len(html) and html[end] in ' \t':
+            end += 1
+        if html.startswith('\n', end):
+            end += 1
+        yield start, end, opener.group(1), html[opener.end():closer.start()]
+        pos = end
+
+
+def remove_elements(html, tag, remove):
+    """Drop the <tag> elements for which remove(attrs, body) is true."""
+    parts = []
+    pos = 0
+    for start, end, attrs, body in elements(html, tag):
+        if remove(attrs, body):
+            parts.append(html[pos:start])
+            pos = end
+    parts.append(html[pos:])
+    return ''.join(parts)
+
+
+def css_rules(css):
+    """The stylesheet without comments and whitespace, for comparing copies."""
+    return re.sub(r'\s+', '', CSS_COMMENT.sub('', css))
+
+
+def shared_css_rules(assets_dir=None):
+    return css_rules((Path(assets_dir or CONFIG.assets_dir) / STYLESHEET).read_text(encoding='utf-8'))
+
+
+def is_mathjax_script(attrs, body):
+    """True for MathJax configs and loaders, and the polyfill some configs load first.
+
+    An inline script counts as a config whatever its type if it assigns
+    MathJax; left in the page, it would replace the shared config.
+    """
+    if re.search(r'src="[^"]*(?:mathjax|polyfill)', attrs, re.IGNORECASE):
+        return True
+    if re.search(r'\bsrc\s*=', attrs, re.IGNORECASE):
+        return False
+    return ('text/x-mathjax-config' in attrs or MATHJAX_ASSIGNMENT.search(body) is not None
+            or 'window.articleMacros' in body)
+
+
+def extract_macros(script):
+    """Return the body of the macros object in a MathJax config, or None if it has none."""
+    match = MACROS_START.search(script)
+    if not match:
+        return None
+    depth, start = 1, match.end()
+    for i in range(start, len(script)):
+        depth += {'{': 1, '}': -1}.get(script[i], 0)
+        if depth == 0:
+            body = script[start:i]
+            return body if JS_LINE_COMMENT.sub('', body).strip() else None
+    return None
+
+
+def page_head(macros=None, assets_url='../assets'):
+    """The head of a translation that uses the shared assets."""
+    lines = ['<meta charset="utf-8">', f'<link rel="stylesheet" href="{assets_url}/{STYLESHEET}">']
+    if macros:
+        lines.append(f'<script>\nwindow.articleMacros = {{{macros.rstrip()}\n}};\n</script>')
+    lines.append(f'<script src="{assets_url}/{MATHJAX_CONFIG}"></script>')
+    lines.append(f'<script id="MathJax-script" async src="{MATHJAX_URL}"></script>')
+    return '\n'.join(lines)
+
+
+def use_shared_assets(html, shared_rules=None):
+    """Replace a translation's inline stylesheet and MathJax scripts with the shared head."""
+    if shared_rules is None:
+        shared_rules = shared_css_rules()
+    macros = None
+
+    def drop_script(attrs, body):
+        nonlocal macros
+        if not is_mathjax_script(attrs, body):
+            return False
+        macros = macros or extract_macros(body)
+        return True
+
+    html = remove_elements(html, 'script', drop_script)
+    html = remove_elements(html, 'style', lambda attrs, body: css_rules(body) == shared_rules)
+    for pattern in HEAD_PATTERNS:
+        html = pattern.sub('', html)
+    return page_head(macros) + '\n\n' + html.lstrip()
+
+
+def main(translations_dir=None):
+    """Rewrite every translation to use the shared assets and report the bytes saved.
+
+    Returns the number of files changed.
+    """
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
+    shared_rules = shared_css_rules()
+
+    before = after = changed = inline_styles = 0
+    for html_file in sorted(translations_dir.glob('translation_*.html')):
+        content = html_file.read_text(encoding='utf-8')
+        new_content = use_shared_assets(content, shared_rules)
+        before += len(content.encode('utf-8'))
+        after += len(new_content.encode('utf-8'))
+        inline_styles += any(elements(new_content, 'style'))
+        if new_content != content:
+            html_file.write_text(new_content, encoding='utf-8')
+            changed += 1
+
+    assets = sum((CONFIG.assets_dir / name).stat().st_size for name in [STYLESHEET, MATHJAX_CONFIG])
+    print(f"Rewrote {changed} translations to use {CONFIG.assets_dir}/")
+    print(f"  {before / 1024:,.0f} KB -> {after / 1024:,.0f} KB, {(before - after) / 1024:,.0f} KB saved "
+          f"(the shared assets add {assets / 1024:,.1f} KB, downloaded once)")
+    if inline_styles:
+        print(f"  {inline_styles} translations keep a <style> block that differs from {STYLESHEET}")
+    return changed
+
+
+if __name__ == '__main__':
+    profile_from_argv('page_assets')
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""``--profile`` support shared by translate.py and the build scripts.
+
+Passing ``--profile`` to any command profiles the whole run and writes, to
+cache/profiles/<timestamp>-<pid>_<command>:
+
+- ``.prof``: cProfile stats, for ``python -m pstats`` or snakeviz
+- ``.collapsed``: stacks sampled from the main thread every few milliseconds,
+  one ``frame;frame;frame count`` line per stack, for flamegraph.pl or
+  speedscope
+
+and prints the top functions by own time when the process exits.
+"""
+
+import atexit
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from config import CONFIG
+
+PROFILE_DIR = CONFIG.cache_dir / 'profiles'
+
+
+def frame_label(frame):
+    """Label a frame as file:function, e.g. parser.py:goahead."""
+    return f"{Path(frame.f_code.co_filename).name}:{frame.f_code.co_name}"
+
+
+class Profiler:
+    """cProfile plus a stack sampler for the main thread.
+
+    Args:
+        name: Command name, used in the output file names.
+        interval: Seconds between stack samples.
+        top: Number of functions in the printed summary.
+    """
+
+    def __init__(self, name, interval=0.005, top=15, profile_dir=PROFILE_DIR):
+        self.name = name
+        self.interval = interval
+        self.top = top
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S') + f'-{os.getpid()}'
+        self.base_path = Path(profile_dir) / f'{stamp}_{name}'
+        self.profile = cProfile.Profile()
+        self.stacks = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._target = threading.main_thread().ident
+        self._started = None
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread.start()
+        self.profile.enable()
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                key = ';'.join(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+                self.samples += 1
+
+    def stop(self):
+        """Stop profiling, write the output files and print the summary."""
+        self.profile.disable()
+        self._stop.set()
+        self._thread.join()
+        elapsed = time.perf_counter() - self._started
+
+        self.base_path.parent.mkdir(parents=True, exist_ok=True)
+        stats_path = self.base_path.with_suffix('.prof')
+        collapsed_path = self.base_path.with_suffix('.collapsed')
+        self.profile.dump_stats(stats_path)
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+        stats = pstats.Stats(self.profile)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:self.top]
+        out = sys.stderr
+        print(f"\nProfile of {self.name}: {elapsed:.2f}s, {self.samples} stack samples", file=out)
+        print(f"  {'own s':>8} {'cum s':>8} {'calls':>9}  function", file=out)
+        for (filename, line, func), (_, calls, own, cumulative, _) in rows:
+            print(f"  {own:>8.3f} {cumulative:>8.3f} {calls:>9}  {Path(filename).name}:{line}({func})", file=out)
+        print(f"Stats: {stats_path}", file=out)
+        print(f"Flamegraph stacks: {collapsed_path}", file=out)
+
+
+def start_profile(name):
+    """Profile the rest of the process; the output is written at exit."""
+    profiler = Profiler(name)
+    atexit.register(profiler.stop)
+    profiler.start()
+    return profiler
+
+
+def profile_from_argv(name, argv=None):
+    """Profile the rest of the process if --profile is on the command line.
+
+    The flag is removed from argv (sys.argv by default) so the command's own
+    argument handling never sees it. Returns the Profiler, or None.
+    """
+    argv = sys.argv if argv is None else argv
+    if '--profile' not in argv:
+        return None
+    argv.remove('--profile')
+    return start_profile(name)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Live progress, ETA and throughput for long pipeline runs.
+
+A Progress follows the events of the current run log (see run_log.py) and
+keeps running totals: articles finished and failed, tokens, in-flight stages
+and errors by class. From these it derives articles per minute, tokens per
+second, the projected completion time and, when given a cost function, the
+projected cost of the whole run.
+
+The totals are shown as a status line on stderr (kept below the regular
+output and redrawn every second on a terminal, printed after each article
+otherwise) and written to a Prometheus text-format file,
+cache/runs/metrics.prom, that a node_exporter textfile collector or a plain
+``watch cat`` can follow.
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import run_log
+
+METRICS_PATH = run_log.RUN_LOG_DIR / 'metrics.prom'
+
+
+def format_duration(seconds):
+    """Format seconds as e.g. 1h02m, 4m05s or 12s."""
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class Progress:
+    """Running totals for one batch of articles, fed by run log events.
+
+    Args:
+        total: Number of articles the batch will process.
+        run: RunLog to follow; without one the tracker stays silent.
+        cost: Optional function (prompt_tokens, completion_tokens) -> USD.
+        metrics_path: Where to write the Prometheus text metrics.
+        interval: Seconds between refreshes of the status line and metrics.
+    """
+
+    def __init__(self, total, run=None, cost=None, metrics_path=METRICS_PATH, interval=1.0):
+        self.total = total
+        self.run = run
+        self.cost = cost
+        self.metrics_path = Path(metrics_path)
+        self.interval = interval
+        self.started = time.time()
+        self.outcomes = {}
+        self.errors = {}
+        self.attempts = {}
+        self.in_flight = {}
+        self.latency = {}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.interactive = sys.stderr.isatty() and sys.stdout.isatty()
+        self._lock = threading.Lock()
+        self._draw_lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._line = ''
+        self._shown = False
+        if run is not None:
+            run.listeners.append(self)
+            if self.interactive:
+                self._stdout = sys.stdout
+                sys.stdout = _StatusStream(sys.stdout, self)
+            self.refresh()
+            self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._thread.start()
+
+    # ----- run log listener -----
+
+    def on_start(self, stage, article_id):
+        with self._lock:
+            self.in_flight[stage] = self.in_flight.get(stage, 0) + 1
+
+    def on_event(self, record):
+        stage = record['stage']
+        if 'latency_s' not in record:
+            return
+        with self._lock:
+            self.in_flight[stage] = max(0, self.in_flight.get(stage, 0) - 1)
+            self.attempts[stage] = self.attempts.get(stage, 0) + 1
+            count, total = self.latency.get(stage, (0, 0.0))
+            self.latency[stage] = (count + 1, total + record['latency_s'])
+            if record.get('error_class'):
+                key = (stage, record['error_class'])
+                self.errors[key] = self.errors.get(key, 0) + 1
+            if stage == 'translate':
+                self.prompt_tokens += record.get('prompt_tokens') or 0
+                self.completion_tokens += record.get('completion_tokens') or 0
+            if stage == 'article':
+                self.outcomes[record['outcome']] = self.outcomes.get(record['outcome'], 0) + 1
+        if stage == 'article':
+            self.refresh()
+            if not self.interactive:
+                print(f"  [{self._line}]", file=sys.stderr, flush=True)
+
+    # ----- derived figures -----
+
+    def snapshot(self):
+        """Return the current totals and derived rates as a dict."""
+        with self._lock:
+            elapsed = max(time.time() - self.started, 1e-9)
+            done = sum(self.outcomes.values())
+            snapshot = {
+                'elapsed': elapsed,
+                'done': done,
+                'ok': self.outcomes.get('ok', 0),
+                'failed': self.outcomes.get('error', 0),
+                'remaining': max(self.total - done, 0),
+                'articles_per_minute': done / elapsed * 60,
+                'tokens_per_second': self.completion_tokens / elapsed,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'in_flight': dict(self.in_flight),
+                'errors': dict(self.errors),
+                'attempts': dict(self.attempts),
+                'latency': dict(self.latency),
+            }
+        snapshot['eta_seconds'] = elapsed / done * snapshot['remaining'] if done else None
+        if self.cost is not None:
+            spent = self.cost(self.prompt_tokens, self.completion_tokens)
+            snapshot['cost_usd'] = spent
+            snapshot['projected_cost_usd'] = spent / done * self.total if done else None
+        return snapshot
+
+    def status_line(self, snapshot):
+        """One-line human-readable summary of a snapshot."""
+        parts = [
+            f"{snapshot['done']}/{self.total} done ({snapshot['failed']} failed)",
+            f"{snapshot['articles_per_minute']:.1f} art/min",
+            f"{snapshot['tokens_per_second']:.0f} tok/s",
+            f"in-flight {sum(snapshot['in_flight'].get(s, 0) for s in ('fetch', 'translate'))}",
+        ]
+        if snapshot['errors']:
+            rates = []
+            for (stage, error_class), count in sorted(snapshot['errors'].items()):
+                rates.append(f"{error_class} {count / snapshot['attempts'][stage]:.0%}")
+            parts.append("errors " + ', '.join(rates))
+        if snapshot['eta_seconds'] is not None:
+            finish = datetime.now() + timedelta(seconds=snapshot['eta_seconds'])
+            parts.append(f"ETA {finish:%H:%M} ({format_duration(snapshot['eta_seconds'])})")
+        if snapshot.get('projected_cost_usd') is not None:
+            parts.append(f"${snapshot['cost_usd']:.2f} -> ${snapshot['projected_cost_usd']:.2f}")
+        return ' | '.join(parts)
+
+    def metrics(self, snapshot):
+        """Render a snapshot in the Prometheus text exposition format."""
+        labels = f'command="{self.run.command}",run="{self.run.run_id}"' if self.run else ''
+        lines = []
+
+        def metric(name, kind, help_text, samples, suffixes=('',)):
+            lines.append(f"# HELP kexue_{name} {help_text}")
+            lines.append(f"# TYPE kexue_{name} {kind}")
+            for extra, *values in samples:
+                label_text = ','.join(l for l in (labels, extra) if l)
+                for suffix, value in zip(suffixes, values):
+                    lines.append(f"kexue_{name}{suffix}{{{label_text}}} {value}")
+
+        metric('articles_planned', 'gauge', 'Articles this batch will process.', [('', self.total)])
+        metric('articles_total', 'counter', 'Articles finished, by outcome.',
+               [(f'outcome="{o}"', n) for o, n in (('ok', snapshot['ok']), ('error', snapshot['failed']))])
+        metric('tokens_total', 'counter', 'Translation tokens used, by kind.',
+               [('kind="prompt"', snapshot['prompt_tokens']), ('kind="completion"', snapshot['completion_tokens'])])
+        metric('in_flight', 'gauge', 'Stages started and not yet finished.',
+               [(f'stage="{s}"', n) for s, n in sorted(snapshot['in_flight'].items())])
+        metric('stage_errors_total', 'counter', 'Failed stage attempts, by error class.',
+               [(f'stage="{s}",class="{c}"', n) for (s, c), n in sorted(snapshot['errors'].items())])
+        metric('stage_latency_seconds', 'summary', 'Time spent in finished stage attempts.',
+               [(f'stage="{s}"', round(t, 4), n) for s, (n, t) in sorted(snapshot['latency'].items())],
+               suffixes=('_sum', '_count'))
+        metric('articles_per_minute', 'gauge', 'Articles finished per minute so far.',
+               [('', round(snapshot['articles_per_minute'], 3))])
+        metric('tokens_per_second', 'gauge', 'Completion tokens per second so far.',
+               [('', round(snapshot['tokens_per_second'], 3))])
+        if snapshot['eta_seconds'] is not None:
+            metric('eta_seconds', 'gauge', 'Projected seconds until the batch completes.',
+                   [('', round(snapshot['eta_seconds'], 1))])
+        if snapshot.get('cost_usd') is not None:
+            metric('cost_usd', 'gauge', 'Estimated spend so far.', [('', round(snapshot['cost_usd'], 4))])
+        if snapshot.get('projected_cost_usd') is not None:
+            metric('projected_cost_usd', 'gauge', 'Estimated spend for the whole batch.',
+                   [('', round(snapshot['projected_cost_usd'], 4))])
+        metric('run_start_timestamp_seconds', 'gauge', 'When the batch started.', [('', round(self.started, 3))])
+        return '\n'.join(lines) + '\n'
+
+    # ----- output -----
+
+    def refresh(self):
+        """Recompute the status line, redraw it and rewrite the metrics file."""
+        snapshot = self.snapshot()
+        self._line = self.status_line(snapshot)
+        if self.interactive:
+            with self._draw_lock:
+                self._draw_status()
+        self.write_metrics(snapshot)
+
+    def _draw_status(self):
+        sys.stderr.write(f"\r\033[K  [{self._line}]")
+        sys.stderr.flush()
+        self._shown = True
+
+    def _clear_status(self):
+        if self._shown:
+            sys.stderr.write("\r\033[K")
+            sys.stderr.flush()
+            self._shown = False
+
+    def write_metrics(self, snapshot):
+        """Replace the metrics file atomically, so readers never see half of it."""
+        self.metrics_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.metrics_path.with_suffix('.tmp')
+        tmp_path.write_text(self.metrics(snapshot), encoding='utf-8')
+        tmp_path.replace(self.metrics_path)
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.interval):
+            self.refresh()
+
+    def close(self):
+        """Stop refreshing, print the final status and detach from the run."""
+        if self.run is None or self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join()
+        self.refresh()
+        if self.interactive:
+            # Leave the final status behind as a regular line
+            with self._draw_lock:
+                self._clear_status()
+            sys.stdout = self._stdout
+            print(f"  [{self._line}]", file=sys.stderr, flush=True)
+        self.run.listeners.remove(self)
+
+
+class _StatusStream:
+    """Stdout wrapper that keeps the status line below the regular output.
+
+    The status line is cleared before each write and redrawn after each
+    completed line, so print() output never lands on top of it.
+    """
+
+    def __init__(self, stream, progress):
+        self._stream = stream
+        self._progress = progress
+
+    def write(self, text):
+        with self._progress._draw_lock:
+            self._progress._clear_status()
+            count = self._stream.write(text)
+            self._stream.flush()
+            if text.endswith('\n'):
+                self._progress._draw_status()
+        return count
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def start_progress(total, cost=None):
+    """Track a batch of total articles in the current run (silent if none)."""
+    return Progress(total, run=run_log.current_run(), cost=cost)
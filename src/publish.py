@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Write the deployable site to public/, precompressed and cache-friendly.
+
+The site is index.html, translations/, search/ and assets/ (when present).
+Pages keep their URLs, since they are linked from elsewhere, and are served
+with a Cache-Control that makes browsers revalidate them. Every other file is
+an asset that only pages reference, so it is published under a name with a
+hash of its content and can be cached for a year: the search shards already
+have one, and the rest (search/manifest.json, the shared stylesheet and
+scripts) are renamed here, with the references in the pages rewritten to
+match. Pages are minified (minify_html.py) unless the minified copy would
+render differently.
+
+Each file gets a gzip copy (level 9) and, if the optional brotli package is
+installed, a brotli copy (quality 11) next to it, for servers that send
+precompressed files (nginx gzip_static/brotli_static, most CDNs). A copy is
+only kept if it is smaller than the file. Files whose content did not change
+since the last publish are not compressed again.
+
+public/cache-manifest.json maps every published path to its Cache-Control
+header and its size, plain and compressed (and, for pages, before minifying).
+"""
+
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from build_search_index import content_name
+from config import CONFIG
+from minify_html import minify_page
+from profiling import profile_from_argv
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+# Recorded per file, so installing brotli later compresses everything again
+COMPRESSION = 'gzip+brotli' if brotli is not None else 'gzip'
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, max-age=0, must-revalidate'
+
+CACHE_MANIFEST = 'cache-manifest.json'
+# Bump to minify every page again after changing minify_html.py
+MINIFY_VERSION = 1
+
+# "000.25b4a0518c.bin": already named after its content
+HASHED_NAME_PATTERN = re.compile(r'\.[0-9a-f]{10}\.\w+$')
+
+
+def site_files(root_dir=None):
+    """Return {path relative to the site root: bytes} for every published file."""
+    root_dir = Path(root_dir or CONFIG.root_dir)
+    paths = [root_dir / 'index.html', *sorted((root_dir / 'translations').glob('*.html'))]
+    for directory in ['search', 'assets']:
+        paths.extend(sorted(p for p in (root_dir / directory).rglob('*') if p.is_file()))
+    return {p.relative_to(root_dir).as_posix(): p.read_bytes() for p in paths if p.exists()}
+
+
+def is_page(path):
+    return path.endswith('.html')
+
+
+def hashed_names(files):
+    """New names for the assets that are not yet named after their content."""
+    renames = {}
+    for path, data in files.items():
+        if is_page(path) or HASHED_NAME_PATTERN.search(path):
+            continue
+        parent, _, name = path.rpartition('/')
+        stem, dot, suffix = name.partition('.')
+        hashed = content_name(stem, data, dot + suffix)
+        renames[path] = f'{parent}/{hashed}' if parent else hashed
+    return renames
+
+
+def rewrite_references(html, renames):
+    """Point quoted or path references to renamed assets at their new names.
+
+    A reference is the asset's file name right after a quote or a slash and
+    right before a quote, ``?``, ``#`` or ``)``, which covers
+    href="../assets/article.css" as well as searchDir + 'manifest.json'.
+    """
+    for old, new in renames.items():
+        old_name, new_name = old.rpartition('/')[2], new.rpartition('/')[2]
+        html = re.sub(rf'(?<=[/"\']){re.escape(old_name)}(?=["\'?#)])', new_name, html)
+    return html
+
+
+def compressed_copies(data):
+    """The gzip and brotli copies worth keeping: {'.gz': bytes, '.br': bytes}."""
+    copies = {'.gz': gzip.compress(data, GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        copies['.br'] = brotli.compress(data, quality=BROTLI_QUALITY)
+    return {suffix: copy for suffix, copy in copies.items() if len(copy) < len(data)}
+
+
+def published_page(data, entry, target):
+    """Return the page as published and its minification details for the cache manifest.
+
+    A page whose source did not change since the last publish is not minified
+    again: the published copy is reused.
+    """
+    source = hashlib.sha256(f'{MINIFY_VERSION}:'.encode() + data).hexdigest()[:16]
+    if entry and entry.get('source') == source and target.exists():
+        return target.read_bytes(), {key: entry[key] for key in ('source', 'unminified', 'minified')}
+    html, minified = minify_page(data.decode('utf-8'))
+    return html.encode('utf-8'), {'source': source, 'unminified': len(data), 'minified': minified}
+
+
+def load_cache_manifest(output_dir):
+    path = Path(output_dir) / CACHE_MANIFEST
+    if path.exists():
+        return json.loads(path.read_text(encoding='utf-8'))
+    return {}
+
+
+def publish(output_dir=None, root_dir=None):
+    """Write the site to output_dir (public/ by default); returns the cache manifest."""
+    output_dir = Path(output_dir or CONFIG.publish_dir)
+    files = site_files(root_dir)
+    renames = hashed_names(files)
+
+    previous = load_cache_manifest(output_dir)
+    published = {}
+    pages = {}
+    for path, data in files.items():
+        if is_page(path):
+            if renames:
+                data = rewrite_references(data.decode('utf-8'), renames).encode('utf-8')
+            data, pages[path] = published_page(data, previous.get(path), output_dir / path)
+        published[renames.get(path, path)] = data
+
+    manifest = {}
+    compressed = 0
+    for path, data in published.items():
+        target = output_dir / path
+        entry = previous.get(path)
+        unchanged = (entry is not None and entry.get('compression') == COMPRESSION
+                     and target.exists() and target.read_bytes() == data
+                     and all((output_dir / f'{path}.{kind}').exists() for kind in ('gz', 'br') if kind in entry))
+        if not unchanged:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+            entry = {'bytes': len(data), 'compression': COMPRESSION}
+            for suffix, copy in compressed_copies(data).items():
+                (output_dir / f'{path}{suffix}').write_bytes(copy)
+                entry[suffix[1:]] = len(copy)
+            compressed += 1
+        entry['cache_control'] = REVALIDATE if is_page(path) else IMMUTABLE
+        entry.update(pages.get(path, {}))
+        manifest[path] = entry
+
+    # Everything from earlier publishes that is no longer part of the site
+    expected = {CACHE_MANIFEST} | set(manifest)
+    expected |= {f'{path}.{kind}' for path, entry in manifest.items() for kind in ('gz', 'br') if kind in entry}
+    removed = 0
+    for target in sorted(output_dir.rglob('*'), reverse=True):
+        relative = target.relative_to(output_dir).as_posix()
+        if target.is_file() and relative not in expected:
+            target.unlink()
+            removed += 1
+        elif target.is_dir() and not any(target.iterdir()):
+            target.rmdir()
+
+    manifest_path = output_dir / CACHE_MANIFEST
+    tmp_path = manifest_path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding='utf-8')
+    tmp_path.replace(manifest_path)
+
+    print(f"Published {len(manifest)} files to {output_dir} "
+          f"({compressed} compressed, {len(manifest) - compressed} unchanged, {removed} stale removed)")
+    print(f"Renamed {len(renames)} assets: " + ', '.join(f"{old} -> {new}" for old, new in renames.items()))
+    report(manifest)
+    return manifest
+
+
+def report(manifest):
+    """Print the plain and compressed sizes of pages and assets, and what minifying saved."""
+    pages = [entry for path, entry in manifest.items() if is_page(path)]
+    unminified = sum(entry['unminified'] for entry in pages)
+    saved = unminified - sum(entry['bytes'] for entry in pages)
+    print(f"Minified pages: {unminified / 1024:,.0f} KB -> {(unminified - saved) / 1024:,.0f} KB "
+          f"({saved / max(unminified, 1):.1%} saved)")
+    unchanged = [path for path, entry in manifest.items() if is_page(path) and not entry['minified']]
+    if unchanged:
+        print(f"  {len(unchanged)} pages would render differently minified and were published as is: "
+              + ', '.join(unchanged))
+    for label, paths in [('Pages', [p for p in manifest if is_page(p)]),
+                         ('Assets', [p for p in manifest if not is_page(p)])]:
+        plain = sum(manifest[p]['bytes'] for p in paths)
+        line = f"{label}: {len(paths)} files, {plain / 1024:,.0f} KB"
+        for kind in ('gz', 'br'):
+            if brotli is None and kind == 'br':
+                continue
+            packed = sum(manifest[p].get(kind, manifest[p]['bytes']) for p in paths)
+            line += f", {kind} {packed / 1024:,.0f} KB ({plain / packed:.1f}x)"
+        print(line)
+    if brotli is None:
+        print("brotli is not installed, so only gzip copies were written (pip install brotli)")
+
+
+def main(output_dir=None):
+    return publish(output_dir)
+
+
+if __name__ == '__main__':
+    profile_from_argv('publish')
+    main()
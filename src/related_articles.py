@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""Add a "Related" block of similar articles to every translation.
+
+Articles are compared by TF-IDF cosine similarity. Each article is a sparse
+vector over the corpus vocabulary (title and prose tokens, as the search index
+tokenizes them, and optionally the Chinese bigrams of the raw article), with
+sublinear term frequency ``1 + log(tf)``, inverse document frequency
+``log(n / df)`` and unit length. Terms in only one article can't make two
+articles similar, and terms in more than MAX_DF_RATIO of them are too common to
+help, so both are left out of the vocabulary.
+
+Similarities are computed a block of vocabulary columns at a time: the block
+of the sparse matrix is expanded to dense and the rows being compared are
+multiplied with it in one matrix product, so the whole corpus is compared in a
+handful of BLAS calls without ever holding the dense matrix. The
+RELATED_COUNT most similar articles become the links in the block, which is
+put before the citation footer as ``<nav class="related">``. The search index
+and manifest skip <nav>, so the block never feeds back into the vectors.
+
+The vectors, vocabulary and neighbours are cached in cache/related.npz. On
+the next run only the articles whose title or text changed are vectorized
+again (with the cached vocabulary and IDF) and compared with everything. An
+unchanged article is only recomputed if it linked to a changed or deleted
+article, or if a changed article is now more similar to it than its last
+neighbour. Once more than FULL_REBUILD_RATIO of the corpus has changed since
+the last full build, or with --full, everything is rebuilt so the vocabulary
+and IDF catch up. Until then an incremental run scores with the old IDF, so
+near-equal neighbours can come out in a different order than a full build
+would give; --full gives the links a clean build would.
+"""
+
+import hashlib
+from collections import Counter
+from html import escape, unescape
+from pathlib import Path
+
+import numpy as np
+
+from build_search_index import cjk_tokens, extract_raw_content, split_math, tokenize
+from config import CONFIG
+from html_transform import set_page_block
+from profiling import profile_from_argv
+
+RELATED_PATH = CONFIG.cache_dir / 'related.npz'
+RELATED_VERSION = 1
+
+# Links per article
+RELATED_COUNT = 5
+# Terms in more than this share of the articles are dropped
+MAX_DF_RATIO = 0.5
+# Vocabulary columns expanded to dense at a time; memory is about n * block floats
+SIMILARITY_BLOCK = 4096
+# Share of the corpus that may change before the IDF is recomputed
+FULL_REBUILD_RATIO = 0.1
+
+
+def article_tokens(record, raw_dir=None):
+    """Tokens of one article: title and prose, plus raw Chinese bigrams if raw_dir is given."""
+    prose, _ = split_math(record['search_text'])
+    tokens = tokenize(record['search_title'] or '') + tokenize(prose)
+    if raw_dir is not None:
+        raw_file = Path(raw_dir) / f"{record['id']}.txt"
+        if raw_file.exists():
+            title, text = extract_raw_content(raw_file.read_text(encoding='utf-8'))
+            tokens += cjk_tokens(title or '') + cjk_tokens(text)
+    return tokens
+
+
+def content_key(record, raw_dir=None):
+    """Hash of everything an article's vector depends on."""
+    digest = hashlib.sha256()
+    digest.update((record['search_title'] or '').encode('utf-8') + b'\0')
+    digest.update(record['search_text'].encode('utf-8'))
+    if raw_dir is not None:
+        raw_file = Path(raw_dir) / f"{record['id']}.txt"
+        if raw_file.exists():
+            digest.update(b'\0' + raw_file.read_bytes())
+    return digest.hexdigest()
+
+
+def build_vocabulary(token_lists):
+    """Return (vocabulary, idf) for the useful terms of the corpus."""
+    df = Counter()
+    for tokens in token_lists:
+        df.update(set(tokens))
+    n = len(token_lists)
+    vocabulary = sorted(term for term, count in df.items() if 1 < count <= MAX_DF_RATIO * n)
+    idf = np.log(n / np.array([df[term] for term in vocabulary], dtype=np.float32))
+    return np.array(vocabulary), idf.astype(np.float32)
+
+
+def vectorize(token_lists, vocabulary, idf):
+    """Return unit-length TF-IDF rows as CSR arrays (indptr, indices, data)."""
+    columns = {term: i for i, term in enumerate(vocabulary.tolist())}
+    indptr = [0]
+    indices = []
+    data = []
+    for tokens in token_lists:
+        counts = Counter(token for token in tokens if token in columns)
+        cols = np.array([columns[term] for term in counts], dtype=np.int32)
+        weights = (1 + np.log(np.array(list(counts.values()), dtype=np.float32))) * idf[cols]
+        norm = np.linalg.norm(weights)
+        indices.append(cols)
+        data.append(weights / norm if norm else weights)
+        indptr.append(indptr[-1] + len(cols))
+    return (np.array(indptr, dtype=np.int64),
+            np.concatenate(indices) if indices else np.zeros(0, np.int32),
+            np.concatenate(data).astype(np.float32) if data else np.zeros(0, np.float32))
+
+
+def take_rows(matrix, rows):
+    """Return the CSR arrays of the given rows, in that order."""
+    indptr, indices, data = matrix
+    spans = [np.arange(indptr[r], indptr[r + 1]) for r in rows]
+    taken = np.concatenate(spans) if spans else np.zeros(0, np.int64)
+    lengths = np.array([len(span) for span in spans], dtype=np.int64)
+    return np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64), indices[taken], data[taken]
+
+
+def stack_rows(parts):
+    """Concatenate CSR arrays row-wise."""
+    indptrs, indices, data = [], [], []
+    offset = 0
+    for part_indptr, part_indices, part_data in parts:
+        indptrs.append(part_indptr[1:] + offset)
+        offset += part_indptr[-1]
+        indices.append(part_indices)
+        data.append(part_data)
+    return (np.concatenate([[0], *indptrs]).astype(np.int64),
+            np.concatenate(indices).astype(np.int32),
+            np.concatenate(data).astype(np.float32))
+
+
+def similarities(matrix, rows, vocabulary_size, block_size=SIMILARITY_BLOCK):
+    """Cosine similarities of the given rows with every row, shape (len(rows), n)."""
+    indptr, indices, data = matrix
+    n = len(indptr) - 1
+    row_of = np.repeat(np.arange(n), np.diff(indptr))
+    selected = take_rows(matrix, rows)
+    selected_row_of = np.repeat(np.arange(len(rows)), np.diff(selected[0]))
+    result = np.zeros((len(rows), n), dtype=np.float32)
+    for begin in range(0, vocabulary_size, block_size):
+        end = min(begin + block_size, vocabulary_size)
+        block = np.zeros((n, end - begin), dtype=np.float32)
+        mask = (indices >= begin) & (indices < end)
+        block[row_of[mask], indices[mask] - begin] = data[mask]
+        selected_block = np.zeros((len(rows), end - begin), dtype=np.float32)
+        mask = (selected[1] >= begin) & (selected[1] < end)
+        selected_block[selected_row_of[mask], selected[1][mask] - begin] = selected[2][mask]
+        result += selected_block @ block.T
+    return result
+
+
+def top_neighbors(scores, rows, count, ids):
+    """Indices and scores of each row's most similar other articles.
+
+    Equal scores are ordered by article ID, so the links don't depend on the
+    order the articles were compared in.
+    """
+    scores = scores.copy()
+    scores[np.arange(len(rows)), rows] = -1
+    count = min(count, scores.shape[1] - 1)
+    if count <= 0:
+        return np.zeros((len(rows), 0), np.int64), np.zeros((len(rows), 0), np.float32)
+    best = np.lexsort((np.broadcast_to(ids, scores.shape), -scores), axis=1)[:, :count]
+    return best, np.take_along_axis(scores, best, axis=1)
+
+
+def load_cache(cache_path=RELATED_PATH):
+    """Load the cached vectors and neighbours, or None if missing or outdated."""
+    cache_path = Path(cache_path)
+    if not cache_path.exists():
+        return None
+    with np.load(cache_path) as cache:
+        cache = dict(cache)
+    if int(cache['meta'][0]) != RELATED_VERSION:
+        return None
+    return cache
+
+
+def save_cache(cache, cache_path=RELATED_PATH):
+    """Write the cache atomically."""
+    cache_path = Path(cache_path)
+    tmp_path = cache_path.with_name(cache_path.stem + '.tmp.npz')
+    np.savez(tmp_path, **cache)
+    tmp_path.replace(cache_path)
+
+
+def compute_neighbors(ids, keys, token_lists, cache, count, include_raw, full=False):
+    """Return the new cache dict and the number of rows recomputed.
+
+    token_lists is a function of an index list, so unchanged articles are
+    never tokenized when the cache can be reused.
+    """
+    n = len(ids)
+    ids = np.array(ids, dtype=np.int64)
+    keys = np.array(keys)
+    meta = np.array([RELATED_VERSION, count, int(include_raw), 0], dtype=np.int64)
+
+    old = {}
+    usable = (not full and cache is not None
+              and int(cache['meta'][1]) == count and int(cache['meta'][2]) == int(include_raw))
+    if usable:
+        old = {int(article_id): i for i, article_id in enumerate(cache['ids'])}
+        changed = [i for i, article_id in enumerate(ids.tolist())
+                   if article_id not in old or cache['keys'][old[article_id]] != keys[i]]
+        removed = set(old) - set(ids.tolist())
+        stale = int(cache['meta'][3]) + len(changed) + len(removed)
+        usable = stale <= FULL_REBUILD_RATIO * n
+
+    if not usable:
+        tokens = token_lists(range(n))
+        vocabulary, idf = build_vocabulary(tokens)
+        matrix = vectorize(tokens, vocabulary, idf)
+        rows = np.arange(n)
+        neighbors, scores = top_neighbors(similarities(matrix, rows, len(vocabulary)), rows, count, ids)
+        cache = {'meta': meta, 'ids': ids, 'keys': keys, 'vocabulary': vocabulary, 'idf': idf,
+                 'indptr': matrix[0], 'indices': matrix[1], 'data': matrix[2],
+                 'neighbors': ids[neighbors], 'scores': scores}
+        return cache, n
+
+    meta[3] = stale
+    vocabulary, idf = cache['vocabulary'], cache['idf']
+    if not changed and not removed:
+        cache['meta'] = meta
+        return cache, 0
+
+    # Unchanged rows come from the cache, changed ones are vectorized anew
+    changed_set = set(changed)
+    old_matrix = (cache['indptr'], cache['indices'], cache['data'])
+    new_rows = vectorize(token_lists(changed), vocabulary, idf)
+    changed_position = {i: j for j, i in enumerate(changed)}
+    parts = []
+    for i, article_id in enumerate(ids.tolist()):
+        if i in changed_set:
+            parts.append(take_rows(new_rows, [changed_position[i]]))
+        else:
+            parts.append(take_rows(old_matrix, [old[article_id]]))
+    matrix = stack_rows(parts)
+
+    neighbors = np.zeros((n, cache['neighbors'].shape[1]), dtype=np.int64)
+    scores = np.zeros((n, cache['scores'].shape[1]), dtype=np.float32)
+    for i, article_id in enumerate(ids.tolist()):
+        if i not in changed_set:
+            neighbors[i] = cache['neighbors'][old[article_id]]
+            scores[i] = cache['scores'][old[article_id]]
+
+    # An unchanged article needs a new list if it linked to a changed or
+    # removed article, or if a changed one now beats its last neighbour
+    changed_scores = similarities(matrix, changed, len(vocabulary))
+    best_changed = changed_scores.max(axis=0) if changed else np.zeros(n, np.float32)
+    dropped = set(ids[changed].tolist()) | removed
+    affected = [i for i in range(n) if i not in changed_set and (
+        dropped.intersection(neighbors[i].tolist())
+        or scores.shape[1] == 0 or best_changed[i] > scores[i, -1])]
+
+    rows = np.array(changed + affected, dtype=np.int64)
+    row_scores = np.concatenate([changed_scores, similarities(matrix, affected, len(vocabulary))])
+    new_neighbors, new_scores = top_neighbors(row_scores, rows, count, ids)
+    if new_neighbors.shape[1] != neighbors.shape[1]:
+        return compute_neighbors(ids.tolist(), keys.tolist(), token_lists, None, count, include_raw)
+    neighbors[rows] = ids[new_neighbors]
+    scores[rows] = new_scores
+
+    cache = {'meta': meta, 'ids': ids, 'keys': keys, 'vocabulary': vocabulary, 'idf': idf,
+             'indptr': matrix[0], 'indices': matrix[1], 'data': matrix[2],
+             'neighbors': neighbors, 'scores': scores}
+    return cache, len(rows)
+
+
+def render_related(links):
+    """HTML of the Related block for a list of (article_id, title)."""
+    # Titles are the <h1> text as written, so entities are decoded before escaping
+    items = ''.join(f'        <li><a href="translation_{article_id}.html">{escape(unescape(title), quote=False)}</a></li>\n'
+                    for article_id, title in links)
+    return ('<nav class="related" style="margin-top: 3em;">\n'
+            '    <p style="margin: 0 0 0.5em 0;"><strong>Related</strong></p>\n'
+            '    <ul style="margin: 0 0 0 1.5em;">\n'
+            f'{items}'
+            '    </ul>\n'
+            '</nav>\n')
+
+
+def main(translations_dir=None, cache_path=RELATED_PATH, count=RELATED_COUNT, full=False, include_raw=False):
+    """Update the Related blocks of all translations.
+
+    Returns the number of translation files rewritten.
+    """
+    from manifest import manifest_articles, update_manifest
+
+    translations_dir = Path(translations_dir or CONFIG.translations_dir)
+    raw_dir = CONFIG.raw_dir if include_raw else None
+
+    manifest = update_manifest(translations_dir)
+    records = [r for r in manifest_articles(manifest) if r['title'] and r['search_text']]
+    ids = [int(r['id']) for r in records]
+    keys = [content_key(r, raw_dir) for r in records]
+
+    def token_lists(indices):
+        return [article_tokens(records[i], raw_dir) for i in indices]
+
+    cache, recomputed = compute_neighbors(ids, keys, token_lists, load_cache(cache_path), count, include_raw, full)
+    save_cache(cache, cache_path)
+    mode = 'full' if recomputed == len(ids) else 'incremental'
+    print(f"Related articles: {len(ids)} articles, {recomputed} recomputed ({mode}), "
+          f"{len(cache['vocabulary'])} terms")
+
+    titles = {int(r['id']): r['title'] for r in records}
+    written = 0
+    for record, neighbors, scores in zip(records, cache['neighbors'].tolist(), cache['scores'].tolist()):
+        links = [(neighbor, titles[neighbor]) for neighbor, score in zip(neighbors, scores) if score > 0]
+        path = translations_dir / record['file']
+        html = path.read_text(encoding='utf-8')
+        updated = set_page_block(html, 'related', render_related(links) if links else '')
+        if updated != html:
+            path.write_text(updated, encoding='utf-8')
+            written += 1
+    print(f"Updated the Related block in {written} files")
+    return written
+
+
+if __name__ == '__main__':
+    import argparse
+
+    profile_from_argv('related_articles')
+    parser = argparse.ArgumentParser(description="Add a Related block of similar articles to every translation.")
+    parser.add_argument('--full', action='store_true', help="Recompute every article, not only changed ones")
+    parser.add_argument('--raw', action='store_true', help="Also compare the Chinese text in cache/raw")
+    parser.add_argument('--count', type=int, default=RELATED_COUNT, help="Links per article")
+    args = parser.parse_args()
+    main(count=args.count, full=args.full, include_raw=args.raw)
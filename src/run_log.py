@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Structured JSON-lines logs of pipeline runs.
+
+Each translate.py command that does real work starts a run, and every article
+stage it goes through (fetch, translate, postprocess, write) is recorded as
+one JSON object per line in cache/runs/<timestamp>_<command>.jsonl: the stage,
+article ID, latency, sizes, token counts and outcome. Outside a run (e.g. when
+the functions are imported by a benchmark) nothing is written.
+
+The console prints stay as they are; the log is the machine-readable record
+of the same steps. Listeners (see progress.py) can follow a run live. ``python run_log.py [run]`` (or ``translate.py report``)
+summarizes a run with latency percentiles and throughput.
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from config import CONFIG
+
+RUN_LOG_DIR = CONFIG.cache_dir / 'runs'
+
+_current_run = None
+
+
+class RunLog:
+    """An append-only JSON-lines event log for one command run."""
+
+    def __init__(self, command, args=(), log_dir=RUN_LOG_DIR):
+        self.command = command
+        self.started = time.time()
+        self.run_id = datetime.fromtimestamp(self.started).strftime('%Y%m%d-%H%M%S') + f'-{os.getpid()}'
+        log_dir = Path(log_dir)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self.path = log_dir / f'{self.run_id}_{command}.jsonl'
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self.listeners = []
+        self.event('run_start', args=list(args))
+
+    def event(self, stage, article_id=None, **fields):
+        """Append one event; the file is flushed so a crash loses nothing."""
+        record = {'ts': round(time.time(), 3), 'run': self.run_id, 'command': self.command, 'stage': stage}
+        if article_id is not None:
+            record['article'] = str(article_id)
+        record.update(fields)
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        for listener in self.listeners:
+            listener.on_event(record)
+
+    def close(self):
+        if not self._file.closed:
+            self.event('run_end', duration_s=round(time.time() - self.started, 3))
+            self._file.close()
+
+
+def start_run(command, args=()):
+    """Start logging a command run; the log is closed when the process exits."""
+    global _current_run
+    _current_run = RunLog(command, args)
+    atexit.register(_current_run.close)
+    return _current_run
+
+
+def current_run():
+    """Return the RunLog of the running command, or None."""
+    return _current_run
+
+
+def event(stage, article_id=None, **fields):
+    """Record an event in the current run, if there is one."""
+    if _current_run is not None:
+        _current_run.event(stage, article_id, **fields)
+
+
+@contextmanager
+def stage(name, article_id=None, **fields):
+    """Time a stage and record it with its outcome.
+
+    Yields a dict the caller can add fields to (bytes, tokens, provider...).
+    The outcome is 'ok' unless given; an exception is recorded as outcome
+    'error' with its class and re-raised.
+    """
+    fields = dict(fields)
+    start = time.perf_counter()
+    if _current_run is not None:
+        # Listeners track in-flight stages; only finished stages are written
+        for listener in _current_run.listeners:
+            listener.on_start(name, article_id)
+    try:
+        yield fields
+    except BaseException as e:
+        fields['outcome'] = 'error'
+        fields['error_class'] = type(e).__name__
+        fields['error'] = str(e)[:500]
+        raise
+    finally:
+        fields.setdefault('outcome', 'ok')
+        event(name, article_id, latency_s=round(time.perf_counter() - start, 4), **fields)
+
+
+# ============== Report ==============
+
+def load_events(path):
+    """Read the events of a run log, skipping a truncated last line."""
+    events = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+
+def find_run(name=None, log_dir=RUN_LOG_DIR):
+    """Return the log path for a run file or ID, or the latest run if name is None."""
+    if name and Path(name).exists():
+        return Path(name)
+    runs = sorted(Path(log_dir).glob('*.jsonl'))
+    if name:
+        runs = [r for r in runs if r.name.startswith(name)]
+    return runs[-1] if runs else None
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(events):
+    """Aggregate events into per-stage latency, size and outcome statistics."""
+    stages = {}
+    for e in events:
+        if 'latency_s' not in e:
+            continue
+        s = stages.setdefault(e['stage'], {'latencies': [], 'outcomes': {}, 'errors': {}, 'bytes': 0,
+                                           'prompt_tokens': 0, 'completion_tokens': 0, 'providers': {}})
+        s['latencies'].append(e['latency_s'])
+        s['outcomes'][e['outcome']] = s['outcomes'].get(e['outcome'], 0) + 1
+        if e.get('error_class'):
+            s['errors'][e['error_class']] = s['errors'].get(e['error_class'], 0) + 1
+        if e.get('provider'):
+            s['providers'][e['provider']] = s['providers'].get(e['provider'], 0) + 1
+        s['bytes'] += e.get('bytes') or 0
+        s['prompt_tokens'] += e.get('prompt_tokens') or 0
+        s['completion_tokens'] += e.get('completion_tokens') or 0
+    for s in stages.values():
+        s['latencies'].sort()
+    return stages
+
+
+def report(events):
+    """Print latency percentiles and throughput for a run's events."""
+    if not events:
+        print("No events")
+        return
+    timestamps = [e['ts'] for e in events]
+    wall = max(timestamps) - min(timestamps)
+    commands = sorted({e['command'] for e in events})
+    print(f"Run {events[0]['run']} ({', '.join(commands)}): {len(events)} events over {wall:.1f}s")
+    print()
+
+    stages = summarize(events)
+    print(f"{'stage':<14} {'count':>6} {'ok':>5} {'other':>5} {'err':>5} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} {'total s':>9} {'MB':>8}")
+    for name, s in stages.items():
+        latencies = s['latencies']
+        ok = s['outcomes'].get('ok', 0)
+        errors = s['outcomes'].get('error', 0)
+        print(f"{name:<14} {len(latencies):>6} {ok:>5} {len(latencies) - ok - errors:>5} {errors:>5} "
+              f"{percentile(latencies, 50):>8.3f} {percentile(latencies, 95):>8.3f} {percentile(latencies, 99):>8.3f} "
+              f"{sum(latencies):>9.1f} {s['bytes'] / 1e6:>8.2f}")
+
+    print()
+    for name, s in stages.items():
+        other = {o: n for o, n in s['outcomes'].items() if o not in ('ok', 'error')}
+        if other:
+            print(f"{name} other outcomes: {', '.join(f'{o}={n}' for o, n in sorted(other.items()))}")
+        if s['providers']:
+            print(f"{name} providers: {', '.join(f'{p}={n}' for p, n in sorted(s['providers'].items()))}")
+        if s['errors']:
+            print(f"{name} errors: {', '.join(f'{c}={n}' for c, n in sorted(s['errors'].items()))}")
+
+    articles = stages.get('article')
+    if wall > 0 and articles:
+        print(f"Throughput: {articles['outcomes'].get('ok', 0) / wall * 60:.2f} articles/min")
+    translate = stages.get('translate')
+    if translate and translate['completion_tokens']:
+        busy = sum(translate['latencies'])
+        print(f"Tokens: {translate['prompt_tokens']:,} prompt, {translate['completion_tokens']:,} completion "
+              f"({translate['completion_tokens'] / busy:.1f} completion tokens/s while translating)")
+    fetch = stages.get('fetch')
+    if fetch and fetch['bytes']:
+        busy = max(sum(fetch['latencies']), 1e-9)
+        print(f"Fetched: {fetch['bytes'] / 1e6:.2f} MB ({fetch['bytes'] / 1e3 / busy:.1f} KB/s while fetching)")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = find_run(argv[0] if argv else None)
+    if path is None:
+        print(f"No run logs found in {RUN_LOG_DIR}")
+        sys.exit(1)
+    print(f"Report for {path}")
+    report(load_events(path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""Query the search index from the terminal, scripts or a local HTTP service.
+
+The index that build_search_index.py writes to search/ is loaded into memory
+once and queries are ranked exactly as the contents page ranks them: BM25F
+over the title, text and math fields, CJK runs looked up as bigrams in the
+Chinese index, and a term that matches nothing replaced by its closest
+spellings from the trigram index. Every shard's terms are decoded up front,
+its postings the first time a query needs them, and the Chinese index and
+the trigram index are only read for the first query that uses them.
+
+Results are JSON::
+
+    {"query": "muon", "correction": null, "total": 42, "cached": false,
+     "ms": 0.8, "results": [{"id": "10592", "title": "...",
+                             "url": "translations/translation_10592.html",
+                             "score": 12.31}, ...]}
+
+The last RESULT_CACHE_SIZE queries are kept in an LRU cache keyed by their
+normalized terms, so a repeated query costs a dictionary lookup. ``ms`` is the
+time the query took, cache hits included.
+
+Usage:
+
+    python search_query.py muon optimizer           # one query
+    python search_query.py < queries.txt            # one query per line
+    python search_query.py --serve --port 8765      # GET /search?q=muon&limit=10
+"""
+
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from pathlib import Path
+
+from build_search_index import CJK_PATTERN, tokenize, trigrams
+from config import CONFIG
+from profiling import profile_from_argv
+
+# Queries whose results are kept, as in the page's worker
+RESULT_CACHE_SIZE = 50
+DEFAULT_LIMIT = 10
+DEFAULT_PORT = 8765
+
+
+def read_varint(data, position):
+    """Decode a varint at position; returns (value, next position)."""
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, position
+
+
+def read_sections(data):
+    """Split a binary index file into its varint-length-prefixed sections."""
+    sections = []
+    position = 0
+    while position < len(data):
+        length, position = read_varint(data, position)
+        sections.append(data[position:position + length])
+        position += length
+    return sections
+
+
+def decode_terms(dict_bytes):
+    """Undo front_code(): each entry is a base-36 shared-prefix length and a suffix."""
+    terms = []
+    previous = ''
+    for coded in dict_bytes.decode('utf-8').split(' '):
+        previous = previous[:int(coded[0], 36)] + coded[1:]
+        terms.append(previous)
+    return terms
+
+
+def decode_lists(data, count):
+    """Decode count number lists written by pack_lists()."""
+    lists = []
+    position = 0
+    for _ in range(count):
+        n, position = read_varint(data, position)
+        numbers = []
+        number = -1
+        for _ in range(n):
+            gap, position = read_varint(data, position)
+            number += gap + 1
+            numbers.append(number)
+        lists.append(numbers)
+    return lists
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        row = [i]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            d = min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + cost)
+            if before and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d = min(d, before[j - 2] + 1)
+            row.append(d)
+        if min(row) > limit:
+            return limit + 1
+        before, previous = previous, row
+    return previous[len(b)]
+
+
+def query_terms(query):
+    """Split a query like the page does: (term, is_cjk) pairs, CJK runs as bigrams."""
+    terms = []
+    for token in tokenize(query):
+        last = 0
+        for match in CJK_PATTERN.finditer(token):
+            if match.start() > last:
+                terms.append((token[last:match.start()], False))
+            run = match.group()
+            if len(run) == 1:
+                terms.append((run, True))
+            terms.extend((run[i:i + 2], True) for i in range(len(run) - 1))
+            last = match.end()
+        if last < len(token):
+            terms.append((token[last:], False))
+    return terms
+
+
+class ShardedIndex:
+    """One sharded BM25F index (English or Chinese) decoded into memory.
+
+    Args:
+        search_dir: Directory holding the shard files.
+        manifest: The index's manifest: lengths, bm25 and shards.
+        doc_count: Number of indexed articles.
+    """
+
+    def __init__(self, search_dir, manifest, doc_count):
+        fields = manifest['bm25']['fields']
+        self.k1 = manifest['bm25']['k1']
+        self.lengths = manifest['lengths']
+        self.doc_count = doc_count
+        self.field_count = len(fields)
+        self.fields = [
+            (field['weight'], field['b'], sum(l[i] for l in self.lengths) / len(self.lengths) or 1)
+            for i, field in enumerate(fields)
+        ]
+        # Shards are read up front but their postings decoded on first use
+        self.shards = []
+        self.shard_of = {}
+        for _, name in manifest['shards']:
+            dict_bytes, blob = read_sections((Path(search_dir) / name).read_bytes())
+            terms = decode_terms(dict_bytes)
+            self.shard_of.update(dict.fromkeys(terms, len(self.shards)))
+            self.shards.append([terms, blob, None])
+        # Code point order, which bisect needs; the files are in UTF-16 order
+        self.terms = sorted(self.shard_of)
+
+    def postings(self, term):
+        """(doc, field frequencies) list of a term in the index."""
+        shard = self.shards[self.shard_of[term]]
+        if shard[2] is None:
+            shard[2] = self._decode_postings(*shard[:2])
+        return shard[2][term]
+
+    def _decode_postings(self, terms, blob):
+        mask = (1 << self.field_count) - 1
+        decoded = {}
+        position = 0
+        for term in terms:
+            n, position = read_varint(blob, position)
+            postings = []
+            doc = -1
+            for _ in range(n):
+                posting, position = read_varint(blob, position)
+                doc += (posting >> self.field_count) + 1
+                counts = [0] * self.field_count
+                for i in range(self.field_count):
+                    if posting & mask & (1 << i):
+                        counts[i], position = read_varint(blob, position)
+                postings.append((doc, counts))
+            decoded[term] = postings
+        return decoded
+
+    def bm25f(self, doc, counts, document_frequency):
+        lengths = self.lengths[doc]
+        tf = 0.0
+        for i, (weight, b, average) in enumerate(self.fields):
+            if counts[i]:
+                tf += weight * counts[i] / (1 - b + b * lengths[i] / average)
+        idf = math.log(1 + (self.doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        return idf * tf * (self.k1 + 1) / (tf + self.k1)
+
+    def lookup(self, term, is_prefix=False):
+        """Map of doc number -> score; a prefix is scored as one term."""
+        if is_prefix:
+            start = bisect_left(self.terms, term)
+            end = bisect_left(self.terms, term + '\U0010ffff', start)
+            matching = self.terms[start:end]
+        else:
+            matching = [term] if term in self.shard_of else []
+        frequencies = {}
+        for t in matching:
+            for doc, counts in self.postings(t):
+                total = frequencies.setdefault(doc, [0] * self.field_count)
+                for i, count in enumerate(counts):
+                    total[i] += count
+        return {doc: self.bm25f(doc, counts, len(frequencies)) for doc, counts in frequencies.items()}
+
+
+class SearchIndex:
+    """The search/ index in memory, answering ranked queries with an LRU cache.
+
+    Args:
+        search_dir: The index written by build_search_index.py (search/ by default).
+        titles: Article ID -> title for the results; read from the
+            translations manifest if not given.
+    """
+
+    def __init__(self, search_dir=None, titles=None, cache_size=RESULT_CACHE_SIZE):
+        self.search_dir = Path(search_dir or CONFIG.search_dir)
+        self.manifest = json.loads((self.search_dir / 'manifest.json').read_text(encoding='utf-8'))
+        self.docs = self.manifest['docs']
+        self.english = ShardedIndex(self.search_dir, self.manifest, len(self.docs))
+        self._cjk = None
+        self._fuzzy = None
+        if titles is None:
+            # The manifest the index was built from; querying does not refresh it
+            from manifest import MANIFEST_PATH, load_manifest, manifest_articles, update_manifest
+            manifest = load_manifest() if MANIFEST_PATH.exists() else update_manifest()
+            titles = {r['id']: r['title'] for r in manifest_articles(manifest)}
+        self.titles = titles
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        # The HTTP service answers from several threads
+        self.lock = threading.Lock()
+
+    @property
+    def cjk(self):
+        if self._cjk is None:
+            cjk_manifest = json.loads((self.search_dir / self.manifest['cjk']).read_text(encoding='utf-8'))
+            self._cjk = ShardedIndex(self.search_dir, cjk_manifest, len(self.docs))
+        return self._cjk
+
+    @property
+    def fuzzy(self):
+        """(vocabulary, trigram -> vocabulary numbers) of the correction vocabulary."""
+        if self._fuzzy is None:
+            terms, grams, postings = read_sections((self.search_dir / self.manifest['fuzzy']).read_bytes())
+            gram_list = decode_terms(grams)
+            self._fuzzy = (decode_terms(terms), dict(zip(gram_list, decode_lists(postings, len(gram_list)))))
+        return self._fuzzy
+
+    def corrections(self, term):
+        """Vocabulary terms at the smallest edit distance from a term that matched nothing."""
+        max_edits = 0 if len(term) < 4 else 1 if len(term) < 8 else 2
+        if max_edits == 0:
+            return []
+        vocabulary, gram_index = self.fuzzy
+        grams = trigrams(term)
+        shared = {}
+        for gram in grams:
+            for number in gram_index.get(gram, []):
+                shared[number] = shared.get(number, 0) + 1
+        needed = max(1, len(grams) - 3 * max_edits)
+        candidates = []
+        for number, count in shared.items():
+            if count >= needed:
+                distance = edit_distance(term, vocabulary[number], max_edits)
+                if distance <= max_edits:
+                    candidates.append((distance, -count, number))
+        candidates.sort(key=lambda c: c[:2])
+        return [vocabulary[number] for distance, _, number in candidates
+                if distance == candidates[0][0]][:3]
+
+    def rank(self, terms, partial=False):
+        """Ranked (doc, score) list for the terms, and the corrected query or None."""
+        matches = [(self.cjk if is_cjk else self.english).lookup(term, partial and i == len(terms) - 1)
+                   for i, (term, is_cjk) in enumerate(terms)]
+        corrected = None
+        for i, (term, is_cjk) in enumerate(terms):
+            if is_cjk or matches[i]:
+                continue
+            replacements = self.corrections(term)
+            if not replacements:
+                continue
+            merged = {}
+            for replacement in replacements:
+                for doc, score in self.english.lookup(replacement).items():
+                    merged[doc] = max(score, merged.get(doc, 0))
+            matches[i] = merged
+            corrected = corrected or [t for t, _ in terms]
+            corrected[i] = replacements[0]
+
+        # Intersect, starting from the rarest term
+        matches.sort(key=len)
+        results = [(doc, sum(scores[doc] for scores in matches))
+                   for doc in matches[0] if all(doc in scores for scores in matches[1:])]
+        results.sort(key=lambda r: -r[1])
+        return results, corrected and ' '.join(corrected)
+
+    def search(self, query, limit=DEFAULT_LIMIT, partial=False):
+        """Answer a query as a JSON-ready dict; partial matches the last term as a prefix."""
+        start = time.perf_counter()
+        terms = query_terms(query)
+        key = (tuple(terms), partial)
+        with self.lock:
+            entry = self.cache.get(key)
+            cached = entry is not None
+            if cached:
+                self.cache.move_to_end(key)
+            else:
+                entry = self.rank(terms, partial) if terms else ([], None)
+                self.cache[key] = entry
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        results, correction = entry
+        return {
+            'query': query,
+            'correction': correction,
+            'total': len(results),
+            'cached': cached,
+            'ms': round((time.perf_counter() - start) * 1000, 3),
+            'results': [
+                {
+                    'id': self.docs[doc],
+                    'title': self.titles.get(self.docs[doc]),
+                    'url': f'translations/translation_{self.docs[doc]}.html',
+                    'score': round(score, 4),
+                }
+                for doc, score in results[:limit]
+            ],
+        }
+
+
+def serve(index, port=DEFAULT_PORT, host='127.0.0.1'):
+    """Answer GET /search?q=...&limit=...&prefix=1 with JSON until interrupted."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            params = parse_qs(url.query)
+            if url.path != '/search' or 'q' not in params:
+                self.reply(404, {'error': 'use /search?q=<query>'})
+                return
+            try:
+                limit = int(params.get('limit', [DEFAULT_LIMIT])[0])
+            except ValueError:
+                self.reply(400, {'error': 'limit must be a number'})
+                return
+            partial = params.get('prefix', ['0'])[0] not in ('', '0', 'false')
+            self.reply(200, index.search(params['q'][0], limit, partial))
+
+        def reply(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"Serving search on http://{host}:{port}/search?q=... (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(queries=None, limit=DEFAULT_LIMIT, partial=False, port=None, search_dir=None):
+    """Print JSON results for the queries (or stdin lines), or serve them on port."""
+    import sys
+
+    start = time.perf_counter()
+    index = SearchIndex(search_dir)
+    print(f"Loaded {len(index.docs)} articles in {(time.perf_counter() - start) * 1000:.0f} ms",
+          file=sys.stderr)
+    if port:
+        serve(index, port)
+        return
+    for query in (queries if queries else (line.strip() for line in sys.stdin)):
+        if query:
+            print(json.dumps(index.search(query, limit, partial), ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    profile_from_argv('search_query')
+    parser = argparse.ArgumentParser(description="Query the search index; results are JSON.")
+    parser.add_argument('query', nargs='*', help="Query words; without them, one query per line of stdin")
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help="Results per query")
+    parser.add_argument('--prefix', action='store_true', help="Match the last word as a prefix, like the page")
+    parser.add_argument('--serve', action='store_true', help="Serve GET /search?q=... over HTTP")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Port for --serve")
+    args = parser.parse_args()
+    main([' '.join(args.query)] if args.query else None, args.limit, args.prefix,
+         args.port if args.serve else None)
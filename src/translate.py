@@ -1,20 +1,50 @@
 import os
 import re
+import sys
 import time
+from datetime import datetime
+from html import escape, unescape
 from typing import Any
 from pathlib import Path
 from dotenv import load_dotenv
-from exa_py import Exa
-from firecrawl import FirecrawlApp
-import requests
 import json
 
-# Set up paths relative to this script
-SCRIPT_DIR = Path(__file__).parent
-ROOT_DIR = SCRIPT_DIR.parent
-load_dotenv(ROOT_DIR / '.env')
-exa = Exa(api_key = os.getenv("EXA_API_KEY"))
-firecrawl = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+import build_search_index
+import cleanup_articles
+import corpus_db
+import generate_contents
+import link_graph
+import page_assets
+import run_log
+from config import CONFIG
+from date_index import update_date_index, lookup_date, missing_dates
+from html_transform import LazySpanRule, RegexRule, set_page_block
+from progress import start_progress
+
+load_dotenv(CONFIG.env_path)
+
+# The network SDKs are slow to import; clients are created on first use so
+# local commands (postprocess, report, builds) start without them
+_exa = None
+_firecrawl = None
+
+
+def get_exa():
+    """Return the Exa client, creating it on first use."""
+    global _exa
+    if _exa is None:
+        from exa_py import Exa
+        _exa = Exa(api_key=os.getenv("EXA_API_KEY"))
+    return _exa
+
+
+def get_firecrawl():
+    """Return the Firecrawl client, creating it on first use."""
+    global _firecrawl
+    if _firecrawl is None:
+        from firecrawl import FirecrawlApp
+        _firecrawl = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+    return _firecrawl
 
 PROMPT = \
 """
@@ -63,191 +93,64 @@ PROMPT = \
 # MODEL = "nvidia/nemotron-3-nano-30b-a3b:free"
 MODEL = "google/gemini-3-flash-preview"
 
-CSS_STYLES = \
-    """
-    <meta charset="utf-8">
-    <style type="text/css">
-
-    body {
-    margin: 48px auto;
-    max-width: 68ch;              /* character-based width reads better */
-    padding: 0 16px;
-
-    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI",
-                Roboto, "Helvetica Neue", Arial, sans-serif;
-    font-size: 18px;
-    line-height: 1.65;
-    color: #333;
-    background: #fafafa;
-    }
-
-    h1, h2, h3, h4 {
-    line-height: 1.25;
-    margin-top: 2.2em;
-    margin-bottom: 0.6em;
-    font-weight: 600;
-    }
-
-    h1 {
-    font-size: 2.1em;
-    margin-top: 0;
-    }
-
-    h2 {
-    font-size: 1.6em;
-    border-bottom: 1px solid #e5e5e5;
-    padding-bottom: 0.3em;
-    }
-
-    h3 {
-    font-size: 1.25em;
-    }
-
-    h4 {
-    font-size: 1.05em;
-    color: #555;
-    }
-
-    /* Paragraphs and lists */
-    p {
-    margin: 1em 0;
-    }
-
-    ul, ol {
-    margin: 1em 0 1em 1.5em;
-    }
-
-    li {
-    margin: 0.4em 0;
-    }
-
-    a {
-    color: #005fcc;
-    text-decoration: none;
-    }
-
-    a:hover {
-    text-decoration: underline;
-    }
-
-    code {
-    font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace;
-    font-size: 0.95em;
-    background: #f2f2f2;
-    padding: 0.15em 0.35em;
-    border-radius: 4px;
-    }
-
-    pre {
-    font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace;
-    font-size: 0.9em;
-    background: #f5f5f5;
-    padding: 1em 1.2em;
-    overflow-x: auto;
-    border-radius: 6px;
-    line-height: 1.45;
-    }
-
-    pre code {
-    background: none;
-    padding: 0;
-    }
-
-    blockquote {
-    margin: 1.5em 0;
-    padding-left: 1em;
-    border-left: 4px solid #ddd;
-    color: #555;
-    }
-
-    hr {
-    border: none;
-    border-top: 1px solid #e0e0e0;
-    margin: 3em 0;
-    }
-
-    table {
-    border-collapse: collapse;
-    margin: 1.5em 0;
-    width: 100%;
-    font-size: 0.95em;
-    }
-
-    th, td {
-    padding: 0.5em 0.7em;
-    border-bottom: 1px solid #e5e5e5;
-    text-align: left;
-    }
-
-    th {
-    font-weight: 600;
-    }
-
-    img {
-    max-width: 100%;
-    display: block;
-    margin: 1.5em auto;
-    }
-
-    small {
-    color: #666;
-    }
-
-    mjx-container {
-    margin: 1em 0;
-    }
-
-    ::selection {
-    background: #cce2ff;
-    }
-
-    </style>
-    """
+def log_completion(log: dict, data: dict, output: str):
+    """Add token usage and output size from a chat completion response to a stage log."""
+    usage = data.get("usage") or {}
+    log['prompt_tokens'] = usage.get("prompt_tokens")
+    log['completion_tokens'] = usage.get("completion_tokens")
+    log['bytes'] = len(output.encode('utf-8'))
 
 def get_translation(url: str) -> str:
-    result = exa.get_contents(
-        [url],
-        text = True
-    )
-
-    result = result.results[0].text
+    article_id = get_article_id(url)
+    with run_log.stage('fetch', article_id, provider='exa') as log:
+        result = get_exa().get_contents(
+            [url],
+            text = True
+        )
+
+        result = result.results[0].text
+        log['bytes'] = len(result.encode('utf-8'))
     print("=== DONE GETTING CONTENT ===")
-    response = requests.post(
-        url="https://openrouter.ai/api/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}",
-        },
-        data=json.dumps({
-            "model": MODEL,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": result + "\n\n" + PROMPT
+    import requests
+    with run_log.stage('translate', article_id, input_bytes=len(result.encode('utf-8'))) as log:
+        response = requests.post(
+            url="https://openrouter.ai/api/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}",
+            },
+            data=json.dumps({
+                "model": MODEL,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": result + "\n\n" + PROMPT
+                    }
+                ],
+                "reasoning": {
+                    "effort": "none"
                 }
-            ],
-            "reasoning": {
-                "effort": "none"
-            }
-        })
-    )
+            })
+        )
+        data = response.json()
+        result = data["choices"][0]["message"]["content"]
+        log_completion(log, data, result)
     print("=== DONE GETTING TRANSLATION ===")
 
-    result = response.json()["choices"][0]["message"]["content"]
     return result
 
 def save_translation(url: str, path = None):
     if path is None:
-        path = ROOT_DIR / 'translations'
+        path = CONFIG.translations_dir
     result = get_translation(url)
-    full_html = CSS_STYLES + "\n\n" + result
+    full_html = page_assets.use_shared_assets(result)
 
     with open(f"{path}/translation_{url.split('/')[-1]}.html", "w") as f:
         f.write(full_html)
 
 # ============== Caching Infrastructure ==============
 
-CACHE_DIR = "cache"
-RAW_DIR = f"{CACHE_DIR}/raw"
+CACHE_DIR = CONFIG.cache_dir
+RAW_DIR = CONFIG.raw_dir
 
 def ensure_cache_dirs():
     """Create cache directories if they don't exist."""
@@ -263,11 +166,13 @@ def discover_all_urls() -> list[dict]:
     Returns a list of dicts with 'url', 'id', and 'year' keys.
     """
     print("Fetching content.html via Exa...")
-    result = exa.get_contents(
-        ["https://kexue.fm/content.html"],
-        text=True
-    )
-    content = result.results[0].text
+    with run_log.stage('discover', provider='exa') as log:
+        result = get_exa().get_contents(
+            ["https://kexue.fm/content.html"],
+            text=True
+        )
+        content = result.results[0].text
+        log['bytes'] = len(content.encode('utf-8'))
 
     # Save raw content.html for debugging
     ensure_cache_dirs()
@@ -321,17 +226,23 @@ def cache_content(url: str) -> dict:
 
     # Skip if already cached
     if os.path.exists(cache_path):
-        with open(cache_path, 'r') as f:
-            content = f.read()
+        with run_log.stage('fetch', article_id, provider='cache', outcome='cached') as log:
+            with open(cache_path, 'r') as f:
+                content = f.read()
+            log['chars'] = len(content)
         return {"url": url, "id": article_id, "cached": True, "chars": len(content)}
 
     # Fetch via Exa
-    result = exa.get_contents([url], text=True)
-    content = result.results[0].text
+    with run_log.stage('fetch', article_id, provider='exa') as log:
+        result = get_exa().get_contents([url], text=True)
+        content = result.results[0].text
+        log['bytes'] = len(content.encode('utf-8'))
+        log['chars'] = len(content)
 
     # Save to cache
-    with open(cache_path, 'w') as f:
-        f.write(content)
+    with run_log.stage('write', article_id, kind='raw', bytes=len(content.encode('utf-8'))):
+        with open(cache_path, 'w') as f:
+            f.write(content)
 
     return {"url": url, "id": article_id, "cached": False, "chars": len(content)}
 
@@ -339,18 +250,22 @@ def cache_all_content(articles: list[dict]) -> list[dict]:
     """Cache content for all article URLs."""
     ensure_cache_dirs()
     results = []
+    progress = start_progress(len(articles))
 
     for i, article in enumerate(articles):
         url = article['url']
         print(f"[{i+1}/{len(articles)}] Caching {url}")
         try:
-            result = cache_content(url)
+            with run_log.stage('article', article['id']):
+                result = cache_content(url)
             result['year'] = article.get('year')
             results.append(result)
         except Exception as e:
             print(f"  Error: {e}")
             results.append({"url": url, "id": article['id'], "error": str(e)})
 
+    progress.close()
+
     # Save metadata
     with open(f"{CACHE_DIR}/metadata.json", 'w') as f:
         json.dump(results, f, indent=2)
@@ -366,21 +281,27 @@ def cache_content_firecrawl(url: str) -> dict:
 
     # Skip if already cached
     if os.path.exists(cache_path):
-        with open(cache_path, 'r') as f:
-            content = f.read()
+        with run_log.stage('fetch', article_id, provider='cache', outcome='cached') as log:
+            with open(cache_path, 'r') as f:
+                content = f.read()
+            log['chars'] = len(content)
         return {"url": url, "id": article_id, "cached": True, "chars": len(content), "source": "existing"}
 
     # Fetch via Firecrawl
-    result = firecrawl.scrape(url, formats=['markdown'])
+    with run_log.stage('fetch', article_id, provider='firecrawl') as log:
+        result = get_firecrawl().scrape(url, formats=['markdown'])
 
-    # Extract text content (result is a Pydantic Document model)
-    content = result.markdown if result.markdown else ''
-    if not content:
-        raise ValueError("Firecrawl returned no markdown content")
+        # Extract text content (result is a Pydantic Document model)
+        content = result.markdown if result.markdown else ''
+        if not content:
+            raise ValueError("Firecrawl returned no markdown content")
+        log['bytes'] = len(content.encode('utf-8'))
+        log['chars'] = len(content)
 
     # Save to cache
-    with open(cache_path, 'w') as f:
-        f.write(content)
+    with run_log.stage('write', article_id, kind='raw', bytes=len(content.encode('utf-8'))):
+        with open(cache_path, 'w') as f:
+            f.write(content)
 
     return {"url": url, "id": article_id, "cached": False, "chars": len(content), "source": "firecrawl"}
 
@@ -415,11 +336,13 @@ def retry_failed_with_firecrawl(rate_limit_delay: float = 6.0):
     print(f"Rate limit delay: {rate_limit_delay}s between requests")
 
     results = []
+    progress = start_progress(len(failed))
     for i, item in enumerate(failed):
         url = item['url']
         print(f"[{i+1}/{len(failed)}] Retrying {url}")
         try:
-            result = cache_content_firecrawl(url)
+            with run_log.stage('article', item.get('id', get_article_id(url))):
+                result = cache_content_firecrawl(url)
             results.append(result)
             if result.get('source') == 'firecrawl':
                 print(f"  SUCCESS: {result['chars']} chars")
@@ -433,6 +356,8 @@ def retry_failed_with_firecrawl(rate_limit_delay: float = 6.0):
         if i < len(failed) - 1:  # Don't wait after last request
             time.sleep(rate_limit_delay)
 
+    progress.close()
+
     # Save Firecrawl results
     with open(f"{CACHE_DIR}/firecrawl_results.json", 'w') as f:
         json.dump(results, f, indent=2)
@@ -458,6 +383,18 @@ def calculate_total_tokens() -> dict:
     total_chars = 0
     file_count = 0
 
+    if corpus_db.exists():
+        # Totals are kept by the store; only changed raw files are read
+        conn = corpus_db.connect()
+        corpus_db.sync_raw(conn)
+        totals = corpus_db.stats(conn)
+        conn.close()
+        return {
+            "file_count": totals['raw_count'],
+            "total_chars": totals['raw_chars'],
+            "estimated_tokens": estimate_tokens(totals['raw_chars'])
+        }
+
     for filename in os.listdir(RAW_DIR):
         if filename.endswith('.txt'):
             with open(f"{RAW_DIR}/{filename}", 'r') as f:
@@ -493,6 +430,10 @@ def estimate_cost(input_tokens: int, output_tokens: int = None) -> dict:
         "total_cost_usd": round(total_cost, 4)
     }
 
+def token_cost(prompt_tokens: int, completion_tokens: int) -> float:
+    """Cost in USD of actual token usage, at the estimate_cost prices."""
+    return estimate_cost(prompt_tokens, completion_tokens)['total_cost_usd']
+
 def run_cache_and_estimate():
     """Main function to discover URLs, cache content, and estimate costs."""
     # Step 1: Discover URLs
@@ -553,72 +494,97 @@ def run_cache_and_estimate():
 #   "" -> links stay as relative "translation_11033.html"
 TRANSLATED_BASE_URL = ""  # Empty = relative links like "translation_XXXX.html"
 
-def rewrite_internal_links(html: str) -> str:
+# Match href="https://kexue.fm/archives/XXXX" (with or without trailing slash)
+INTERNAL_LINK_PATTERN = re.compile(r'href="https?://kexue\.fm/archives/(\d+)/?\"')
+
+
+def translated_url(article_id) -> str:
+    """Return the URL of an article's translation (see TRANSLATED_BASE_URL)."""
+    if TRANSLATED_BASE_URL:
+        # Use configured base URL
+        if TRANSLATED_BASE_URL.startswith("http"):
+            # Full domain: https://kexue-en.com/archives/XXXX
+            return f'{TRANSLATED_BASE_URL}/archives/{article_id}'
+        else:
+            # Relative path: /translations/translation_XXXX.html
+            return f'{TRANSLATED_BASE_URL}/translation_{article_id}.html'
+    else:
+        # Default: relative link to translation file
+        return f'translation_{article_id}.html'
+
+
+# Match links that an earlier run already rewrote with translated_url()
+TRANSLATED_LINK_PATTERN = re.compile(
+    'href="' + re.escape(translated_url('ID')).replace('ID', r'(\d+)') + '"')
+
+
+def rewrite_internal_links(html: str, article_id: str = None, translated: set = None) -> str:
     """Rewrite links to other kexue.fm articles to point to translated versions.
 
     Converts: https://kexue.fm/archives/XXXX
     To: {TRANSLATED_BASE_URL}/translation_XXXX.html (or configured format)
+
+    Only articles in translated (IDs with a translation file, read from the
+    translations directory if not given) are rewritten; links to the others
+    stay on kexue.fm, and earlier rewrites to them are pointed back there.
+    Links to the article itself (the title and citation) are left alone.
     """
+    if translated is None:
+        translated = link_graph.translated_ids()
+    own_id = int(article_id) if article_id is not None else None
+
     def replace_link(match):
-        article_id = match.group(1)
-        if TRANSLATED_BASE_URL:
-            # Use configured base URL
-            if TRANSLATED_BASE_URL.startswith("http"):
-                # Full domain: https://kexue-en.com/archives/XXXX
-                return f'{TRANSLATED_BASE_URL}/archives/{article_id}'
-            else:
-                # Relative path: /translations/translation_XXXX.html
-                return f'{TRANSLATED_BASE_URL}/translation_{article_id}.html'
-        else:
-            # Default: relative link to translation file
-            return f'translation_{article_id}.html'
+        target = int(match.group(1))
+        if target == own_id or target not in translated:
+            return match.group(0)
+        return f'href="{translated_url(target)}"'
 
-    # Match href="https://kexue.fm/archives/XXXX" (with or without trailing slash)
-    pattern = r'href="https?://kexue\.fm/archives/(\d+)/?\"'
-    html = re.sub(pattern, lambda m: f'href="{replace_link(m)}"', html)
+    def restore_link(match):
+        target = int(match.group(1))
+        if target in translated:
+            return match.group(0)
+        return f'href="https://kexue.fm/archives/{target}"'
+
+    html = INTERNAL_LINK_PATTERN.sub(replace_link, html)
+    html = TRANSLATED_LINK_PATTERN.sub(restore_link, html)
 
     return html
 
-def inject_author_date_from_cache(html: str, article_id: str) -> str:
-    """Inject author/date line if missing, using date from raw cache."""
-    from datetime import datetime
 
+def render_backlinks(article_id: str, links: dict) -> str:
+    """HTML of the "Referenced by" block: translated articles citing this one, newest first."""
+    sources = [source for source in links['backlinks'].get(int(article_id), [])
+               if source in links['translated'] and source in links['titles']]
+    if not sources:
+        return ''
+    # Titles are the <h1> text as written, so entities are decoded before escaping
+    items = ''.join(f'        <li><a href="{translated_url(source)}">{escape(unescape(links["titles"][source]), quote=False)}</a></li>\n'
+                    for source in sorted(sources, reverse=True))
+    return ('<nav class="backlinks" style="margin-top: 3em;">\n'
+            '    <p style="margin: 0 0 0.5em 0;"><strong>Referenced by</strong></p>\n'
+            '    <ul style="margin: 0 0 0 1.5em;">\n'
+            f'{items}'
+            '    </ul>\n'
+            '</nav>\n')
+
+def inject_author_date_from_cache(html: str, article_id: str, date_index: dict = None) -> str:
+    """Inject author/date line if missing, using the raw-cache date index.
+
+    Args:
+        date_index: Index from date_index.update_date_index(). Loaded (and
+            refreshed for changed raw files) if not given.
+    """
     # Check if author line already exists
     if re.search(r'<p>By (?:苏剑林|Su Jianlin)', html):
         return html
 
-    # Try to get date from raw cache
-    cache_path = f"{RAW_DIR}/{article_id}.txt"
-    if not os.path.exists(cache_path):
-        return html
-
-    with open(cache_path, 'r') as f:
-        raw_content = f.read()
+    if date_index is None:
+        date_index = update_date_index()
 
-    # Look for Chinese citation pattern: 苏剑林. (Jan. 06, 2022) or 苏剑林. (2022-01-06)
-    date_str = None
-
-    # Try abbreviated month format
-    match = re.search(r'苏剑林\.\s*\(([A-Z][a-z]{2,3})\.?\s*(\d{1,2}),?\s*(\d{4})\)', raw_content)
-    if match:
-        try:
-            date = datetime.strptime(f"{match.group(1)[:3]} {match.group(2)} {match.group(3)}", "%b %d %Y")
-            date_str = date.strftime("%B %d, %Y")
-        except ValueError:
-            pass
-
-    # Try ISO format
-    if not date_str:
-        match = re.search(r'苏剑林\.\s*\((\d{4})-(\d{2})-(\d{2})\)', raw_content)
-        if match:
-            try:
-                date = datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-                date_str = date.strftime("%B %d, %Y")
-            except ValueError:
-                pass
-
-    if not date_str:
+    date = lookup_date(date_index, article_id)
+    if not date:
         return html
+    date_str = date.strftime("%B %d, %Y")
 
     # Inject author line after </h1>
     author_line = f'\n\n    <p>By 苏剑林 | {date_str}</p>\n'
@@ -627,38 +593,36 @@ def inject_author_date_from_cache(html: str, article_id: str) -> str:
     return html
 
 
-def standardize_author_date(html: str) -> str:
-    """Standardize the author/date line to a consistent format.
+# Author name variations (plain text or linked, with optional English name in parens)
+AUTHOR_PATTERN = r'(?:苏剑林(?: \(Su Jianlin\))?|Su Jianlin|Jianlin Su|<a[^>]*>(?:Su Jianlin|Jianlin Su|苏剑林)</a>)'
 
-    Converts various formats to: <p>By 苏剑林 | Month DD, YYYY</p>
-    """
-    from datetime import datetime
+# Patterns (matched with re.DOTALL) for the various author/date formats, with
+# a function building the standardized line from each match
+AUTHOR_DATE_PATTERNS = [
+    # ISO date with optional reader count (possibly multiline)
+    (rf'<p>\s*By \s*{AUTHOR_PATTERN} \s*\| \s*(\d{{4}})-(\d{{2}})-(\d{{2}})(?:\s*\|[^<]*)?\s*</p>',
+     lambda m: f'<p>By 苏剑林 | {datetime(int(m.group(1)), int(m.group(2)), int(m.group(3))).strftime("%B %d, %Y")}</p>'),
 
-    # Author name variations (plain text or linked, with optional English name in parens)
-    author_pattern = r'(?:苏剑林(?: \(Su Jianlin\))?|Su Jianlin|Jianlin Su|<a[^>]*>(?:Su Jianlin|Jianlin Su|苏剑林)</a>)'
-    # Whitespace that may include newlines
-    ws = r'[\s\n]*'
+    # Full month with optional reader count (possibly multiline)
+    (rf'<p>\s*By \s*{AUTHOR_PATTERN} \s*\| \s*([A-Z][a-z]+ \d{{1,2}}, \d{{4}})(?:\s*\|[^<]*)?\s*</p>',
+     lambda m: f'<p>By 苏剑林 | {m.group(1)}</p>'),
 
-    # Pattern to match various author/date formats
-    patterns = [
-        # ISO date with optional reader count (possibly multiline)
-        (rf'<p>{ws}By {ws}{author_pattern} {ws}\| {ws}(\d{{4}})-(\d{{2}})-(\d{{2}})(?:{ws}\|[^<]*)?\s*</p>',
-         lambda m: f'<p>By 苏剑林 | {datetime(int(m.group(1)), int(m.group(2)), int(m.group(3))).strftime("%B %d, %Y")}</p>'),
+    # Abbreviated month with optional reader count (possibly multiline)
+    (rf'<p>\s*By \s*{AUTHOR_PATTERN} \s*\| \s*([A-Z][a-z]{{2,3}})\.? (\d{{1,2}}), (\d{{4}})(?:\s*\|[^<]*)?\s*</p>',
+     lambda m: f'<p>By 苏剑林 | {datetime.strptime(f"{m.group(1)[:3]} {m.group(2)} {m.group(3)}", "%b %d %Y").strftime("%B %d, %Y")}</p>'),
 
-        # Full month with optional reader count (possibly multiline)
-        (rf'<p>{ws}By {ws}{author_pattern} {ws}\| {ws}([A-Z][a-z]+ \d{{1,2}}, \d{{4}})(?:{ws}\|[^<]*)?\s*</p>',
-         lambda m: f'<p>By 苏剑林 | {m.group(1)}</p>'),
+    # "Published" format: "By X | Published Jan 20, 2019"
+    (rf'<p>\s*By \s*{AUTHOR_PATTERN} \s*\| \s*Published \s*([A-Z][a-z]{{2,3}})\.? (\d{{1,2}}), (\d{{4}})\s*</p>',
+     lambda m: f'<p>By 苏剑林 | {datetime.strptime(f"{m.group(1)[:3]} {m.group(2)} {m.group(3)}", "%b %d %Y").strftime("%B %d, %Y")}</p>'),
+]
 
-        # Abbreviated month with optional reader count (possibly multiline)
-        (rf'<p>{ws}By {ws}{author_pattern} {ws}\| {ws}([A-Z][a-z]{{2,3}})\.? (\d{{1,2}}), (\d{{4}})(?:{ws}\|[^<]*)?\s*</p>',
-         lambda m: f'<p>By 苏剑林 | {datetime.strptime(f"{m.group(1)[:3]} {m.group(2)} {m.group(3)}", "%b %d %Y").strftime("%B %d, %Y")}</p>'),
 
-        # "Published" format: "By X | Published Jan 20, 2019"
-        (rf'<p>{ws}By {ws}{author_pattern} {ws}\| {ws}Published {ws}([A-Z][a-z]{{2,3}})\.? (\d{{1,2}}), (\d{{4}})\s*</p>',
-         lambda m: f'<p>By 苏剑林 | {datetime.strptime(f"{m.group(1)[:3]} {m.group(2)} {m.group(3)}", "%b %d %Y").strftime("%B %d, %Y")}</p>'),
-    ]
+def standardize_author_date(html: str) -> str:
+    """Standardize the author/date line to a consistent format.
 
-    for pattern, replacement in patterns:
+    Converts various formats to: <p>By 苏剑林 | Month DD, YYYY</p>
+    """
+    for pattern, replacement in AUTHOR_DATE_PATTERNS:
         match = re.search(pattern, html, re.DOTALL)
         if match:
             try:
@@ -671,6 +635,30 @@ def standardize_author_date(html: str) -> str:
     return html
 
 
+# Translated citation block from the original page, removed in order
+CITATION_RULES = [
+    # "Reprinting is allowed..." paragraph and link
+    # Pattern: <p><em><strong>Reprinting...:</strong>...<a href="...">...</a></em></p>
+    RegexRule('reprinting',
+              r'<p><em><strong>Reprinting[^<]*</strong>[^<]*<a[^>]*>[^<]*</a></em></p>\s*',
+              flags=re.IGNORECASE | re.DOTALL),
+    # "If you need to cite..." paragraph
+    RegexRule('cite-heading',
+              r'<p><strong>If you need to cite[^<]*</strong></p>\s*',
+              flags=re.IGNORECASE),
+    # The citation paragraph that follows (author, date, title, url)
+    RegexRule('cite-paragraph',
+              r'<p>Su Jianlin\.\s*\([^)]+\)\.\s*"[^"]+"\.\s*\[Blog post\]\.\s*Retrieved from[^<]*<a[^>]*>[^<]*</a></p>\s*',
+              flags=re.IGNORECASE | re.DOTALL),
+    # BibTeX code blocks: <pre><code>@online{kexuefm-XXXX, ...}</code></pre>
+    LazySpanRule('bibtex-block',
+                 anchor=r'<pre',
+                 prefix=r'<pre><code>@online\{kexuefm-\d+,',
+                 closer=r'</code',
+                 suffix=r'</code></pre>\s*'),
+]
+
+
 def remove_translated_citation(html: str) -> str:
     """Remove the translated citation block from the original Chinese page.
 
@@ -680,49 +668,25 @@ def remove_translated_citation(html: str) -> str:
     - "If you need to cite this article..."
     - BibTeX code blocks
     """
-    # Remove "Reprinting is allowed..." paragraph and link
-    # Pattern: <p><em><strong>Reprinting...:</strong>...<a href="...">...</a></em></p>
-    html = re.sub(
-        r'<p><em><strong>Reprinting[^<]*</strong>[^<]*<a[^>]*>[^<]*</a></em></p>\s*',
-        '',
-        html,
-        flags=re.IGNORECASE | re.DOTALL
-    )
-
-    # Remove "If you need to cite..." paragraph
-    html = re.sub(
-        r'<p><strong>If you need to cite[^<]*</strong></p>\s*',
-        '',
-        html,
-        flags=re.IGNORECASE
-    )
-
-    # Remove the citation paragraph that follows (author, date, title, url)
-    html = re.sub(
-        r'<p>Su Jianlin\.\s*\([^)]+\)\.\s*"[^"]+"\.\s*\[Blog post\]\.\s*Retrieved from[^<]*<a[^>]*>[^<]*</a></p>\s*',
-        '',
-        html,
-        flags=re.IGNORECASE | re.DOTALL
-    )
-
-    # Remove BibTeX code blocks
-    html = re.sub(
-        r'<pre><code>@online\{kexuefm-\d+,.*?</code></pre>\s*',
-        '',
-        html,
-        flags=re.DOTALL
-    )
+    for rule in CITATION_RULES:
+        html = rule.apply(html)
 
     return html
 
 
-def postprocess_html(html: str, article_id: str) -> str:
+def postprocess_html(html: str, article_id: str, date_index: dict = None, *, links: dict) -> str:
     """Post-process translated HTML to add source link and citation.
 
     1. Removes translated citation block from original page
     2. Rewrites internal kexue.fm links to translated versions
     3. Ensures title links to original article
     4. Adds citation footer
+    5. Lists the translations citing this article ("Referenced by")
+    6. Uses the shared stylesheet and MathJax config (page_assets.py)
+
+    links comes from link_graph.link_context(); build it once per run, not
+    per file, since it refreshes the link graph and the manifest. Pass
+    date_index too when processing many files so it is loaded only once.
     """
     original_url = f"https://kexue.fm/archives/{article_id}"
 
@@ -730,14 +694,14 @@ def postprocess_html(html: str, article_id: str) -> str:
     html = remove_translated_citation(html)
 
     # Step 0.5: Inject author/date line if missing (from cache)
-    html = inject_author_date_from_cache(html, article_id)
+    html = inject_author_date_from_cache(html, article_id, date_index)
 
     # Step 0.6: Standardize author/date format
     html = standardize_author_date(html)
 
     # Step 1: Rewrite internal kexue.fm links to translated versions
     # (Do this BEFORE fixing the title link, so title stays pointing to original)
-    html = rewrite_internal_links(html)
+    html = rewrite_internal_links(html, article_id, links['translated'])
 
     # Step 2: Ensure <h1> title links to original (not translated)
     # Pattern: <h1>Title Text</h1> (without link)
@@ -791,12 +755,18 @@ def postprocess_html(html: str, article_id: str) -> str:
         else:
             html = html + citation
 
+    # Step 4: Backlinks go above the Related block and the citation footer
+    html = set_page_block(html, 'backlinks', render_backlinks(article_id, links), before=('related',))
+
+    # Step 5: One shared stylesheet and MathJax config instead of the model's inline copies
+    html = page_assets.use_shared_assets(html)
+
     return html
 
-def postprocess_translation_file(article_id: str, path=None):
+def postprocess_translation_file(article_id: str, path=None, links: dict = None):
     """Post-process an existing translation file."""
     if path is None:
-        path = ROOT_DIR / 'translations'
+        path = CONFIG.translations_dir
     filepath = f"{path}/translation_{article_id}.html"
 
     if not os.path.exists(filepath):
@@ -805,14 +775,24 @@ def postprocess_translation_file(article_id: str, path=None):
     with open(filepath, 'r') as f:
         html = f.read()
 
-    html = postprocess_html(html, article_id)
+    if links is None:
+        links = link_graph.link_context(path)
+    with run_log.stage('postprocess', article_id) as log:
+        html = postprocess_html(html, article_id, links=links)
+        log['bytes'] = len(html.encode('utf-8'))
 
-    with open(filepath, 'w') as f:
-        f.write(html)
+    with run_log.stage('write', article_id, kind='translation', bytes=len(html.encode('utf-8'))):
+        with open(filepath, 'w') as f:
+            f.write(html)
 
     print(f"Post-processed: {filepath}")
     return filepath
 
+def postprocess_translation_files(article_ids, path=None):
+    """Post-process several existing translation files, building the link context once."""
+    links = link_graph.link_context(path)
+    return [postprocess_translation_file(article_id, path, links) for article_id in article_ids]
+
 def translate_from_cache(article_id: str, timeout: int = 300, max_retries: int = 2) -> str:
     """Translate an article from cached content.
 
@@ -830,32 +810,37 @@ def translate_from_cache(article_id: str, timeout: int = 300, max_retries: int =
         content = f.read()
 
     print(f"Translating article {article_id} ({len(content)} chars)...")
+    import requests
+    input_bytes = len(content.encode('utf-8'))
 
     last_error = None
     for attempt in range(max_retries + 1):
         try:
-            response = requests.post(
-                url="https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}",
-                },
-                data=json.dumps({
-                    "model": MODEL,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": content + "\n\n" + PROMPT
+            with run_log.stage('translate', article_id, attempt=attempt + 1, input_bytes=input_bytes) as log:
+                response = requests.post(
+                    url="https://openrouter.ai/api/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}",
+                    },
+                    data=json.dumps({
+                        "model": MODEL,
+                        "messages": [
+                            {
+                                "role": "user",
+                                "content": content + "\n\n" + PROMPT
+                            }
+                        ],
+                        "reasoning": {
+                            "effort": "none"
                         }
-                    ],
-                    "reasoning": {
-                        "effort": "none"
-                    }
-                }),
-                timeout=timeout
-            )
-
-            response.raise_for_status()
-            result = response.json()["choices"][0]["message"]["content"]
+                    }),
+                    timeout=timeout
+                )
+
+                response.raise_for_status()
+                data = response.json()
+                result = data["choices"][0]["message"]["content"]
+                log_completion(log, data, result)
             return result
 
         except requests.exceptions.Timeout:
@@ -873,24 +858,54 @@ def translate_from_cache(article_id: str, timeout: int = 300, max_retries: int =
 
     raise Exception(f"Failed after {max_retries + 1} attempts: {last_error}")
 
-def save_translation_from_cache(article_id: str, path=None):
-    """Translate and save an article from cache."""
+def save_translation_from_cache(article_id: str, path=None, links: dict = None):
+    """Translate and save an article from cache.
+
+    Pass links (from link_graph.link_context()) when translating many
+    articles; the new translation is added to its translated IDs.
+    """
     if path is None:
-        path = ROOT_DIR / 'translations'
+        path = CONFIG.translations_dir
+    if links is None:
+        links = link_graph.link_context(path)
     result = translate_from_cache(article_id)
-    full_html = CSS_STYLES + "\n\n" + result
-
-    # Apply post-processing
-    full_html = postprocess_html(full_html, article_id)
+    # Apply post-processing (which also swaps the inline styles for the shared assets)
+    with run_log.stage('postprocess', article_id) as log:
+        full_html = postprocess_html(result, article_id, links=links)
+        log['bytes'] = len(full_html.encode('utf-8'))
 
     os.makedirs(path, exist_ok=True)
     output_path = f"{path}/translation_{article_id}.html"
-    with open(output_path, "w") as f:
-        f.write(full_html)
+    with run_log.stage('write', article_id, kind='translation', bytes=len(full_html.encode('utf-8'))):
+        with open(output_path, "w") as f:
+            f.write(full_html)
+    links['translated'].add(int(article_id))
 
     print(f"Saved translation to {output_path}")
     return output_path
 
+def relink_neighbors(article_ids, path=None):
+    """Post-process the translations linking to or from newly translated articles.
+
+    Their links to the new articles now go to the translations, and the new
+    articles show up in the "Referenced by" lists of the articles they cite.
+    """
+    if not article_ids:
+        return
+    if path is None:
+        path = CONFIG.translations_dir
+    links = link_graph.link_context(path)
+    affected = {int(a) for a in article_ids}
+    for article_id in article_ids:
+        affected.update(links['backlinks'].get(int(article_id), []))
+        affected.update(link_graph.outgoing_links(links['graph'], article_id))
+    affected &= links['translated']
+
+    for article_id in sorted(affected):
+        postprocess_translation_file(str(article_id), path, links)
+    print(f"Updated links in {len(affected)} translations")
+
+
 def translate_all(path=None, skip_existing=True):
     """Translate all cached articles.
 
@@ -899,7 +914,7 @@ def translate_all(path=None, skip_existing=True):
         skip_existing: If True, skip articles that already have translations
     """
     if path is None:
-        path = ROOT_DIR / 'translations'
+        path = CONFIG.translations_dir
     ensure_cache_dirs()
     os.makedirs(path, exist_ok=True)
 
@@ -929,13 +944,21 @@ def translate_all(path=None, skip_existing=True):
         print("No articles to translate!")
         return []
 
+    # Most cited first, so the articles linking to them can link to translations
+    degrees = link_graph.in_degrees(link_graph.update_link_graph())
+    to_translate.sort(key=lambda x: (-degrees[int(x)], -int(x)))
+    print(f"Ordered by citations: {sum(1 for x in to_translate if degrees[int(x)])} articles are cited by others")
+
     # Track results
     results = {"success": [], "failed": []}
+    links = link_graph.link_context(path)
+    progress = start_progress(len(to_translate), cost=token_cost)
 
     for i, article_id in enumerate(to_translate):
         print(f"[{i+1}/{len(to_translate)}] Translating article {article_id}...")
         try:
-            save_translation_from_cache(article_id, path)
+            with run_log.stage('article', article_id):
+                save_translation_from_cache(article_id, path, links)
             results["success"].append(article_id)
         except Exception as e:
             print(f"  FAILED: {e}")
@@ -947,6 +970,9 @@ def translate_all(path=None, skip_existing=True):
                 json.dump(results, f, indent=2)
             print(f"  Progress saved: {len(results['success'])} succeeded, {len(results['failed'])} failed")
 
+    progress.close()
+    relink_neighbors(results["success"], path)
+
     # Final save
     with open(f"{CACHE_DIR}/translation_progress.json", 'w') as f:
         json.dump(results, f, indent=2)
@@ -965,7 +991,7 @@ def translate_all(path=None, skip_existing=True):
 def retry_failed_translations(path=None):
     """Retry all failed translations from the progress file."""
     if path is None:
-        path = ROOT_DIR / 'translations'
+        path = CONFIG.translations_dir
     progress_file = f"{CACHE_DIR}/translation_progress.json"
 
     if not os.path.exists(progress_file):
@@ -986,17 +1012,23 @@ def retry_failed_translations(path=None):
 
     retried_success = []
     retried_failed = []
+    links = link_graph.link_context(path)
+    tracker = start_progress(len(failed_ids), cost=token_cost)
 
     for i, article_id in enumerate(failed_ids):
         print(f"[{i+1}/{len(failed_ids)}] Retrying article {article_id}...")
         try:
-            save_translation_from_cache(article_id, path)
+            with run_log.stage('article', article_id):
+                save_translation_from_cache(article_id, path, links)
             retried_success.append(article_id)
             print(f"  SUCCESS!")
         except Exception as e:
             print(f"  FAILED again: {e}")
             retried_failed.append({"id": article_id, "error": str(e)})
 
+    tracker.close()
+    relink_neighbors(retried_success, path)
+
     # Update progress file
     progress['success'].extend(retried_success)
     progress['failed'] = retried_failed
@@ -1018,12 +1050,16 @@ def retry_failed_translations(path=None):
 def postprocess_all(path=None):
     """Re-run postprocessing on all translation files."""
     if path is None:
-        path = ROOT_DIR / 'translations'
+        path = CONFIG.translations_dir
     import glob
 
     files = glob.glob(f"{path}/translation_*.html")
     print(f"Found {len(files)} translation files to postprocess")
 
+    # Dates for articles without an author line come from the index, not raw files
+    date_index = update_date_index()
+    links = link_graph.link_context(path)
+
     for i, filepath in enumerate(files):
         # Extract article ID from filename
         article_id = filepath.split('_')[-1].replace('.html', '')
@@ -1035,21 +1071,49 @@ def postprocess_all(path=None):
             with open(filepath, 'r') as f:
                 html = f.read()
 
-            html = postprocess_html(html, article_id)
+            with run_log.stage('postprocess', article_id) as log:
+                html = postprocess_html(html, article_id, date_index, links=links)
+                log['bytes'] = len(html.encode('utf-8'))
 
-            with open(filepath, 'w') as f:
-                f.write(html)
+            with run_log.stage('write', article_id, kind='translation', bytes=len(html.encode('utf-8'))):
+                with open(filepath, 'w') as f:
+                    f.write(html)
         except Exception as e:
             print(f"  Error on {article_id}: {e}")
 
     print(f"Done! Postprocessed {len(files)} files.")
 
 
+def update_related(full: bool = False, include_raw: bool = False):
+    """Refresh the Related blocks; numpy is only imported when this runs."""
+    import related_articles
+    related_articles.main(full=full, include_raw=include_raw)
+
+
+def build_site(step: int = 1, steps: int = 4):
+    """Clean up the translations, add related links, then regenerate index.html and the search index.
+
+    The build scripts run in this process; step/steps number the progress lines.
+    """
+    print(f"Step {step}/{steps}: Cleaning up articles...")
+    cleanup_articles.main()
+    print("  Cleaned up translations")
+
+    print(f"Step {step + 1}/{steps}: Updating related articles...")
+    update_related()
+    print("  Updated Related blocks")
+
+    print(f"Step {step + 2}/{steps}: Updating index...")
+    generate_contents.main()
+    print("  Updated index.html")
+
+    print(f"Step {step + 3}/{steps}: Updating search index...")
+    build_search_index.main()
+    print("  Updated search/")
+
+
 def add_new_post(url_or_id: str, force: bool = False):
     """Add a new blog post: fetch, cache, translate, and update index."""
-    import subprocess
-    import sys
-
     # Extract article ID from URL or use directly
     if url_or_id.startswith('http'):
         article_id = url_or_id.rstrip('/').split('/')[-1]
@@ -1063,14 +1127,14 @@ def add_new_post(url_or_id: str, force: bool = False):
     print()
 
     # Step 1: Check if already translated
-    translation_path = ROOT_DIR / f"translations/translation_{article_id}.html"
+    translation_path = CONFIG.translations_dir / f"translation_{article_id}.html"
     if os.path.exists(translation_path) and not force:
         print(f"Translation already exists: {translation_path}")
         print("Use --force to re-translate")
         return
 
     # Step 2: Cache content (fetch if needed)
-    print("Step 1/4: Fetching content...")
+    print("Step 1/6: Fetching content...")
     cache_path = f"{RAW_DIR}/{article_id}.txt"
     if os.path.exists(cache_path) and not force:
         print(f"  Already cached: {cache_path}")
@@ -1089,29 +1153,18 @@ def add_new_post(url_or_id: str, force: bool = False):
                 return
 
     # Step 3: Translate
-    print("Step 2/4: Translating...")
+    print("Step 2/6: Translating...")
     try:
-        save_translation_from_cache(article_id)
+        with run_log.stage('article', article_id):
+            save_translation_from_cache(article_id)
         print(f"  Saved: {translation_path}")
     except Exception as e:
         print(f"  Translation failed: {e}")
         return
+    relink_neighbors([article_id])
 
-    # Step 4: Clean up articles (remove quirks like hashtag links, etc.)
-    print("Step 3/5: Cleaning up articles...")
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    subprocess.run([sys.executable, os.path.join(script_dir, "cleanup_articles.py")], check=True)
-    print("  Cleaned up translations")
-
-    # Step 5: Regenerate index
-    print("Step 4/5: Updating index...")
-    subprocess.run([sys.executable, os.path.join(script_dir, "generate_contents.py")], check=True)
-    print("  Updated index.html")
-
-    # Step 6: Regenerate search index
-    print("Step 5/5: Updating search index...")
-    subprocess.run([sys.executable, os.path.join(script_dir, "build_search_index.py")], check=True)
-    print("  Updated search-index.js")
+    # Steps 3-6: clean up articles, add related links, regenerate the index and the search index
+    build_site(step=3, steps=6)
 
     print()
     print("Done! New post added successfully.")
@@ -1119,51 +1172,102 @@ def add_new_post(url_or_id: str, force: bool = False):
     print(f"  Original: {url}")
 
 
+# ============== Command Line ==============
+
+# Commands that fetch, translate or rewrite articles log each stage to cache/runs/
+RUN_LOG_COMMANDS = ("add", "cache", "firecrawl", "translate", "postprocess",
+                    "translate-all", "retry-failed", "postprocess-all")
+
+
+def report_missing_dates():
+    """List cached articles with no publication date in the raw text."""
+    missing = missing_dates(update_date_index())
+    print(f"{len(missing)} cached articles have no date: {missing}")
+
+
+def run_search(args):
+    """Answer the search command's queries from the in-memory index."""
+    import search_query
+    queries = [" ".join(args.query)] if args.query else None
+    search_query.main(queries, args.limit, args.prefix, args.port if args.serve else None)
+
+
+def run_publish():
+    """Write the deployable copy of the site to public/."""
+    import publish
+    publish.main()
+
+
+def build_parser():
+    """Return the argument parser for all translate.py commands."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="translate.py", description="Fetch, translate and publish kexue.fm articles.")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the command; output goes to cache/profiles/ (see profiling.py)")
+    commands = parser.add_subparsers(dest="command", metavar="<command>", required=True)
+
+    def command(name, func, help_text):
+        sub = commands.add_parser(name, help=help_text, description=help_text)
+        sub.set_defaults(func=func)
+        return sub
+
+    add = command("add", lambda args: add_new_post(args.url_or_id, force=args.force),
+                  "Add and translate a new article")
+    add.add_argument("url_or_id", help="e.g. https://kexue.fm/archives/12345 or 12345")
+    add.add_argument("--force", action="store_true", help="Re-fetch and re-translate if it already exists")
+    command("cache", lambda args: run_cache_and_estimate(), "Run caching and estimation")
+    command("firecrawl", lambda args: retry_failed_with_firecrawl(), "Retry failed articles with Firecrawl")
+    command("translate", lambda args: save_translation_from_cache(args.id),
+            "Translate a specific cached article").add_argument("id")
+    command("translate-all", lambda args: translate_all(), "Translate all cached articles")
+    command("retry-failed", lambda args: retry_failed_translations(), "Retry failed translations")
+    command("postprocess", lambda args: postprocess_translation_files(args.ids),
+            "Post-process specific translation(s)").add_argument("ids", nargs="+", metavar="id")
+    command("postprocess-all", lambda args: postprocess_all(), "Re-run postprocessing on all files")
+    command("missing-dates", lambda args: report_missing_dates(), "List cached articles with no date")
+    command("links", lambda args: link_graph.main(), "Update the link graph and list the most cited untranslated articles")
+    command("report", lambda args: run_log.main([args.run] if args.run else []),
+            "Summarize the latest (or given) run log").add_argument("run", nargs="?")
+    command("cleanup", lambda args: cleanup_articles.main(), "Clean up all translation files")
+    command("contents", lambda args: generate_contents.main(), "Regenerate index.html")
+    command("search-index", lambda args: build_search_index.main(), "Regenerate the search index in search/")
+    related = command("related", lambda args: update_related(full=args.full, include_raw=args.raw),
+                      "Add a Related block of similar articles to every translation")
+    related.add_argument("--full", action="store_true", help="Recompute every article, not only changed ones")
+    related.add_argument("--raw", action="store_true", help="Also compare the Chinese text in cache/raw")
+    search = command("search", lambda args: run_search(args),
+                     "Query the search index; prints JSON results, or serves them with --serve")
+    search.add_argument("query", nargs="*", help="Query words; without them, one query per line of stdin")
+    search.add_argument("--limit", type=int, default=10, help="Results per query")
+    search.add_argument("--prefix", action="store_true", help="Match the last word as a prefix, like the page")
+    search.add_argument("--serve", action="store_true", help="Serve GET /search?q=... on localhost")
+    search.add_argument("--port", type=int, default=8765, help="Port for --serve")
+    corpus_db.add_arguments(command(
+        "db", lambda args: corpus_db.run(args.action, " ".join(args.query), args.to, args.limit),
+        "Optional SQLite store of the corpus: import, export, stats or full-text search"))
+    command("assets", lambda args: page_assets.main(),
+            "Point every translation at the shared stylesheet and MathJax config in assets/")
+    command("publish", lambda args: run_publish(),
+            "Write the site to public/ with content-hashed assets and gzip/brotli copies")
+    command("build", lambda args: build_site(),
+            "Clean up articles, add related links, then regenerate index.html and the search index")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # --profile is accepted before or after the command
+    profile = '--profile' in argv
+    argv = [arg for arg in argv if arg != '--profile']
+    args = build_parser().parse_args(argv)
+    if profile:
+        from profiling import start_profile
+        start_profile(f"translate-{args.command}")
+    if args.command in RUN_LOG_COMMANDS:
+        run_log.start_run(args.command, argv[argv.index(args.command) + 1:])
+    args.func(args)
+
+
 if __name__ == "__main__":
-    import sys
-
-    if len(sys.argv) > 1 and sys.argv[1] == "add":
-        # Add a new post
-        if len(sys.argv) < 3:
-            print("Usage: python translate.py add <url_or_id> [--force]")
-            print("Example: python translate.py add https://kexue.fm/archives/12345")
-            print("Example: python translate.py add 12345")
-            sys.exit(1)
-        force = "--force" in sys.argv
-        add_new_post(sys.argv[2], force=force)
-    elif len(sys.argv) > 1 and sys.argv[1] == "cache":
-        # Run caching and estimation
-        run_cache_and_estimate()
-    elif len(sys.argv) > 1 and sys.argv[1] == "firecrawl":
-        # Retry failed articles with Firecrawl
-        retry_failed_with_firecrawl()
-    elif len(sys.argv) > 1 and sys.argv[1] == "translate" and len(sys.argv) > 2:
-        # Translate a specific cached article
-        article_id = sys.argv[2]
-        save_translation_from_cache(article_id)
-    elif len(sys.argv) > 1 and sys.argv[1] == "postprocess" and len(sys.argv) > 2:
-        # Post-process existing translation file(s)
-        for article_id in sys.argv[2:]:
-            postprocess_translation_file(article_id)
-    elif len(sys.argv) > 1 and sys.argv[1] == "translate-all":
-        # Translate all cached articles
-        translate_all()
-    elif len(sys.argv) > 1 and sys.argv[1] == "retry-failed":
-        # Retry failed translations
-        retry_failed_translations()
-    elif len(sys.argv) > 1 and sys.argv[1] == "postprocess-all":
-        # Re-run postprocessing on all files
-        postprocess_all()
-    else:
-        print("Usage: python translate.py <command> [args]")
-        print()
-        print("Commands:")
-        print("  add <url_or_id> [--force]  Add and translate a new article")
-        print("  cache                      Run caching and estimation")
-        print("  firecrawl                  Retry failed articles with Firecrawl")
-        print("  translate <id>             Translate a specific cached article")
-        print("  translate-all              Translate all cached articles")
-        print("  retry-failed               Retry failed translations")
-        print("  postprocess <id>...        Post-process specific translation(s)")
-        print("  postprocess-all            Re-run postprocessing on all files")
-        sys.exit(1)
+    main()